@@ -1,13 +1,27 @@
+import os
 import sys
 import argparse
-from typing import List
+from contextlib import nullcontext, redirect_stdout
+from typing import List, Optional
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 from src.services.coleta_service import ColetaService
 from src.services.consulta_service import ConsultaService
+from src.services.consulta_sqlite import ConsultaSqliteService
+from src.services.coleta_incremental import ColetaIncremental
+from src.services.reprocessamento_service import ReprocessamentoService
+from src.services.retentativas import PoliticaRetentativa
 from src.scrapers.jupiter_scraper import JupiterScraper
+from src.scrapers.jupiter_http_scraper import JupiterHttpScraper
+from src.scrapers.limitador import LimitadorRequisicoes
 from src.parsers.jupiter_parser import JupiterParser
 from src.ui.menu import Menu
 from src.models.unidade import Unidade
+from src.interfaces.scraper import WebScraper
+from src.persistencia.snapshot import SnapshotStore
+from src.persistencia.cache_html import CacheHtml
+from src.persistencia.checkpoint import JornalCheckpoint
+from src.persistencia.exportacao_colunar import ExportadorColunar
+from src.persistencia.exportacao_ndjson import ExportadorNdjson
 
 def parse_argumentos() -> argparse.Namespace:
     """
@@ -22,26 +36,224 @@ def parse_argumentos() -> argparse.Namespace:
     parser.add_argument(
         'quantidade_unidades',
         type=int,
-        help='Número de unidades a serem coletadas'
+        nargs='?',
+        help='Número de unidades a serem coletadas (dispensável com --from-snapshot e --from-banco)'
     )
     parser.add_argument(
         '--headless',
         action='store_true',
         help='Executa o navegador em modo headless (sem interface gráfica)'
     )
-    return parser.parse_args()
+    parser.add_argument(
+        '--scraper',
+        choices=['selenium', 'http'],
+        default='selenium',
+        help='Implementação de coleta: navegador (selenium) ou requisições diretas (http)'
+    )
+    parser.add_argument(
+        '--perfil-enxuto',
+        action='store_true',
+        help='Inicia o Chrome sem imagens, fontes e plugins (o CSS continua liberado), sem extensões/GPU e com carregamento "eager"'
+    )
+    parser.add_argument(
+        '--cache-navegador',
+        metavar='DIR',
+        help='Diretório base do cache em disco dos navegadores (um subdiretório por navegador)'
+    )
+    parser.add_argument(
+        '--parser',
+        choices=['auto', *JupiterParser.BACKENDS],
+        default='auto',
+        help='Backend de análise do HTML (padrão: o mais rápido instalado)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Número de scrapers coletando cursos em paralelo (padrão: 1)'
+    )
+    parser.add_argument(
+        '--max-paginas-navegador',
+        type=int,
+        default=500,
+        metavar='N',
+        help='Recicla o navegador de um worker após N carregamentos de página (padrão: 500)'
+    )
+    parser.add_argument(
+        '--max-memoria-navegador',
+        type=int,
+        default=None,
+        metavar='MB',
+        help='Recicla o navegador de um worker que ultrapassar essa memória, em MB (requer psutil)'
+    )
+    parser.add_argument(
+        '--taxa-requisicoes',
+        type=float,
+        default=4.0,
+        metavar='R',
+        help='Máximo de requisições por segundo ao Jupiter, somando todos os workers; 0 desativa o limitador (padrão: 4)'
+    )
+    parser.add_argument(
+        '--latencia-alvo',
+        type=float,
+        default=5.0,
+        metavar='S',
+        help='Latência em segundos acima da qual a concorrência é reduzida (padrão: 5)'
+    )
+    parser.add_argument(
+        '--snapshot',
+        metavar='PATH',
+        help='Grava os dados coletados num arquivo de snapshot'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Reaproveita do --snapshot existente os cursos cuja grade não mudou'
+    )
+    parser.add_argument(
+        '--cache-html',
+        metavar='DIR',
+        help='Guarda o HTML bruto de cada grade coletada neste diretório'
+    )
+    parser.add_argument(
+        '--tentativas',
+        type=int,
+        default=3,
+        metavar='N',
+        help='Tentativas por curso antes de desistir, com espera crescente entre elas (padrão: 3)'
+    )
+    parser.add_argument(
+        '--relatorio-falhas',
+        metavar='PATH',
+        help='Grava em JSON os cursos que não puderam ser coletados'
+    )
+    parser.add_argument(
+        '--exportar-ndjson',
+        metavar='PATH',
+        help='Escreve cada curso em NDJSON assim que é coletado; "-" usa a saída padrão e dispensa o menu'
+    )
+    parser.add_argument(
+        '--exportar-colunar',
+        metavar='DIR',
+        help='Grava disciplinas, cursos e a relação entre eles como tabelas colunares (requer pyarrow)'
+    )
+    parser.add_argument(
+        '--formato-colunar',
+        choices=list(ExportadorColunar.FORMATOS),
+        default='parquet',
+        help='Formato do --exportar-colunar: parquet ou arrow (Arrow IPC) (padrão: parquet)'
+    )
+    parser.add_argument(
+        '--checkpoint',
+        metavar='PATH',
+        help='Grava cada curso concluído num diário, permitindo retomar a coleta com --resume'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Retoma a coleta do --checkpoint, coletando apenas os cursos que faltam'
+    )
+    parser.add_argument(
+        '--reparse-cache',
+        metavar='DIR',
+        help='Reconstrói os dados a partir do HTML guardado com --cache-html, sem navegador'
+    )
+    parser.add_argument(
+        '--processos',
+        type=int,
+        default=None,
+        help='Processos de análise usados pelo --reparse-cache e pelo --pipeline (padrão ou 0: número de CPUs)'
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Separa a busca das páginas da análise, feita em paralelo por --processos processos'
+    )
+    parser.add_argument(
+        '--capacidade-fila',
+        type=int,
+        default=32,
+        metavar='N',
+        help='Páginas que podem aguardar análise no --pipeline antes de a busca pausar (padrão: 32)'
+    )
+    parser.add_argument(
+        '--from-snapshot',
+        metavar='PATH',
+        help='Carrega os dados de um snapshot em vez de coletar do Jupiter'
+    )
+    parser.add_argument(
+        '--banco-consulta',
+        metavar='PATH',
+        help='Grava os dados num banco SQLite indexado e responde às consultas por SQL'
+    )
+    parser.add_argument(
+        '--from-banco',
+        metavar='PATH',
+        help='Abre um banco SQLite gravado com --banco-consulta, sem carregar os dados na memória'
+    )
+    args = parser.parse_args()
+    if args.processos is not None and args.processos < 0:
+        parser.error('--processos não pode ser negativo')
+    return args
+
+def criar_limitador(args: argparse.Namespace) -> Optional[LimitadorRequisicoes]:
+    """
+    Cria o limitador de requisições compartilhado por todos os scrapers.
+    
+    Args:
+        args: Argumentos da linha de comando (--taxa-requisicoes, --latencia-alvo, --workers)
+        
+    Returns:
+        Limitador configurado, ou None se --taxa-requisicoes for 0
+    """
+    if args.taxa_requisicoes <= 0:
+        return None
+    return LimitadorRequisicoes(
+        taxa=args.taxa_requisicoes,
+        concorrencia_maxima=args.workers,
+        latencia_alvo=args.latencia_alvo
+    )
+
+def criar_scraper(
+    args: argparse.Namespace,
+    limitador: Optional[LimitadorRequisicoes] = None
+) -> WebScraper:
+    """
+    Cria o scraper escolhido na linha de comando.
+    
+    Args:
+        args: Argumentos da linha de comando (--scraper, --headless, --perfil-enxuto, --cache-navegador)
+        limitador: Limitador de requisições compartilhado (opcional)
+        
+    Returns:
+        Instância de WebScraper pronta para uso
+    """
+    if args.scraper == 'http':
+        return JupiterHttpScraper(limitador=limitador)
+    return JupiterScraper(
+        headless=args.headless,
+        perfil_enxuto=args.perfil_enxuto,
+        diretorio_cache=args.cache_navegador,
+        limitador=limitador
+    )
 
-def coletar_dados(quantidade: int, headless: bool = True) -> List[Unidade]:
+def coletar_dados(
+    args: argparse.Namespace,
+    incremental: Optional[ColetaIncremental] = None,
+    exportador: Optional[ExportadorNdjson] = None
+) -> List[Unidade]:
     """
     Realiza a coleta dos dados do Jupiter.
     
     Args:
-        quantidade: Número de unidades a serem coletadas
-        headless: Se True, executa o navegador em modo headless
+        args: Argumentos da linha de comando que configuram a coleta
+        incremental: Estado da coleta incremental (opcional)
+        exportador: Exportação NDJSON dos cursos durante a coleta (opcional)
         
     Returns:
         Lista de unidades coletadas com seus cursos
     """
+    quantidade = args.quantidade_unidades
     print("\n🚀 Iniciando coleta de dados...\n")
     try:
         with Progress(
@@ -52,11 +264,45 @@ def coletar_dados(quantidade: int, headless: bool = True) -> List[Unidade]:
         ) as progress:
             task = progress.add_task("Coletando unidades do Jupiter Web", total=quantidade)
 
-            with JupiterScraper(headless=headless) as scraper:
-                parser = JupiterParser()
-                coleta_service = ColetaService(scraper, parser)
+            limitador = criar_limitador(args)
+            with criar_scraper(args, limitador) as scraper:
+                parser = JupiterParser(args.parser)
+                coleta_service = ColetaService(
+                    scraper,
+                    parser,
+                    scraper_factory=lambda: criar_scraper(args, limitador),
+                    workers=args.workers,
+                    incremental=incremental,
+                    cache_html=CacheHtml(args.cache_html) if args.cache_html else None,
+                    max_paginas_scraper=args.max_paginas_navegador,
+                    max_memoria_scraper=args.max_memoria_navegador * 2**20 if args.max_memoria_navegador else None,
+                    checkpoint=JornalCheckpoint(args.checkpoint) if args.checkpoint else None,
+                    retomar=args.resume,
+                    retentativas=PoliticaRetentativa(args.tentativas),
+                    processos_analise=(args.processos or os.cpu_count() or 1) if args.pipeline else 0,
+                    capacidade_fila=args.capacidade_fila,
+                    exportador=exportador
+                )
                 unidades = coleta_service.coletar_dados(quantidade, progress=progress, task_id=task)
+                memoria = scraper.memoria_navegador()
 
+        if limitador:
+            resumo = limitador.resumo()
+            print(
+                f"🚦 Limitador: {resumo['requisicoes']} requisições, {resumo['tempo_espera']:.1f}s de espera, "
+                f"{resumo['reducoes']} reduções, {resumo['bloqueios']} bloqueios "
+                f"(concorrência final {resumo['limite']:.1f}, {resumo['taxa']:.1f} req/s)"
+            )
+        relatorio = coleta_service.relatorio_falhas
+        if relatorio.recuperados or relatorio.falhas:
+            print(f"🔁 Retentativas: {relatorio}")
+            for falha in relatorio.falhas:
+                print(f"   ✗ {falha.nome_unidade} / {falha.nome_curso}: {falha.tipo_erro} após {falha.tentativas} tentativas")
+        if args.relatorio_falhas:
+            relatorio.salvar(args.relatorio_falhas)
+            print(f"📝 Relatório de falhas gravado em {args.relatorio_falhas}")
+
+        exibir_estatisticas(coleta_service, parser, memoria)
         print(f"✅ Coleta finalizada: {len(unidades)} unidades coletadas.\n")
         return unidades
 
@@ -64,23 +310,143 @@ def coletar_dados(quantidade: int, headless: bool = True) -> List[Unidade]:
         print(f"❌ Erro durante a coleta: {e}")
         raise
 
+def exibir_estatisticas(
+    coleta_service: ColetaService,
+    parser: JupiterParser,
+    memoria: Optional[int] = None
+) -> None:
+    """
+    Exibe as medições de desempenho da última coleta.
+    
+    Args:
+        coleta_service: Serviço que realizou a coleta
+        parser: Parser usado na coleta
+        memoria: Memória residente do navegador ao final da coleta, em bytes (opcional)
+    """
+    print(
+        f"📈 {coleta_service.carregamentos_pagina} carregamentos de página para "
+        f"{coleta_service.cursos_visitados} cursos "
+        f"({coleta_service.carregamentos_por_curso():.2f} por curso, "
+        f"{coleta_service.latencia_media_curso():.2f}s por curso)"
+    )
+    if coleta_service.metricas_etapas:
+        print(f"📦 {coleta_service.bytes_recebidos / 1024:.0f} KiB de HTML recebidos")
+        duracao = coleta_service.duracao_pipeline
+        for etapa, metricas in coleta_service.metricas_etapas.items():
+            print(
+                f"🏭 Etapa {etapa}: {metricas.itens} itens, {metricas.vazao(duracao):.2f} por segundo, "
+                f"{metricas.tempo_ocupado:.2f}s ocupada, {metricas.tempo_bloqueado:.2f}s bloqueada pela fila"
+            )
+    else:
+        print(
+            f"📦 {coleta_service.bytes_recebidos / 1024:.0f} KiB de HTML recebidos; "
+            f"{parser.paginas_processadas} páginas analisadas em {parser.tempo_parse:.2f}s"
+        )
+    if memoria is not None:
+        print(f"🧮 Memória do navegador (RSS, com subprocessos): {memoria / 2**20:.0f} MiB")
+    classificadas = ", ".join(f"{quantidade} {tipo}" for tipo, quantidade in coleta_service.paginas_por_tipo.items())
+    print(f"🔎 Páginas recebidas: {classificadas}")
+    if coleta_service.cursos_retomados:
+        print(f"⏩ {coleta_service.cursos_retomados} cursos retomados do checkpoint")
+    if coleta_service.scrapers_reciclados:
+        print(f"♻️ {coleta_service.scrapers_reciclados} navegadores reciclados pelo pool de workers")
+    for etapa, (quantidade, tempo) in sorted(coleta_service.esperas.items()):
+        print(f"⏱️ Espera em {etapa}: {tempo:.2f}s em {quantidade} vezes ({tempo / quantidade:.3f}s cada)")
+    print()
+
 def main() -> None:
     """Função principal do programa."""
     try:
         args = parse_argumentos()
 
-        if args.quantidade_unidades < 1:
-            print("Quantidade de unidades deve ser maior que zero")
-            sys.exit(1)
+        if args.from_banco:
+            if not os.path.exists(args.from_banco):
+                print(f"Banco de consultas não encontrado: {args.from_banco}")
+                sys.exit(1)
+            unidades = None
+            print(f"🗄️ Banco de consultas aberto: {args.from_banco}\n")
+        elif args.from_snapshot:
+            unidades = SnapshotStore(args.from_snapshot).carregar()
+            print(f"📂 Snapshot carregado: {len(unidades)} unidades.\n")
+        elif args.reparse_cache:
+            reprocessamento = ReprocessamentoService(
+                CacheHtml(args.reparse_cache),
+                JupiterParser(args.parser),
+                args.processos
+            )
+            unidades = reprocessamento.reprocessar()
+            print(f"♻️ Cache reprocessado: {len(unidades)} unidades.\n")
+
+            if args.snapshot and unidades:
+                SnapshotStore(args.snapshot).salvar(unidades)
+                print(f"💾 Snapshot gravado em {args.snapshot}\n")
+        else:
+            if args.quantidade_unidades is None or args.quantidade_unidades < 1:
+                print("Quantidade de unidades deve ser maior que zero")
+                sys.exit(1)
+
+            if args.workers < 1:
+                print("Número de workers deve ser maior que zero")
+                sys.exit(1)
+
+            if args.incremental and not args.snapshot:
+                print("O modo --incremental exige --snapshot")
+                sys.exit(1)
+
+            if args.resume and not args.checkpoint:
+                print("O modo --resume exige --checkpoint")
+                sys.exit(1)
 
-        unidades = coletar_dados(args.quantidade_unidades, args.headless)
+            exportador = None
+            mensagens = nullcontext()
+            if args.exportar_ndjson:
+                exportador = ExportadorNdjson(args.exportar_ndjson)
+                if args.exportar_ndjson == ExportadorNdjson.SAIDA_PADRAO:
+                    # Os registros ocupam a saída padrão; as mensagens vão para a saída de erro
+                    mensagens = redirect_stdout(sys.stderr)
 
-        if not unidades:
+            with exportador or nullcontext(), mensagens:
+                incremental = None
+                if args.incremental:
+                    store = SnapshotStore(args.snapshot)
+                    if store.existe():
+                        incremental = ColetaIncremental(store.carregar(), store.carregar_hashes())
+                    else:
+                        incremental = ColetaIncremental()
+
+                unidades = coletar_dados(args, incremental, exportador)
+
+                if incremental:
+                    print(f"🔄 Coleta incremental: {incremental.relatorio}\n")
+                    # Numa coleta parcial, as unidades não coletadas continuam no snapshot
+                    unidades = incremental.mesclar_anteriores(unidades)
+
+                if args.snapshot and unidades:
+                    hashes = incremental.hashes if incremental else None
+                    SnapshotStore(args.snapshot).salvar(unidades, hashes)
+                    print(f"💾 Snapshot gravado em {args.snapshot}\n")
+
+        if not unidades and not args.from_banco:
             print("Nenhuma unidade foi coletada")
             sys.exit(1)
 
+        if args.exportar_colunar and unidades:
+            caminhos = ExportadorColunar(args.exportar_colunar, args.formato_colunar).exportar(unidades)
+            print(f"📊 Tabelas colunares gravadas: {', '.join(caminhos.values())}\n", file=sys.stderr)
+
+        if args.exportar_ndjson == ExportadorNdjson.SAIDA_PADRAO:
+            # A saída padrão está sendo consumida por outro programa
+            return
+
         print("🧠 Iniciando sistema de consultas...\n")
-        consulta_service = ConsultaService(unidades)
+        if args.from_banco:
+            consulta_service = ConsultaSqliteService(args.from_banco)
+        elif args.banco_consulta:
+            consulta_service = ConsultaSqliteService(args.banco_consulta)
+            consulta_service.carregar(unidades)
+            print(f"🗄️ Banco de consultas gravado em {args.banco_consulta}\n")
+        else:
+            consulta_service = ConsultaService(unidades)
         menu = Menu(consulta_service)
 
         menu.executar()
@@ -0,0 +1,79 @@
+"""
+Mede os carregamentos de página por curso com e sem o retorno no lugar.
+
+Coleta as mesmas unidades duas vezes: uma com o voltar_para_cursos padrão
+de WebScraper (recarrega a página inicial e seleciona a unidade a cada
+curso) e outra com o retorno no lugar do scraper escolhido, e mostra os
+carregamentos de página e a latência média por curso de cada execução.
+
+Uso:
+    python scripts/benchmark_carregamentos.py --unidades 2 --scraper selenium
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.interfaces.scraper import WebScraper
+from src.parsers.jupiter_parser import JupiterParser
+from src.scrapers.jupiter_http_scraper import JupiterHttpScraper
+from src.scrapers.jupiter_scraper import JupiterScraper
+from src.services.coleta_service import ColetaService
+
+def criar_scraper(tipo: str) -> WebScraper:
+    """
+    Cria o scraper a medir.
+
+    Args:
+        tipo: "selenium" ou "http"
+
+    Returns:
+        Scraper pronto para uso
+    """
+    if tipo == "http":
+        return JupiterHttpScraper()
+    return JupiterScraper(headless=True)
+
+def medir(tipo: str, unidades: int, recarregar: bool) -> dict:
+    """
+    Executa uma coleta sequencial e devolve suas medições.
+
+    Args:
+        tipo: "selenium" ou "http"
+        unidades: Quantidade de unidades a coletar
+        recarregar: Se True, usa o voltar_para_cursos padrão de WebScraper
+
+    Returns:
+        Dicionário com cursos, carregamentos, carregamentos por curso e segundos por curso
+    """
+    with criar_scraper(tipo) as scraper:
+        if recarregar:
+            scraper.voltar_para_cursos = WebScraper.voltar_para_cursos.__get__(scraper)
+        coleta = ColetaService(scraper, JupiterParser())
+        inicio = time.perf_counter()
+        coleta.coletar_dados(unidades)
+        duracao = time.perf_counter() - inicio
+    return {
+        "cursos": coleta.cursos_visitados,
+        "carregamentos": coleta.carregamentos_pagina,
+        "por_curso": coleta.carregamentos_por_curso(),
+        "segundos_por_curso": duracao / max(1, coleta.cursos_visitados),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--unidades", type=int, default=2, help="Unidades coletadas em cada execução")
+    parser.add_argument("--scraper", choices=["selenium", "http"], default="selenium")
+    args = parser.parse_args()
+
+    for rotulo, recarregar in (("antes (recarrega a página)", True), ("depois (retorno no lugar)", False)):
+        resultado = medir(args.scraper, args.unidades, recarregar)
+        print(
+            f"{rotulo}: {resultado['carregamentos']} carregamentos para {resultado['cursos']} cursos "
+            f"({resultado['por_curso']:.2f} por curso, {resultado['segundos_por_curso']:.2f}s por curso)"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Compara as consultas por faixa numérica com índice ordenado e com varredura.
+
+Gera um conjunto sintético (por padrão, 100 mil ocorrências de disciplinas)
+e mede listar_disciplinas_por_creditos e listar_maiores_disciplinas do
+ConsultaService, que usam o IndiceNumerico, contra a varredura de todas
+as unidades, cursos e disciplinas feita antes do índice. Os resultados
+das duas formas são comparados antes da medição.
+
+Uso:
+    python scripts/benchmark_indice_numerico.py --disciplinas 100000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.dados_sinteticos import gerar_unidades
+from src.models.unidade import Unidade
+from src.services.consulta_service import ConsultaService
+
+def varrer_por_creditos(unidades: List[Unidade], min_creditos: int) -> List[tuple]:
+    """Implementação anterior de listar_disciplinas_por_creditos."""
+    return [
+        (disciplina, curso, unidade)
+        for unidade in unidades
+        for curso in unidade.cursos
+        for disciplina in curso.todas_disciplinas
+        if disciplina.creditos_totais >= min_creditos
+    ]
+
+def varrer_maiores(unidades: List[Unidade], campo: str, quantidade: int) -> List[tuple]:
+    """Ordena todas as ocorrências para obter as maiores (sem índice)."""
+    ocorrencias = varrer_por_creditos(unidades, 0)
+    return sorted(ocorrencias, key=lambda ocorrencia: getattr(ocorrencia[0], campo), reverse=True)[:quantidade]
+
+def cronometrar(funcao: Callable[[], object], repeticoes: int) -> float:
+    """
+    Executa a função repetidas vezes.
+
+    Returns:
+        Milissegundos por execução
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) * 1000 / repeticoes
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--disciplinas", type=int, default=100_000, help="Ocorrências de disciplinas geradas")
+    parser.add_argument("--repeticoes", type=int, default=20)
+    args = parser.parse_args()
+
+    unidades = gerar_unidades(args.disciplinas)
+    inicio = time.perf_counter()
+    consulta = ConsultaService(unidades)
+    construcao = (time.perf_counter() - inicio) * 1000
+    inicio = time.perf_counter()
+    consulta.listar_disciplinas_por_creditos(0)
+    ordenacao = (time.perf_counter() - inicio) * 1000
+    print(f"Índices do ConsultaService: {construcao:.0f} ms; ordenação de creditos_totais: {ordenacao:.0f} ms")
+
+    for min_creditos in (8, 5):
+        indexado = consulta.listar_disciplinas_por_creditos(min_creditos)
+        assert indexado == varrer_por_creditos(unidades, min_creditos)
+        antes = cronometrar(lambda: varrer_por_creditos(unidades, min_creditos), args.repeticoes)
+        depois = cronometrar(lambda: consulta.listar_disciplinas_por_creditos(min_creditos), args.repeticoes)
+        print(f"creditos >= {min_creditos} ({len(indexado)} ocorrências): varredura {antes:.1f} ms, índice {depois:.1f} ms")
+
+    maiores = consulta.listar_maiores_disciplinas("carga_horaria", 10)
+    assert [o[0].carga_horaria for o in maiores] == [o[0].carga_horaria for o in varrer_maiores(unidades, "carga_horaria", 10)]
+    antes = cronometrar(lambda: varrer_maiores(unidades, "carga_horaria", 10), max(1, args.repeticoes // 4))
+    depois = cronometrar(lambda: consulta.listar_maiores_disciplinas("carga_horaria", 10), args.repeticoes * 100)
+    print(f"10 maiores carga_horaria: ordenação completa {antes:.1f} ms, índice {depois * 1000:.1f} us")
+
+if __name__ == "__main__":
+    main()
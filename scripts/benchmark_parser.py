@@ -0,0 +1,78 @@
+"""
+Mede a vazão (páginas por segundo) de cada backend do JupiterParser.
+
+Analisa repetidamente as páginas de um diretório (por padrão, as páginas
+salvas em tests/fixtures/paginas; um diretório do --cache-html também
+serve) com cada backend instalado e mostra as páginas por segundo.
+
+Uso:
+    python scripts/benchmark_parser.py --repeticoes 200
+    python scripts/benchmark_parser.py --paginas cache_html --repeticoes 5
+"""
+import argparse
+import gzip
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from src.models.registro_disciplinas import RegistroDisciplinas
+from src.parsers.jupiter_parser import JupiterParser
+
+def carregar_paginas(diretorio: Path) -> List[str]:
+    """
+    Lê as páginas HTML (simples ou comprimidas com gzip) de um diretório.
+
+    Args:
+        diretorio: Diretório percorrido recursivamente
+
+    Returns:
+        Conteúdo de cada página
+    """
+    paginas = []
+    for caminho in sorted(diretorio.rglob("*")):
+        if caminho.name.endswith(".html"):
+            paginas.append(caminho.read_text(encoding="utf-8"))
+        elif caminho.name.endswith(".gz"):
+            with gzip.open(caminho, "rt", encoding="utf-8") as arquivo:
+                paginas.append(arquivo.read())
+    return paginas
+
+def medir(backend: str, paginas: List[str], repeticoes: int) -> float:
+    """
+    Analisa as páginas repetidas vezes com um backend.
+
+    Args:
+        backend: Backend do JupiterParser
+        paginas: Conteúdo das páginas
+        repeticoes: Quantidade de passadas por todas as páginas
+
+    Returns:
+        Páginas analisadas por segundo
+    """
+    parser = JupiterParser(backend, RegistroDisciplinas())
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        for html in paginas:
+            parser.extrair_grade(html)
+    return len(paginas) * repeticoes / (time.perf_counter() - inicio)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--paginas", type=Path, default=RAIZ / "tests" / "fixtures" / "paginas")
+    parser.add_argument("--repeticoes", type=int, default=100)
+    args = parser.parse_args()
+
+    paginas = carregar_paginas(args.paginas)
+    if not paginas:
+        sys.exit(f"Nenhuma página .html ou .gz em {args.paginas}")
+
+    print(f"{len(paginas)} páginas, {args.repeticoes} repetições")
+    for backend in JupiterParser.backends_disponiveis():
+        print(f"  {backend:12s} {medir(backend, paginas, args.repeticoes):9.0f} páginas/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compara a latência por curso e a memória do Chrome com e sem o perfil enxuto.
+
+Coleta as mesmas unidades com o JupiterScraper duas vezes, com o perfil
+padrão e com --perfil-enxuto, e mostra para cada execução o tempo médio
+por curso e a memória residente (RSS) do navegador e de seus processos
+filhos ao final da coleta. A medição de memória requer o psutil.
+
+Uso:
+    python scripts/benchmark_perfil.py --unidades 2 [--cache-navegador DIR]
+"""
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.parsers.jupiter_parser import JupiterParser
+from src.scrapers.jupiter_scraper import JupiterScraper
+from src.services.coleta_service import ColetaService
+
+def medir(unidades: int, perfil_enxuto: bool, diretorio_cache: Optional[str]) -> dict:
+    """
+    Executa uma coleta sequencial e devolve suas medições.
+
+    Args:
+        unidades: Quantidade de unidades a coletar
+        perfil_enxuto: Se o navegador usa o perfil enxuto
+        diretorio_cache: Diretório base do cache em disco (opcional)
+
+    Returns:
+        Dicionário com cursos, segundos por curso e memória do navegador em bytes (ou None)
+    """
+    with JupiterScraper(headless=True, perfil_enxuto=perfil_enxuto, diretorio_cache=diretorio_cache) as scraper:
+        coleta = ColetaService(scraper, JupiterParser())
+        coleta.coletar_dados(unidades)
+        memoria = scraper.memoria_navegador()
+    return {
+        "cursos": coleta.cursos_visitados,
+        "segundos_por_curso": coleta.latencia_media_curso(),
+        "memoria": memoria,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--unidades", type=int, default=2, help="Unidades coletadas em cada execução")
+    parser.add_argument("--cache-navegador", metavar="DIR", help="Diretório base do cache em disco")
+    args = parser.parse_args()
+
+    for rotulo, perfil_enxuto in (("perfil padrão", False), ("perfil enxuto", True)):
+        resultado = medir(args.unidades, perfil_enxuto, args.cache_navegador)
+        memoria = (
+            f"{resultado['memoria'] / 2**20:.0f} MiB" if resultado["memoria"] is not None
+            else "memória indisponível (instale o psutil)"
+        )
+        print(f"{rotulo}: {resultado['cursos']} cursos, {resultado['segundos_por_curso']:.2f}s por curso, {memoria}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Mede o efeito de recortar a grade antes da análise.
+
+Para as páginas de um diretório (por padrão, tests/fixtures/paginas;
+ou um diretório de páginas completas salvas), compara o tamanho da página
+completa com o do recorte (spans de duração e #gradeCurricular), que é o
+que o JupiterScraper devolve, e o tempo de análise de cada backend com e
+sem o recorte.
+
+Uso:
+    python scripts/benchmark_recorte.py --repeticoes 200
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from scripts.benchmark_parser import carregar_paginas
+from src.models.registro_disciplinas import RegistroDisciplinas
+from src.parsers.jupiter_parser import JupiterParser
+
+class ParserSemRecorte(JupiterParser):
+    """JupiterParser que analisa a página inteira, como antes do recorte."""
+
+    @classmethod
+    def recortar_grade(cls, html: str) -> str:
+        return html
+
+def medir(parser: JupiterParser, paginas: List[str], repeticoes: int) -> float:
+    """
+    Analisa as páginas repetidas vezes.
+
+    Args:
+        parser: Parser a medir
+        paginas: Conteúdo das páginas
+        repeticoes: Quantidade de passadas por todas as páginas
+
+    Returns:
+        Milissegundos por página
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        for html in paginas:
+            parser.extrair_grade(html)
+    return (time.perf_counter() - inicio) * 1000 / (len(paginas) * repeticoes)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--paginas", type=Path, default=RAIZ / "tests" / "fixtures" / "paginas")
+    parser.add_argument("--repeticoes", type=int, default=100)
+    args = parser.parse_args()
+
+    paginas = carregar_paginas(args.paginas)
+    if not paginas:
+        sys.exit(f"Nenhuma página .html ou .gz em {args.paginas}")
+
+    completo = sum(len(html.encode("utf-8")) for html in paginas)
+    recortado = sum(len(JupiterParser.recortar_grade(html).encode("utf-8")) for html in paginas)
+    print(
+        f"{len(paginas)} páginas: {completo / len(paginas):.0f} bytes por página completa, "
+        f"{recortado / len(paginas):.0f} bytes recortada ({recortado / completo:.0%})"
+    )
+    for backend in JupiterParser.backends_disponiveis():
+        antes = medir(ParserSemRecorte(backend, RegistroDisciplinas()), paginas, args.repeticoes)
+        depois = medir(JupiterParser(backend, RegistroDisciplinas()), paginas, args.repeticoes)
+        print(f"  {backend:12s} {antes:7.3f} ms/página sem recorte, {depois:7.3f} ms/página com recorte")
+
+if __name__ == "__main__":
+    main()
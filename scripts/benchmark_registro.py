@@ -0,0 +1,63 @@
+"""
+Mede a memória do grafo de unidades com e sem o registro de disciplinas.
+
+Gera o mesmo conjunto sintético duas vezes: com um objeto Disciplina (e
+strings próprias) por ocorrência, como o parser produzia antes do
+registro, e com as instâncias canônicas de um RegistroDisciplinas. A
+memória alocada por cada geração é medida com o tracemalloc.
+
+Uso:
+    python scripts/benchmark_registro.py --disciplinas 100000 --catalogo 20000
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.dados_sinteticos import gerar_unidades
+from src.models.registro_disciplinas import RegistroDisciplinas
+
+def medir_memoria(gerar: Callable[[], object]) -> Tuple[object, int]:
+    """
+    Executa a geração e mede a memória que continua alocada ao final.
+
+    Returns:
+        Tupla (objeto gerado, bytes alocados)
+    """
+    gc.collect()
+    tracemalloc.start()
+    resultado = gerar()
+    gc.collect()
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, atual
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--disciplinas", type=int, default=100_000, help="Ocorrências de disciplinas geradas")
+    parser.add_argument("--catalogo", type=int, default=20_000, help="Disciplinas distintas")
+    args = parser.parse_args()
+
+    unidades, sem_registro = medir_memoria(lambda: gerar_unidades(args.disciplinas, catalogo=args.catalogo))
+    ocorrencias = sum(len(curso.todas_disciplinas) for unidade in unidades for curso in unidade.cursos)
+    del unidades
+
+    registro = RegistroDisciplinas()
+    (unidades, registro), com_registro = medir_memoria(
+        lambda: (gerar_unidades(args.disciplinas, catalogo=args.catalogo, registro=registro), registro)
+    )
+    instancias = len({id(d) for unidade in unidades for curso in unidade.cursos for d in curso.todas_disciplinas})
+
+    print(f"{ocorrencias} ocorrências de disciplinas")
+    print(f"  sem registro: {sem_registro / 2**20:6.1f} MiB, {ocorrencias} objetos Disciplina")
+    print(
+        f"  com registro: {com_registro / 2**20:6.1f} MiB, {instancias} objetos Disciplina "
+        f"({com_registro / sem_registro:.0%}, incluindo o próprio registro)"
+    )
+
+if __name__ == "__main__":
+    main()
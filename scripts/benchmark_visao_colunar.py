@@ -0,0 +1,80 @@
+"""
+Compara as análises da VisaoColunar (NumPy) com as do ConsultaService.
+
+Gera um conjunto sintético e, para cada análise, confere que a visão
+colunar devolve o mesmo resultado que o ConsultaService e mede as duas.
+O ConsultaService responde às análises de curso e de unidade com totais
+pré-calculados, então a comparação relevante é com a varredura dos
+objetos, que é o que análises novas (filtros, histogramas, somas por
+qualquer métrica) fariam sem a visão.
+
+Uso:
+    python scripts/benchmark_visao_colunar.py --disciplinas 100000
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.dados_sinteticos import gerar_unidades
+from src.services.consulta_service import ConsultaService
+
+def cronometrar(funcao: Callable[[], object], repeticoes: int) -> float:
+    """
+    Executa a função repetidas vezes.
+
+    Returns:
+        Milissegundos por execução
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) * 1000 / repeticoes
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--disciplinas", type=int, default=100_000, help="Ocorrências de disciplinas geradas")
+    parser.add_argument("--repeticoes", type=int, default=10)
+    args = parser.parse_args()
+
+    unidades = gerar_unidades(args.disciplinas)
+    consulta = ConsultaService(unidades)
+    inicio = time.perf_counter()
+    visao = consulta.visao_colunar()
+    print(f"{len(visao)} linhas; construção da visão: {(time.perf_counter() - inicio) * 1000:.0f} ms")
+
+    def ocorrencias():
+        return (disciplina for unidade in unidades for curso in unidade.cursos for disciplina in curso.todas_disciplinas)
+
+    def ch_por_unidade_objetos():
+        return [sum(d.carga_horaria for c in unidade.cursos for d in c.todas_disciplinas) for unidade in unidades]
+
+    def histograma_objetos():
+        return dict(sorted(Counter(d.creditos_totais for d in ocorrencias()).items()))
+
+    comparacoes = [
+        ("soma de carga_horaria por unidade",
+         ch_por_unidade_objetos, lambda: visao.somar_por_unidade("carga_horaria").tolist()),
+        ("histograma de creditos_totais",
+         histograma_objetos, lambda: visao.histograma("creditos_totais")),
+        ("carga_estagio entre 60 e 120",
+         lambda: [d for d in ocorrencias() if 60 <= d.carga_estagio <= 120],
+         lambda: [o[0] for o in visao.ocorrencias_em(visao.filtrar("carga_estagio", 60, 120))]),
+        ("disciplinas com creditos >= 8",
+         lambda: consulta.listar_disciplinas_por_creditos(8), lambda: visao.listar_disciplinas_por_creditos(8)),
+        ("analisar_unidade de todas as unidades",
+         lambda: [consulta.analisar_unidade(u.nome) for u in unidades],
+         lambda: [visao.analisar_unidade(u) for u in unidades]),
+    ]
+    for rotulo, objetos, colunar in comparacoes:
+        assert objetos() == colunar(), rotulo
+        antes = cronometrar(objetos, args.repeticoes)
+        depois = cronometrar(colunar, args.repeticoes)
+        print(f"  {rotulo:40s} objetos {antes:8.2f} ms, colunar {depois:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Gera unidades sintéticas, com o formato das coletadas, para os benchmarks.
+"""
+import random
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.curso import Curso
+from src.models.disciplina import Disciplina
+from src.models.duracao_curso import DuracaoCurso
+from src.models.registro_disciplinas import RegistroDisciplinas
+from src.models.unidade import Unidade
+
+PREFIXOS = ["MAC", "MAT", "FIS", "QFL", "FLF", "EAD", "PCS", "ACH", "SME", "LES"]
+PALAVRAS = [
+    "Cálculo", "Álgebra", "Linear", "Física", "Experimental", "Introdução", "Computação",
+    "Economia", "Política", "História", "Química", "Orgânica", "Estatística", "Aplicada",
+    "Programação", "Sistemas", "Análise", "Numérica", "Laboratório", "Projeto",
+]
+SIGLAS = ["IME", "FFLCH", "POLI", "EACH", "ESALQ", "EESC", "FEA", "IF", "IQ", "ICMC"]
+
+def gerar_unidades(
+    disciplinas: int = 100_000,
+    unidades: int = 40,
+    cursos_por_unidade: int = 25,
+    catalogo: int = 20_000,
+    registro: Optional[RegistroDisciplinas] = None,
+    semente: int = 1
+) -> List[Unidade]:
+    """
+    Gera unidades com cursos e disciplinas sorteadas de um catálogo.
+
+    Args:
+        disciplinas: Total aproximado de ocorrências de disciplinas em todas as grades
+        unidades: Quantidade de unidades
+        cursos_por_unidade: Cursos em cada unidade
+        catalogo: Quantidade de disciplinas distintas
+        registro: Se informado, as disciplinas são as instâncias canônicas deste
+            registro; se None, cada ocorrência é um objeto novo com strings
+            próprias, como o parser produzia antes do registro
+        semente: Semente do gerador aleatório
+
+    Returns:
+        Unidades geradas, com cursos adicionados via adicionar_curso
+    """
+    aleatorio = random.Random(semente)
+    valores = [
+        (
+            f"{aleatorio.choice(PREFIXOS)}{indice:04d}",
+            " ".join(aleatorio.sample(PALAVRAS, 3)),
+            aleatorio.randint(0, 6),
+            aleatorio.randint(0, 4),
+            aleatorio.choice([30, 45, 60, 90, 120]),
+            aleatorio.choice([0, 0, 0, 60, 120]),
+            aleatorio.choice([0, 0, 30]),
+            aleatorio.choice([0, 0, 15]),
+        )
+        for indice in range(catalogo)
+    ]
+    por_curso = max(3, disciplinas // (unidades * cursos_por_unidade))
+
+    resultado = []
+    for indice_unidade in range(unidades):
+        sigla = SIGLAS[indice_unidade % len(SIGLAS)]
+        unidade = Unidade(f"Unidade {indice_unidade} - ( {sigla}{indice_unidade} )", codigo=str(indice_unidade + 1))
+        for indice_curso in range(cursos_por_unidade):
+            curso = Curso(
+                f"Curso {indice_unidade}.{indice_curso}",
+                unidade.nome,
+                DuracaoCurso(8, 8, 12),
+                codigo=f"{indice_unidade + 1}{indice_curso:03d}-1"
+            )
+            sorteadas = aleatorio.sample(valores, por_curso)
+            for posicao, (codigo, nome, *numeros) in enumerate(sorteadas):
+                if registro is not None:
+                    disciplina = registro.obter(codigo, nome, *numeros)
+                else:
+                    # Strings novas a cada ocorrência, como as lidas do HTML
+                    disciplina = Disciplina("".join(codigo), "".join(nome), *numeros)
+                lista = ("obrigatorias", "optativas_livres", "optativas_eletivas")[posicao % 3]
+                getattr(curso, lista).append(disciplina)
+            unidade.adicionar_curso(curso)
+        resultado.append(unidade)
+    return resultado
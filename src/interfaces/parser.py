@@ -6,6 +6,25 @@ from ..models.duracao_curso import DuracaoCurso
 
 class Parser(ABC):
     """Interface para implementação de parsers de HTML."""
+
+    @abstractmethod
+    def extrair_grade(
+        self, html: str
+    ) -> Tuple[DuracaoCurso, List[Disciplina], List[Disciplina], List[Disciplina]]:
+        """
+        Extrai, numa única passada pelo HTML, a duração e as disciplinas do curso.
+        
+        Args:
+            html: Código HTML da página.
+            
+        Returns:
+            Tupla contendo:
+            - Objeto DuracaoCurso com as durações extraídas
+            - Lista de disciplinas obrigatórias
+            - Lista de disciplinas optativas livres
+            - Lista de disciplinas optativas eletivas
+        """
+        pass
     
     @abstractmethod
     def extrair_duracoes(self, html: str) -> DuracaoCurso:
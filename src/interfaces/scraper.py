@@ -1,8 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 class WebScraper(ABC):
-    """Interface para implementação de web scrapers."""
+    """
+    Interface para implementação de web scrapers.
+    
+    Attributes:
+        carregamentos_pagina: Quantidade de carregamentos de página feitos até agora
+        bytes_recebidos: Total de bytes de HTML devolvidos pelo navegador ou servidor
+    """
+
+    carregamentos_pagina: int = 0
+    bytes_recebidos: int = 0
     
     @abstractmethod
     def acessar_pagina_inicial(self) -> None:
@@ -32,6 +41,16 @@ class WebScraper(ABC):
         """
         pass
 
+    @abstractmethod
+    def obter_unidades(self) -> List[Tuple[str, str]]:
+        """
+        Obtém a lista de unidades disponíveis.
+
+        Returns:
+            Lista de tuplas (código, nome) das unidades.
+        """
+        pass
+
     @abstractmethod
     def selecionar_unidade(self, codigo: str) -> None:
         """
@@ -61,10 +80,54 @@ class WebScraper(ABC):
             codigo_curso: Código do curso.
             
         Returns:
-            HTML da página da grade curricular.
+            HTML da página da grade curricular, ou None se o curso não tem grade.
+            
+        Raises:
+            Exception: Se a página não pôde ser obtida (a coleta tentará de novo).
         """
         pass
 
+    def voltar_para_cursos(self, codigo_unidade: str) -> None:
+        """
+        Deixa o seletor de cursos da unidade pronto para o próximo curso.
+        
+        A implementação padrão recarrega a página inicial e seleciona a
+        unidade novamente; implementações podem reaproveitar o estado atual.
+        
+        Args:
+            codigo_unidade: Código da unidade cujos cursos serão acessados.
+        """
+        self.acessar_pagina_inicial()
+        self.selecionar_unidade(codigo_unidade)
+
+    def resumo_esperas(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Retorna a instrumentação do tempo gasto esperando em cada etapa.
+        
+        Returns:
+            Dicionário etapa -> (quantidade de esperas, tempo total em segundos).
+            Implementações sem esperas explícitas retornam um dicionário vazio.
+        """
+        return {}
+
+    def esta_ativo(self) -> bool:
+        """
+        Verifica se a sessão do scraper ainda responde.
+        
+        Returns:
+            True se o scraper pode continuar sendo usado.
+        """
+        return True
+
+    def memoria_navegador(self) -> Optional[int]:
+        """
+        Mede a memória usada pelo navegador controlado pelo scraper.
+        
+        Returns:
+            Memória em bytes, ou None se não houver navegador ou não for possível medir.
+        """
+        return None
+
     @abstractmethod
     def fechar(self) -> None:
         """Fecha o navegador e libera recursos."""
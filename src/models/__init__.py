@@ -8,6 +8,7 @@ from .curso import Curso
 from .disciplina import Disciplina
 from .duracao_curso import DuracaoCurso
 from .grade_curricular import GradeCurricular
+from .registro_disciplinas import REGISTRO_DISCIPLINAS, RegistroDisciplinas
 from .unidade import Unidade
 
 __all__ = [
@@ -15,5 +16,7 @@ __all__ = [
     'Disciplina',
     'DuracaoCurso',
     'GradeCurricular',
+    'REGISTRO_DISCIPLINAS',
+    'RegistroDisciplinas',
     'Unidade'
 ]
\ No newline at end of file
@@ -15,6 +15,7 @@ class Curso:
         obrigatorias: Lista de disciplinas obrigatórias
         optativas_livres: Lista de disciplinas optativas livres
         optativas_eletivas: Lista de disciplinas optativas eletivas
+        codigo: Código do curso no Jupiter (vazio se desconhecido)
     """
     nome: str
     unidade: str
@@ -22,6 +23,7 @@ class Curso:
     obrigatorias: List[Disciplina] = field(default_factory=list)
     optativas_livres: List[Disciplina] = field(default_factory=list)
     optativas_eletivas: List[Disciplina] = field(default_factory=list)
+    codigo: str = ""
 
     @property
     def todas_disciplinas(self) -> List[Disciplina]:
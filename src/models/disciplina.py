@@ -1,10 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
-@dataclass
+@dataclass(frozen=True)
 class Disciplina:
     """
     Representa uma disciplina acadêmica.
     
+    É imutável e usa __slots__: a mesma instância é compartilhada por todos
+    os cursos que listam a disciplina (ver RegistroDisciplinas, que a
+    referencia de forma fraca, daí o slot __weakref__).
+    
     Attributes:
         codigo: Código único da disciplina
         nome: Nome da disciplina
@@ -15,6 +19,11 @@ class Disciplina:
         carga_praticas: Carga horária de práticas
         atividades_aprofundamento: Horas de atividades de aprofundamento
     """
+    __slots__ = (
+        "codigo", "nome", "creditos_aula", "creditos_trabalho", "carga_horaria",
+        "carga_estagio", "carga_praticas", "atividades_aprofundamento", "__weakref__",
+    )
+
     codigo: str
     nome: str
     creditos_aula: int
@@ -29,5 +38,10 @@ class Disciplina:
         """Retorna o total de créditos da disciplina."""
         return self.creditos_aula + self.creditos_trabalho
 
+    def __reduce__(self):
+        # Ao chegar de outro processo, a disciplina volta a ser a instância canônica
+        from .registro_disciplinas import disciplina_canonica
+        return disciplina_canonica, tuple(getattr(self, campo.name) for campo in fields(self))
+
     def __str__(self) -> str:
         return f"{self.codigo} - {self.nome}"
\ No newline at end of file
@@ -0,0 +1,110 @@
+import sys
+import threading
+from typing import Tuple
+from weakref import WeakValueDictionary
+from .disciplina import Disciplina
+
+def _internar(texto):
+    """Interna o texto (valores que não são str, como None, ficam como estão)."""
+    return sys.intern(texto) if type(texto) is str else texto
+
+class RegistroDisciplinas:
+    """
+    Guarda uma única instância (canônica) de cada disciplina distinta.
+
+    A mesma disciplina costuma aparecer na grade de vários cursos; em vez
+    de um objeto por curso, todos os cursos passam a referenciar o mesmo
+    objeto, com código e nome internados (sys.intern). Só são unificadas
+    disciplinas com todos os campos iguais, de modo que diferenças entre
+    grades são preservadas.
+
+    O registro guarda apenas referências fracas: uma disciplina sai dele
+    quando nenhum curso (ou outro objeto) a referencia mais, de modo que o
+    registro global não cresce indefinidamente entre coletas e cargas.
+
+    O registro não é compartilhado entre processos: ao ser serializado com
+    pickle, o registro global volta a ser o registro global do processo de
+    destino, e os demais chegam vazios.
+    """
+
+    def __init__(self):
+        self._disciplinas: "WeakValueDictionary[Tuple, Disciplina]" = WeakValueDictionary()
+        self._trava = threading.Lock()
+
+    def obter(
+        self,
+        codigo: str,
+        nome: str,
+        creditos_aula: int,
+        creditos_trabalho: int,
+        carga_horaria: int,
+        carga_estagio: int,
+        carga_praticas: int,
+        atividades_aprofundamento: int
+    ) -> Disciplina:
+        """
+        Obtém a instância canônica da disciplina com esses valores, criando-a se preciso.
+
+        Args:
+            codigo: Código da disciplina
+            nome: Nome da disciplina
+            creditos_aula: Número de créditos em aula
+            creditos_trabalho: Número de créditos em trabalho
+            carga_horaria: Carga horária total
+            carga_estagio: Carga horária de estágio
+            carga_praticas: Carga horária de práticas
+            atividades_aprofundamento: Horas de atividades de aprofundamento
+
+        Returns:
+            Disciplina compartilhada por todos os cursos que a listam
+        """
+        chave = (codigo, nome, creditos_aula, creditos_trabalho, carga_horaria,
+                 carga_estagio, carga_praticas, atividades_aprofundamento)
+        disciplina = self._disciplinas.get(chave)
+        if disciplina is None:
+            with self._trava:
+                disciplina = self._disciplinas.get(chave)
+                if disciplina is None:
+                    disciplina = Disciplina(_internar(codigo), _internar(nome), *chave[2:])
+                    # A chave guardada usa as strings internadas da própria disciplina
+                    self._disciplinas[(disciplina.codigo, disciplina.nome, *chave[2:])] = disciplina
+        return disciplina
+
+    def canonica(self, disciplina: Disciplina) -> Disciplina:
+        """
+        Troca uma disciplina pela instância canônica equivalente.
+
+        Args:
+            disciplina: Disciplina criada fora do registro
+
+        Returns:
+            Disciplina canônica com os mesmos valores
+        """
+        return self.obter(
+            disciplina.codigo, disciplina.nome, disciplina.creditos_aula, disciplina.creditos_trabalho,
+            disciplina.carga_horaria, disciplina.carga_estagio, disciplina.carga_praticas,
+            disciplina.atividades_aprofundamento
+        )
+
+    def __len__(self) -> int:
+        return len(self._disciplinas)
+
+    def __reduce__(self):
+        if self is REGISTRO_DISCIPLINAS:
+            return "REGISTRO_DISCIPLINAS"
+        return RegistroDisciplinas, ()
+
+# Registro usado pelo parser e pela leitura de snapshots, checkpoints e processos de análise
+REGISTRO_DISCIPLINAS = RegistroDisciplinas()
+
+def disciplina_canonica(*valores) -> Disciplina:
+    """
+    Obtém do registro global a disciplina com esses valores (usado na desserialização).
+
+    Args:
+        valores: Valores na ordem dos campos de Disciplina
+
+    Returns:
+        Disciplina canônica
+    """
+    return REGISTRO_DISCIPLINAS.obter(*valores)
@@ -10,9 +10,18 @@ class Unidade:
     Attributes:
         nome: Nome da unidade
         cursos: Lista de cursos oferecidos pela unidade
+        codigo: Código da unidade no Jupiter (vazio se desconhecido)
+        versao: Quantidade de cursos adicionados a esta unidade via
+            adicionar_curso; quem guarda dados derivados da unidade compara
+            esse contador para saber se precisa recalculá-los. Não é um campo
+            do dataclass, portanto não entra em asdict nem nos snapshots.
     """
     nome: str
     cursos: List[Curso] = field(default_factory=list)
+    codigo: str = ""
+
+    def __post_init__(self):
+        self.versao = 0
 
     def adicionar_curso(self, curso: Curso) -> None:
         """
@@ -22,6 +31,7 @@ class Unidade:
             curso: Curso a ser adicionado
         """
         self.cursos.append(curso)
+        self.versao += 1
 
     def buscar_curso(self, nome: str) -> Optional[Curso]:
         """
@@ -4,6 +4,7 @@ Módulo de parsers.
 Contém as implementações de parsers para extrair dados de HTML.
 """
 
+from .classificador import classificar_pagina
 from .jupiter_parser import JupiterParser
 
-__all__ = ['JupiterParser']
\ No newline at end of file
+__all__ = ['JupiterParser', 'classificar_pagina']
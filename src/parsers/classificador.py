@@ -0,0 +1,53 @@
+import re
+from typing import Optional
+
+PAGINA_GRADE = "grade"
+PAGINA_ERRO = "erro"
+PAGINA_BLOQUEIO = "bloqueio"
+PAGINA_VAZIA = "vazia"
+
+TIPOS_PAGINA = [PAGINA_GRADE, PAGINA_ERRO, PAGINA_BLOQUEIO, PAGINA_VAZIA]
+
+# Trechos da página de bloqueio do firewall da USP (ver pagina_debug.html)
+MARCADORES_BLOQUEIO = ("has been blocked", "Web Page Blocked")
+
+_POPUP_ERRO = re.compile(r"""id=["']?err["'\s>]""")
+# Atributo id da div da grade, com ou sem aspas; usado também por JupiterParser.recortar_grade
+RE_ID_GRADE = re.compile(r"""\bid=["']?gradeCurricular["'\s>]""")
+_LINHA_TABELA = re.compile(r"<tr[\s>]", re.IGNORECASE)
+
+def pagina_bloqueada(texto: Optional[str]) -> bool:
+    """
+    Indica se o texto (HTML ou título) é da página de bloqueio do firewall.
+
+    Args:
+        texto: HTML ou título da página carregada
+
+    Returns:
+        True se algum marcador de bloqueio estiver presente
+    """
+    return bool(texto) and any(marcador in texto for marcador in MARCADORES_BLOQUEIO)
+
+def classificar_pagina(html: Optional[str]) -> str:
+    """
+    Classifica o HTML de uma grade antes do parser, apenas com buscas textuais.
+
+    Args:
+        html: HTML devolvido pelo scraper
+
+    Returns:
+        PAGINA_BLOQUEIO para a página do firewall, PAGINA_ERRO para o popup
+        de erro do Jupiter, PAGINA_GRADE se houver a tabela #gradeCurricular
+        com linhas, e PAGINA_VAZIA para qualquer outro conteúdo
+    """
+    if not html or not html.strip():
+        return PAGINA_VAZIA
+    if pagina_bloqueada(html):
+        return PAGINA_BLOQUEIO
+    if _POPUP_ERRO.search(html):
+        return PAGINA_ERRO
+
+    grade = RE_ID_GRADE.search(html)
+    if grade and _LINHA_TABELA.search(html, grade.end()):
+        return PAGINA_GRADE
+    return PAGINA_VAZIA
@@ -1,9 +1,27 @@
+import re
+import time
 from typing import Tuple, List, Optional
 from bs4 import BeautifulSoup, Tag
 from ..interfaces.parser import Parser
 from ..models.disciplina import Disciplina
 from ..models.duracao_curso import DuracaoCurso
 from ..models.grade_curricular import GradeCurricular
+from ..models.registro_disciplinas import REGISTRO_DISCIPLINAS, RegistroDisciplinas
+from .classificador import RE_ID_GRADE
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:  # versões do selectolax anteriores à 1.0
+        from selectolax.parser import HTMLParser
+    except ImportError:  # selectolax é opcional
+        HTMLParser = None
+
+try:
+    import lxml  # noqa: F401  (usado indiretamente pelo BeautifulSoup)
+    LXML_DISPONIVEL = True
+except ImportError:  # lxml é opcional
+    LXML_DISPONIVEL = False
 
 class JupiterParser(Parser):
     """
@@ -11,8 +29,128 @@ class JupiterParser(Parser):
     
     Implementa a interface Parser para processar o HTML das páginas
     do sistema Jupiter e extrair as informações necessárias.
+    
+    O backend de análise é escolhido na criação: "selectolax" (mais rápido),
+    "lxml" (BeautifulSoup com o tokenizador em C) ou "html.parser" (Python
+    puro, sempre disponível). Todos produzem as mesmas disciplinas.
+    
+    Antes de construir a árvore, o HTML é recortado para conter apenas os
+    spans de duração e a div #gradeCurricular, de modo que cabeçalhos,
+    scripts e outras abas da página nunca são analisados.
+    
+    As disciplinas devolvidas são as instâncias canônicas do registro:
+    a mesma disciplina em grades de cursos diferentes é um único objeto.
+    
+    Attributes:
+        backend: Nome do backend de análise em uso
+        registro: Registro que fornece as disciplinas canônicas
+        paginas_processadas: Quantidade de páginas analisadas por este parser
+        tempo_parse: Tempo total gasto em extrair_grade (em segundos)
     """
 
+    BACKENDS = ("selectolax", "lxml", "html.parser")
+    RE_ID_GRADE = RE_ID_GRADE
+    RE_DIV = re.compile(r"<(/?)div\b", re.IGNORECASE)
+    RE_SPAN_DURACAO = re.compile(
+        r'''<span\b[^>]*class=["'][^"']*\bdur(?:idl|min|max)hab\b[^>]*>.*?</span>''',
+        re.IGNORECASE | re.DOTALL
+    )
+
+    def __init__(self, backend: Optional[str] = None, registro: Optional[RegistroDisciplinas] = None):
+        """
+        Inicializa o parser.
+        
+        Args:
+            backend: Backend a usar. Se None ou "auto", usa o mais rápido instalado.
+            registro: Registro de disciplinas (padrão: o registro global)
+            
+        Raises:
+            ValueError: Se o backend for desconhecido ou não estiver instalado
+        """
+        if backend in (None, "auto"):
+            backend = self.backends_disponiveis()[0]
+        if backend not in self.backends_disponiveis():
+            raise ValueError(f"Backend de parser indisponível: {backend}")
+        self.backend = backend
+        self.registro = registro if registro is not None else REGISTRO_DISCIPLINAS
+        self.paginas_processadas = 0
+        self.tempo_parse = 0.0
+
+    @classmethod
+    def backends_disponiveis(cls) -> List[str]:
+        """
+        Lista os backends instalados, do mais rápido para o mais lento.
+        
+        Returns:
+            Nomes dos backends que podem ser usados neste ambiente
+        """
+        disponiveis = {
+            "selectolax": HTMLParser is not None,
+            "lxml": LXML_DISPONIVEL,
+            "html.parser": True,
+        }
+        return [nome for nome in cls.BACKENDS if disponiveis[nome]]
+
+    def extrair_grade(
+        self, html: str
+    ) -> Tuple[DuracaoCurso, List[Disciplina], List[Disciplina], List[Disciplina]]:
+        """
+        Extrai a duração e as disciplinas do curso construindo uma única árvore.
+        
+        Args:
+            html: Código HTML da página
+            
+        Returns:
+            Tupla (duração, obrigatórias, optativas livres, optativas eletivas)
+        """
+        inicio = time.perf_counter()
+        html = self.recortar_grade(html)
+
+        if self.backend == "selectolax":
+            resultado = self._extrair_grade_selectolax(html)
+        else:
+            soup = BeautifulSoup(html, self.backend)
+            duracao = self._extrair_duracoes_soup(soup)
+            obrigatorias, optativas_livres, optativas_eletivas = self._extrair_disciplinas_soup(soup)
+            resultado = (duracao, obrigatorias, optativas_livres, optativas_eletivas)
+
+        self.paginas_processadas += 1
+        self.tempo_parse += time.perf_counter() - inicio
+        return resultado
+
+    @classmethod
+    def recortar_grade(cls, html: str) -> str:
+        """
+        Reduz o HTML aos spans de duração e à div #gradeCurricular.
+        
+        O recorte é feito por busca textual, sem construir árvore: localiza a
+        div da grade e acompanha a profundidade das tags div até o seu
+        fechamento. Se a grade não for encontrada, o HTML é devolvido intacto.
+        
+        Args:
+            html: Código HTML da página (completa ou já recortada)
+            
+        Returns:
+            HTML contendo apenas os trechos usados pelo parser
+        """
+        marcador = cls.RE_ID_GRADE.search(html)
+        if not marcador:
+            return html
+        inicio = html.rfind("<div", 0, marcador.start())
+        if inicio == -1:
+            return html
+
+        fim = len(html)
+        profundidade = 0
+        for tag in cls.RE_DIV.finditer(html, inicio):
+            profundidade += -1 if tag.group(1) else 1
+            if profundidade == 0:
+                fim = html.find(">", tag.end()) + 1 or len(html)
+                break
+
+        spans = cls.RE_SPAN_DURACAO.findall(html, 0, inicio) + cls.RE_SPAN_DURACAO.findall(html, fim)
+        return "".join(spans) + html[inicio:fim]
+
     def extrair_duracoes(self, html: str) -> DuracaoCurso:
         """
         Extrai as durações do curso do HTML.
@@ -22,16 +160,37 @@ class JupiterParser(Parser):
             
         Returns:
             Objeto DuracaoCurso com as durações extraídas
+        """
+        return self.extrair_grade(html)[0]
+
+    def extrair_disciplinas(self, html: str) -> Tuple[List[Disciplina], List[Disciplina], List[Disciplina]]:
+        """
+        Extrai as disciplinas do HTML e as organiza por tipo.
+        
+        Args:
+            html: Código HTML da página
             
-        Raises:
-            ValueError: Se não for possível encontrar as informações de duração
+        Returns:
+            Tupla contendo três listas de disciplinas (obrigatórias, optativas livres, optativas eletivas)
+        """
+        _, obrigatorias, optativas_livres, optativas_eletivas = self.extrair_grade(html)
+        return obrigatorias, optativas_livres, optativas_eletivas
+
+    def _extrair_duracoes_soup(self, soup: BeautifulSoup) -> DuracaoCurso:
+        """
+        Extrai as durações do curso de uma árvore já construída.
+        
+        Args:
+            soup: Árvore do HTML da página
+            
+        Returns:
+            Objeto DuracaoCurso com as durações extraídas
         """
-        soup = BeautifulSoup(html, "html.parser")
         try:
             ideal = int(soup.find("span", class_="duridlhab").text)
             minima = int(soup.find("span", class_="durminhab").text)
             maxima = int(soup.find("span", class_="durmaxhab").text)
-            
+
             return DuracaoCurso(
                 ideal=ideal,
                 minima=minima,
@@ -42,38 +201,93 @@ class JupiterParser(Parser):
             # Valores padrão em caso de erro
             return DuracaoCurso(ideal=8, minima=8, maxima=12)
 
-    def extrair_disciplinas(self, html: str) -> Tuple[List[Disciplina], List[Disciplina], List[Disciplina]]:
+    def _extrair_disciplinas_soup(
+        self, soup: BeautifulSoup
+    ) -> Tuple[List[Disciplina], List[Disciplina], List[Disciplina]]:
         """
-        Extrai as disciplinas do HTML e as organiza por tipo.
+        Extrai as disciplinas de uma árvore já construída, organizando-as por tipo.
         
         Args:
-            html: Código HTML da página
+            soup: Árvore do HTML da página
             
         Returns:
             Tupla contendo três listas de disciplinas (obrigatórias, optativas livres, optativas eletivas)
         """
-        soup = BeautifulSoup(html, "html.parser")
         grade = GradeCurricular()
-        
+
         div_grade = soup.find("div", id="gradeCurricular")
         if not div_grade:
             return grade.get_todas_disciplinas()
 
         tipo_atual = None
-        
+
         for linha in div_grade.find_all("tr"):
             # Determinar o tipo de disciplina
             tipo_atual = self._identificar_tipo_disciplina(linha, tipo_atual)
             if not tipo_atual or "Semestre Ideal" in linha.get_text():
                 continue
-            
+
             # Tentar criar disciplina da linha atual
             disciplina = self._criar_disciplina_da_linha(linha)
             if disciplina:
                 grade.adicionar_disciplina(disciplina, tipo_atual)
-        
+
         return grade.get_todas_disciplinas()
 
+    def _extrair_grade_selectolax(
+        self, html: str
+    ) -> Tuple[DuracaoCurso, List[Disciplina], List[Disciplina], List[Disciplina]]:
+        """
+        Extrai duração e disciplinas usando o selectolax.
+        
+        Segue exatamente as mesmas regras do caminho com BeautifulSoup.
+        
+        Args:
+            html: Código HTML da página
+            
+        Returns:
+            Tupla (duração, obrigatórias, optativas livres, optativas eletivas)
+        """
+        arvore = HTMLParser(html)
+
+        try:
+            duracao = DuracaoCurso(
+                ideal=int(arvore.css_first("span.duridlhab").text()),
+                minima=int(arvore.css_first("span.durminhab").text()),
+                maxima=int(arvore.css_first("span.durmaxhab").text())
+            )
+        except (AttributeError, ValueError) as e:
+            print(f"Erro ao extrair durações: {e}")
+            # Valores padrão em caso de erro
+            duracao = DuracaoCurso(ideal=8, minima=8, maxima=12)
+
+        grade = GradeCurricular()
+        div_grade = arvore.css_first("div#gradeCurricular")
+        if not div_grade:
+            return (duracao, *grade.get_todas_disciplinas())
+
+        tipo_atual = None
+        for linha in div_grade.css("tr"):
+            tipo_atual = self._identificar_tipo_por_texto(linha.text(strip=True), tipo_atual)
+            if not tipo_atual or "Semestre Ideal" in linha.text():
+                continue
+
+            colunas = linha.css("td")
+            if len(colunas) < 8:
+                continue
+            codigo_elem = colunas[0].css_first("a.disciplina")
+            if not codigo_elem:
+                continue
+
+            disciplina = self._criar_disciplina(
+                codigo_elem.attributes.get("data-coddis"),
+                [coluna.text(strip=True) for coluna in colunas[1:8]]
+            )
+            if disciplina:
+                grade.adicionar_disciplina(disciplina, tipo_atual)
+
+        return (duracao, *grade.get_todas_disciplinas())
+
     def _identificar_tipo_disciplina(self, linha: Tag, tipo_atual: str) -> str:
         """
         Identifica o tipo de disciplina com base no texto da linha.
@@ -85,7 +299,20 @@ class JupiterParser(Parser):
         Returns:
             Novo tipo de disciplina ou tipo atual se não houver mudança
         """
-        texto = linha.get_text(strip=True)
+        return self._identificar_tipo_por_texto(linha.get_text(strip=True), tipo_atual)
+
+    @staticmethod
+    def _identificar_tipo_por_texto(texto: str, tipo_atual: str) -> str:
+        """
+        Identifica o tipo de disciplina a partir do texto já extraído da linha.
+        
+        Args:
+            texto: Texto da linha, sem espaços nas extremidades dos nós
+            tipo_atual: Tipo atual de disciplina sendo processado
+            
+        Returns:
+            Novo tipo de disciplina ou tipo atual se não houver mudança
+        """
         if "Disciplinas Obrigatórias" in texto:
             return "obrigatoria"
         elif "Disciplinas Optativas Livres" in texto:
@@ -104,25 +331,41 @@ class JupiterParser(Parser):
         Returns:
             Objeto Disciplina ou None se não for possível criar
         """
-        try:
-            colunas = linha.find_all("td")
-            if len(colunas) < 8:
-                return None
+        colunas = linha.find_all("td")
+        if len(colunas) < 8:
+            return None
 
-            codigo_elem = colunas[0].find("a", class_="disciplina")
-            if not codigo_elem:
-                return None
-
-            return Disciplina(
-                codigo=codigo_elem.get("data-coddis"),
-                nome=colunas[1].get_text(strip=True),
-                creditos_aula=int(colunas[2].get_text(strip=True) or 0),
-                creditos_trabalho=int(colunas[3].get_text(strip=True) or 0),
-                carga_horaria=int(colunas[4].get_text(strip=True) or 0),
-                carga_estagio=int(colunas[5].get_text(strip=True) or 0),
-                carga_praticas=int(colunas[6].get_text(strip=True) or 0),
-                atividades_aprofundamento=int(colunas[7].get_text(strip=True) or 0)
+        codigo_elem = colunas[0].find("a", class_="disciplina")
+        if not codigo_elem:
+            return None
+
+        return self._criar_disciplina(
+            codigo_elem.get("data-coddis"),
+            [coluna.get_text(strip=True) for coluna in colunas[1:8]]
+        )
+
+    def _criar_disciplina(self, codigo: str, textos: List[str]) -> Optional[Disciplina]:
+        """
+        Obtém do registro a Disciplina descrita pelos textos das colunas da linha.
+        
+        Args:
+            codigo: Código da disciplina (atributo data-coddis)
+            textos: Textos das colunas de nome até atividades de aprofundamento
+            
+        Returns:
+            Disciplina canônica ou None se não for possível criar
+        """
+        try:
+            return self.registro.obter(
+                codigo=codigo,
+                nome=textos[0],
+                creditos_aula=int(textos[1] or 0),
+                creditos_trabalho=int(textos[2] or 0),
+                carga_horaria=int(textos[3] or 0),
+                carga_estagio=int(textos[4] or 0),
+                carga_praticas=int(textos[5] or 0),
+                atividades_aprofundamento=int(textos[6] or 0)
             )
         except Exception as e:
             print(f"Erro ao criar disciplina: {e}")
-            return None
\ No newline at end of file
+            return None
@@ -0,0 +1,22 @@
+"""
+Módulo de persistência.
+
+Contém as classes responsáveis por gravar e recuperar em disco
+os dados coletados do Jupiter.
+"""
+
+from .cache_html import CacheHtml, EntradaCache
+from .checkpoint import CursoConcluido, JornalCheckpoint
+from .exportacao_colunar import ExportadorColunar
+from .exportacao_ndjson import ExportadorNdjson
+from .snapshot import SnapshotStore
+
+__all__ = [
+    'CacheHtml',
+    'CursoConcluido',
+    'EntradaCache',
+    'ExportadorColunar',
+    'ExportadorNdjson',
+    'JornalCheckpoint',
+    'SnapshotStore'
+]
@@ -0,0 +1,162 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+@dataclass
+class EntradaCache:
+    """
+    Registro de uma página de grade guardada no cache.
+
+    Attributes:
+        codigo_unidade: Código da unidade no Jupiter
+        nome_unidade: Nome da unidade
+        codigo_curso: Código do curso no Jupiter
+        nome_curso: Nome do curso
+        data: Data da coleta (AAAA-MM-DD)
+        hash: Hash SHA-256 do HTML, que identifica o arquivo no cache
+    """
+    codigo_unidade: str
+    nome_unidade: str
+    codigo_curso: str
+    nome_curso: str
+    data: str
+    hash: str
+
+class CacheHtml:
+    """
+    Cache em disco do HTML bruto das grades curriculares.
+
+    O conteúdo é endereçado pelo hash: cada página distinta é gravada uma
+    única vez, compactada com gzip, em objetos/<2 primeiros dígitos>/<hash>.gz.
+    Um índice append-only (indice.jsonl) associa unidade, curso e data da
+    coleta ao hash correspondente, permitindo reprocessar as páginas sem
+    acessar o Jupiter.
+
+    Attributes:
+        diretorio: Diretório raiz do cache
+    """
+
+    ARQUIVO_INDICE = "indice.jsonl"
+
+    def __init__(self, diretorio: str):
+        self.diretorio = diretorio
+        self._trava = threading.Lock()
+
+    @staticmethod
+    def calcular_hash(html: str) -> str:
+        """
+        Calcula o hash que identifica uma página no cache.
+
+        Args:
+            html: HTML da página
+
+        Returns:
+            Hash SHA-256 em hexadecimal
+        """
+        return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+    def caminho_objeto(self, valor_hash: str) -> str:
+        """
+        Monta o caminho do arquivo compactado de uma página.
+
+        Args:
+            valor_hash: Hash da página
+
+        Returns:
+            Caminho do arquivo dentro do diretório do cache
+        """
+        return os.path.join(self.diretorio, "objetos", valor_hash[:2], f"{valor_hash}.gz")
+
+    def salvar(
+        self,
+        codigo_unidade: str,
+        nome_unidade: str,
+        codigo_curso: str,
+        nome_curso: str,
+        html: str
+    ) -> str:
+        """
+        Guarda a página (se ainda não existir) e registra a coleta no índice.
+
+        Args:
+            codigo_unidade: Código da unidade
+            nome_unidade: Nome da unidade
+            codigo_curso: Código do curso
+            nome_curso: Nome do curso
+            html: HTML da grade curricular
+
+        Returns:
+            Hash com que a página foi gravada
+        """
+        valor_hash = self.calcular_hash(html)
+        caminho = self.caminho_objeto(valor_hash)
+
+        if not os.path.exists(caminho):
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            temporario = f"{caminho}.{threading.get_ident()}.tmp"
+            with gzip.open(temporario, "wt", encoding="utf-8") as arquivo:
+                arquivo.write(html)
+            os.replace(temporario, caminho)
+
+        entrada = EntradaCache(
+            codigo_unidade=codigo_unidade,
+            nome_unidade=nome_unidade,
+            codigo_curso=codigo_curso,
+            nome_curso=nome_curso,
+            data=date.today().isoformat(),
+            hash=valor_hash
+        )
+        with self._trava:
+            os.makedirs(self.diretorio, exist_ok=True)
+            with open(os.path.join(self.diretorio, self.ARQUIVO_INDICE), "a", encoding="utf-8") as indice:
+                indice.write(json.dumps(asdict(entrada), ensure_ascii=False) + "\n")
+
+        return valor_hash
+
+    def ler(self, valor_hash: str) -> str:
+        """
+        Lê uma página do cache.
+
+        Args:
+            valor_hash: Hash da página
+
+        Returns:
+            HTML descompactado
+        """
+        with gzip.open(self.caminho_objeto(valor_hash), "rt", encoding="utf-8") as arquivo:
+            return arquivo.read()
+
+    def entradas(self, data: Optional[str] = None) -> List[EntradaCache]:
+        """
+        Lista a coleta mais recente de cada curso presente no índice.
+
+        Args:
+            data: Se informada (AAAA-MM-DD), considera apenas coletas até essa data
+
+        Returns:
+            Entradas na ordem em que os cursos apareceram pela primeira vez
+        """
+        caminho = os.path.join(self.diretorio, self.ARQUIVO_INDICE)
+        if not os.path.exists(caminho):
+            return []
+
+        ultimas: Dict[Tuple[str, str], EntradaCache] = {}
+        with open(caminho, encoding="utf-8") as indice:
+            for linha in indice:
+                if not linha.strip():
+                    continue
+                try:
+                    entrada = EntradaCache(**json.loads(linha))
+                except (ValueError, TypeError):
+                    # Linha incompleta de uma execução interrompida
+                    continue
+                if data and entrada.data > data:
+                    continue
+                # Atualizar a chave mantém a posição da primeira ocorrência
+                ultimas[(entrada.codigo_unidade, entrada.codigo_curso)] = entrada
+        return list(ultimas.values())
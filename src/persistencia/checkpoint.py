@@ -0,0 +1,148 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from ..models.curso import Curso
+from .serializacao import curso_de_dict, curso_para_dict
+
+@dataclass
+class CursoConcluido:
+    """
+    Curso já coletado, recuperado do diário de checkpoint.
+
+    Attributes:
+        codigo_unidade: Código da unidade no Jupiter
+        nome_unidade: Nome da unidade
+        curso: Curso com duração e disciplinas
+        hash: Hash do HTML da grade de onde o curso foi extraído (opcional)
+    """
+    codigo_unidade: str
+    nome_unidade: str
+    curso: Curso
+    hash: Optional[str] = None
+
+class JornalCheckpoint:
+    """
+    Diário append-only dos cursos concluídos durante uma coleta.
+
+    Cada curso coletado é gravado imediatamente numa linha JSON, com os
+    códigos da unidade e do curso. Se a coleta for interrompida, o diário
+    permite retomá-la coletando apenas os cursos que ainda faltam. Linhas
+    incompletas (de uma gravação interrompida) são ignoradas na leitura e
+    removidas do fim do arquivo antes da primeira gravação seguinte.
+
+    Attributes:
+        caminho: Caminho do arquivo do diário
+    """
+
+    TAMANHO_BLOCO = 64 * 1024
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._trava = threading.Lock()
+        self._cauda_verificada = False
+
+    def existe(self) -> bool:
+        """Indica se já há um diário gravado no caminho configurado."""
+        return os.path.exists(self.caminho)
+
+    def iniciar(self) -> None:
+        """
+        Descarta o diário anterior, se houver, para começar uma coleta nova.
+        """
+        with self._trava:
+            if os.path.exists(self.caminho):
+                os.remove(self.caminho)
+            self._cauda_verificada = True
+
+    def _reparar_cauda(self) -> None:
+        """
+        Remove a linha incompleta deixada no fim do diário por uma gravação interrompida.
+
+        Sem isso, a próxima linha seria anexada à linha incompleta e as
+        duas seriam descartadas na leitura.
+        """
+        if not os.path.exists(self.caminho):
+            return
+        with open(self.caminho, "r+b") as arquivo:
+            fim = arquivo.seek(0, os.SEEK_END)
+            posicao = fim
+            while posicao > 0:
+                inicio = max(0, posicao - self.TAMANHO_BLOCO)
+                arquivo.seek(inicio)
+                bloco = arquivo.read(posicao - inicio)
+                quebra = bloco.rfind(b"\n")
+                if quebra >= 0:
+                    posicao = inicio + quebra + 1
+                    break
+                posicao = inicio
+            if posicao < fim:
+                arquivo.truncate(posicao)
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+
+    def registrar(
+        self,
+        codigo_unidade: str,
+        nome_unidade: str,
+        curso: Curso,
+        valor_hash: Optional[str] = None
+    ) -> None:
+        """
+        Grava um curso concluído no diário.
+
+        Args:
+            codigo_unidade: Código da unidade
+            nome_unidade: Nome da unidade
+            curso: Curso coletado (com código preenchido)
+            valor_hash: Hash do HTML da grade (opcional)
+        """
+        linha = json.dumps({
+            "codigo_unidade": codigo_unidade,
+            "nome_unidade": nome_unidade,
+            "hash": valor_hash,
+            "curso": curso_para_dict(curso)
+        }, ensure_ascii=False)
+
+        with self._trava:
+            diretorio = os.path.dirname(self.caminho)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            if not self._cauda_verificada:
+                self._reparar_cauda()
+                self._cauda_verificada = True
+            with open(self.caminho, "a", encoding="utf-8") as arquivo:
+                arquivo.write(linha + "\n")
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+
+    def carregar(self) -> Dict[Tuple[str, str], CursoConcluido]:
+        """
+        Lê os cursos concluídos registrados no diário.
+
+        Returns:
+            Dicionário (código da unidade, código do curso) -> curso concluído
+        """
+        if not self.existe():
+            return {}
+
+        concluidos: Dict[Tuple[str, str], CursoConcluido] = {}
+        with open(self.caminho, encoding="utf-8") as arquivo:
+            for linha in arquivo:
+                if not linha.strip():
+                    continue
+                try:
+                    dados = json.loads(linha)
+                    curso = curso_de_dict(dados["curso"])
+                    concluido = CursoConcluido(
+                        codigo_unidade=dados["codigo_unidade"],
+                        nome_unidade=dados["nome_unidade"],
+                        curso=curso,
+                        hash=dados.get("hash")
+                    )
+                except (ValueError, TypeError, KeyError):
+                    # Linha incompleta de uma execução interrompida
+                    continue
+                concluidos[(concluido.codigo_unidade, curso.codigo)] = concluido
+        return concluidos
@@ -0,0 +1,160 @@
+import os
+from typing import Dict, List, Tuple
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as parquet
+except ImportError:  # pyarrow é opcional, usado apenas na exportação colunar
+    pa = None
+from ..models.disciplina import Disciplina
+from ..models.unidade import Unidade
+from .serializacao import CAMPOS_DISCIPLINA, TIPOS_DISCIPLINA
+
+# Valor da coluna "tipo" para cada lista de disciplinas do Curso
+TIPO_POR_LISTA = {
+    "obrigatorias": "obrigatoria",
+    "optativas_livres": "optativa_livre",
+    "optativas_eletivas": "optativa_eletiva",
+}
+
+class ExportadorColunar:
+    """
+    Exporta os dados coletados como tabelas colunares normalizadas (Parquet ou Arrow IPC).
+
+    São gravadas três tabelas no diretório de destino:
+
+    - disciplinas: uma linha por disciplina distinta, identificada por disciplina_id
+    - cursos: uma linha por curso, com a unidade e as durações, identificada por curso_id
+    - curso_disciplina: a participação de cada disciplina em cada curso, com o tipo
+      (obrigatoria, optativa_livre ou optativa_eletiva)
+
+    As colunas de texto repetitivas (códigos, nomes, unidade e tipo) são
+    gravadas com codificação de dicionário, e os números com inteiros
+    pequenos, o que mantém os arquivos compactos e rápidos de carregar.
+
+    Attributes:
+        diretorio: Diretório onde as tabelas são gravadas
+        formato: "parquet" ou "arrow" (Arrow IPC / Feather v2)
+    """
+
+    FORMATOS = {"parquet": ".parquet", "arrow": ".arrow"}
+    COMPRESSAO = "zstd"
+
+    def __init__(self, diretorio: str, formato: str = "parquet"):
+        if pa is None:
+            raise ImportError("A exportação colunar requer o pyarrow (pip install pyarrow)")
+        if formato not in self.FORMATOS:
+            raise ValueError(f"Formato de exportação desconhecido: {formato}")
+        self.diretorio = diretorio
+        self.formato = formato
+
+    @staticmethod
+    def _texto(valores: List[str]) -> "pa.Array":
+        """
+        Cria uma coluna de texto com codificação de dicionário.
+
+        Args:
+            valores: Valores da coluna
+
+        Returns:
+            Array do tipo dictionary<int32, string>
+        """
+        return pa.array(valores, type=pa.string()).dictionary_encode()
+
+    def montar_tabelas(self, unidades: List[Unidade]) -> Dict[str, "pa.Table"]:
+        """
+        Achata Unidade → Curso → Disciplina nas três tabelas normalizadas.
+
+        Args:
+            unidades: Unidades com cursos e disciplinas
+
+        Returns:
+            Dicionário nome da tabela -> tabela Arrow
+        """
+        disciplinas: Dict[Tuple, int] = {}
+        colunas_disciplinas: Dict[str, List] = {campo: [] for campo in CAMPOS_DISCIPLINA}
+        cursos: Dict[str, List] = {
+            "curso_id": [], "codigo_curso": [], "nome": [], "codigo_unidade": [], "unidade": [],
+            "duracao_ideal": [], "duracao_minima": [], "duracao_maxima": [],
+        }
+        membros: Dict[str, List] = {"curso_id": [], "disciplina_id": [], "tipo": []}
+
+        def registrar_disciplina(disciplina: Disciplina) -> int:
+            valores = tuple(getattr(disciplina, campo) for campo in CAMPOS_DISCIPLINA)
+            identificador = disciplinas.get(valores)
+            if identificador is None:
+                identificador = len(disciplinas)
+                disciplinas[valores] = identificador
+                for campo, valor in zip(CAMPOS_DISCIPLINA, valores):
+                    colunas_disciplinas[campo].append(valor)
+            return identificador
+
+        for unidade in unidades:
+            for curso in unidade.cursos:
+                curso_id = len(cursos["curso_id"])
+                cursos["curso_id"].append(curso_id)
+                cursos["codigo_curso"].append(curso.codigo)
+                cursos["nome"].append(curso.nome)
+                cursos["codigo_unidade"].append(unidade.codigo)
+                cursos["unidade"].append(unidade.nome)
+                cursos["duracao_ideal"].append(curso.duracao.ideal)
+                cursos["duracao_minima"].append(curso.duracao.minima)
+                cursos["duracao_maxima"].append(curso.duracao.maxima)
+
+                for lista in TIPOS_DISCIPLINA:
+                    for disciplina in getattr(curso, lista):
+                        membros["curso_id"].append(curso_id)
+                        membros["disciplina_id"].append(registrar_disciplina(disciplina))
+                        membros["tipo"].append(TIPO_POR_LISTA[lista])
+
+        tabela_disciplinas = pa.table({
+            "disciplina_id": pa.array(range(len(disciplinas)), type=pa.int32()),
+            "codigo": self._texto(colunas_disciplinas["codigo"]),
+            "nome": self._texto(colunas_disciplinas["nome"]),
+            **{
+                campo: pa.array(colunas_disciplinas[campo], type=pa.int32())
+                for campo in CAMPOS_DISCIPLINA if campo not in ("codigo", "nome")
+            },
+        })
+        tabela_cursos = pa.table({
+            "curso_id": pa.array(cursos["curso_id"], type=pa.int32()),
+            "codigo_curso": self._texto(cursos["codigo_curso"]),
+            "nome": self._texto(cursos["nome"]),
+            "codigo_unidade": self._texto(cursos["codigo_unidade"]),
+            "unidade": self._texto(cursos["unidade"]),
+            "duracao_ideal": pa.array(cursos["duracao_ideal"], type=pa.int16()),
+            "duracao_minima": pa.array(cursos["duracao_minima"], type=pa.int16()),
+            "duracao_maxima": pa.array(cursos["duracao_maxima"], type=pa.int16()),
+        })
+        tabela_membros = pa.table({
+            "curso_id": pa.array(membros["curso_id"], type=pa.int32()),
+            "disciplina_id": pa.array(membros["disciplina_id"], type=pa.int32()),
+            "tipo": self._texto(membros["tipo"]),
+        })
+
+        return {
+            "disciplinas": tabela_disciplinas,
+            "cursos": tabela_cursos,
+            "curso_disciplina": tabela_membros,
+        }
+
+    def exportar(self, unidades: List[Unidade]) -> Dict[str, str]:
+        """
+        Grava as tabelas no diretório de destino.
+
+        Args:
+            unidades: Unidades com cursos e disciplinas
+
+        Returns:
+            Dicionário nome da tabela -> caminho do arquivo gravado
+        """
+        os.makedirs(self.diretorio, exist_ok=True)
+        caminhos: Dict[str, str] = {}
+        for nome, tabela in self.montar_tabelas(unidades).items():
+            caminho = os.path.join(self.diretorio, nome + self.FORMATOS[self.formato])
+            if self.formato == "parquet":
+                parquet.write_table(tabela, caminho, compression=self.COMPRESSAO, use_dictionary=True)
+            else:
+                feather.write_feather(tabela, caminho, compression=self.COMPRESSAO)
+            caminhos[nome] = caminho
+        return caminhos
@@ -0,0 +1,92 @@
+import json
+import sys
+import threading
+from typing import Any, Dict, Optional, TextIO
+from ..models.curso import Curso
+from .serializacao import curso_para_dict
+
+class ExportadorNdjson:
+    """
+    Exporta cada curso coletado como um registro NDJSON assim que ele é concluído.
+
+    Cada linha é um objeto JSON com os códigos e o nome da unidade, os dados
+    do curso, sua duração e as listas de disciplinas por tipo. A saída é
+    descarregada (flush) a cada registro, para que outro processo possa
+    consumir o arquivo ou a saída padrão enquanto a coleta continua.
+
+    Attributes:
+        destino: Caminho do arquivo, ou "-" para a saída padrão
+        registros: Quantidade de cursos exportados
+    """
+
+    SAIDA_PADRAO = "-"
+
+    def __init__(self, destino: str, saida_padrao: Optional[TextIO] = None):
+        """
+        Abre o destino da exportação.
+
+        Args:
+            destino: Caminho do arquivo (sobrescrito), ou "-" para a saída padrão
+            saida_padrao: Fluxo usado quando destino é "-" (padrão: sys.stdout)
+        """
+        self.destino = destino
+        self.registros = 0
+        self._trava = threading.Lock()
+        if destino == self.SAIDA_PADRAO:
+            self._arquivo = saida_padrao or sys.stdout
+            self._proprio = False
+        else:
+            self._arquivo = open(destino, "w", encoding="utf-8")
+            self._proprio = True
+
+    @staticmethod
+    def registro(codigo_unidade: str, nome_unidade: str, curso: Curso) -> Dict[str, Any]:
+        """
+        Monta o registro exportado de um curso.
+
+        Args:
+            codigo_unidade: Código da unidade
+            nome_unidade: Nome da unidade
+            curso: Curso coletado
+
+        Returns:
+            Dicionário serializável com a unidade e os dados do curso
+        """
+        return {"codigo_unidade": codigo_unidade, "nome_unidade": nome_unidade, **curso_para_dict(curso)}
+
+    def exportar(self, codigo_unidade: str, nome_unidade: str, curso: Curso) -> None:
+        """
+        Escreve o registro de um curso e descarrega a saída.
+
+        Args:
+            codigo_unidade: Código da unidade
+            nome_unidade: Nome da unidade
+            curso: Curso coletado
+        """
+        linha = json.dumps(self.registro(codigo_unidade, nome_unidade, curso), ensure_ascii=False)
+        with self._trava:
+            self._arquivo.write(linha + "\n")
+            self._arquivo.flush()
+            self.registros += 1
+
+    def fechar(self) -> None:
+        """
+        Fecha o arquivo de destino (a saída padrão é apenas descarregada).
+        """
+        with self._trava:
+            if self._proprio:
+                self._arquivo.close()
+            else:
+                self._arquivo.flush()
+
+    def __enter__(self):
+        """
+        Permite uso do exportador com context manager.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Garante que o destino será fechado ao sair do context manager.
+        """
+        self.fechar()
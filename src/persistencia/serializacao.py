@@ -0,0 +1,88 @@
+from dataclasses import asdict, fields
+from typing import Any, Dict, List
+from ..models.curso import Curso
+from ..models.disciplina import Disciplina
+from ..models.duracao_curso import DuracaoCurso
+from ..models.registro_disciplinas import REGISTRO_DISCIPLINAS
+from ..models.unidade import Unidade
+
+CAMPOS_DISCIPLINA = [campo.name for campo in fields(Disciplina)]
+TIPOS_DISCIPLINA = ["obrigatorias", "optativas_livres", "optativas_eletivas"]
+
+def disciplina_para_lista(disciplina: Disciplina) -> List[Any]:
+    """
+    Converte uma disciplina em lista de valores, na ordem de CAMPOS_DISCIPLINA.
+    
+    Args:
+        disciplina: Disciplina a ser convertida
+        
+    Returns:
+        Lista com os valores dos campos da disciplina
+    """
+    return [getattr(disciplina, campo) for campo in CAMPOS_DISCIPLINA]
+
+def disciplina_de_lista(valores: List[Any]) -> Disciplina:
+    """
+    Reconstrói uma disciplina a partir de sua lista de valores.
+    
+    Args:
+        valores: Valores na ordem de CAMPOS_DISCIPLINA
+        
+    Returns:
+        Disciplina canônica (do registro global)
+    """
+    return REGISTRO_DISCIPLINAS.obter(*valores)
+
+def curso_para_dict(curso: Curso) -> Dict[str, Any]:
+    """
+    Converte um curso, com duração e disciplinas, em dicionário serializável.
+    
+    Args:
+        curso: Curso a ser convertido
+        
+    Returns:
+        Dicionário com os dados do curso
+    """
+    return asdict(curso)
+
+def curso_de_dict(dados: Dict[str, Any]) -> Curso:
+    """
+    Reconstrói um curso a partir de seu dicionário.
+    
+    Args:
+        dados: Dicionário gerado por curso_para_dict
+        
+    Returns:
+        Objeto Curso
+    """
+    dados = dict(dados)
+    dados["duracao"] = DuracaoCurso(**dados["duracao"])
+    for tipo in TIPOS_DISCIPLINA:
+        dados[tipo] = [REGISTRO_DISCIPLINAS.obter(**d) for d in dados.get(tipo, [])]
+    return Curso(**dados)
+
+def unidade_para_dict(unidade: Unidade) -> Dict[str, Any]:
+    """
+    Converte uma unidade, com seus cursos, em dicionário serializável.
+    
+    Args:
+        unidade: Unidade a ser convertida
+        
+    Returns:
+        Dicionário com os dados da unidade
+    """
+    return asdict(unidade)
+
+def unidade_de_dict(dados: Dict[str, Any]) -> Unidade:
+    """
+    Reconstrói uma unidade a partir de seu dicionário.
+    
+    Args:
+        dados: Dicionário gerado por unidade_para_dict
+        
+    Returns:
+        Objeto Unidade
+    """
+    dados = dict(dados)
+    dados["cursos"] = [curso_de_dict(c) for c in dados.get("cursos", [])]
+    return Unidade(**dados)
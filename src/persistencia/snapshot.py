@@ -0,0 +1,148 @@
+import gzip
+import json
+import os
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from ..models.curso import Curso
+from ..models.disciplina import Disciplina
+from ..models.unidade import Unidade
+from .serializacao import (
+    CAMPOS_DISCIPLINA,
+    TIPOS_DISCIPLINA,
+    curso_de_dict,
+    curso_para_dict,
+    disciplina_de_lista,
+    disciplina_para_lista,
+)
+
+class SnapshotStore:
+    """
+    Armazena em disco um retrato completo dos dados coletados.
+
+    O arquivo é um JSON compactado com gzip. Cada disciplina distinta é
+    gravada uma única vez numa tabela, e os cursos guardam apenas os
+    índices das suas disciplinas nessa tabela, o que mantém o arquivo
+    pequeno mesmo quando a mesma disciplina aparece em muitos cursos.
+    Opcionalmente guarda também os hashes das páginas de grade usados
+    pela coleta incremental.
+
+    Attributes:
+        caminho: Caminho do arquivo de snapshot
+    """
+
+    VERSAO = 1
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+
+    def existe(self) -> bool:
+        """Indica se já há um snapshot gravado no caminho configurado."""
+        return os.path.exists(self.caminho)
+
+    def salvar(
+        self,
+        unidades: List[Unidade],
+        hashes: Optional[Dict[Tuple[str, str], str]] = None
+    ) -> None:
+        """
+        Grava as unidades, cursos e disciplinas no arquivo de snapshot.
+
+        Args:
+            unidades: Lista de unidades coletadas
+            hashes: Hash da grade de cada curso por (código da unidade, código do curso)
+        """
+        tabela: List[List[Any]] = []
+        indices: Dict[Tuple[Any, ...], int] = {}
+
+        def indice_de(disciplina: Disciplina) -> int:
+            valores = disciplina_para_lista(disciplina)
+            chave = tuple(valores)
+            if chave not in indices:
+                indices[chave] = len(tabela)
+                tabela.append(valores)
+            return indices[chave]
+
+        dados_unidades = []
+        for unidade in unidades:
+            dados_unidade = {c.name: getattr(unidade, c.name) for c in fields(unidade) if c.name != "cursos"}
+            dados_unidade["cursos"] = []
+            for curso in unidade.cursos:
+                dados_curso = curso_para_dict(curso)
+                for tipo in TIPOS_DISCIPLINA:
+                    dados_curso[tipo] = [indice_de(d) for d in getattr(curso, tipo)]
+                dados_unidade["cursos"].append(dados_curso)
+            dados_unidades.append(dados_unidade)
+
+        conteudo = {
+            "versao": self.VERSAO,
+            "gerado_em": datetime.now().isoformat(timespec="seconds"),
+            "campos_disciplina": CAMPOS_DISCIPLINA,
+            "disciplinas": tabela,
+            "unidades": dados_unidades,
+            "hashes_grade": [[u, c, h] for (u, c), h in (hashes or {}).items()],
+        }
+
+        diretorio = os.path.dirname(self.caminho)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+        temporario = f"{self.caminho}.tmp"
+        with gzip.open(temporario, "wt", encoding="utf-8") as arquivo:
+            json.dump(conteudo, arquivo, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temporario, self.caminho)
+
+    def carregar(self) -> List[Unidade]:
+        """
+        Lê o arquivo de snapshot e reconstrói as unidades.
+
+        Disciplinas idênticas em cursos diferentes passam a ser o mesmo objeto.
+
+        Returns:
+            Lista de unidades com cursos e disciplinas
+
+        Raises:
+            ValueError: Se o arquivo não estiver num formato reconhecido
+        """
+        conteudo = self._ler()
+
+        disciplinas = [disciplina_de_lista(valores) for valores in conteudo["disciplinas"]]
+
+        unidades = []
+        for dados_unidade in conteudo["unidades"]:
+            cursos: List[Curso] = []
+            for dados_curso in dados_unidade["cursos"]:
+                referencias = {tipo: dados_curso.pop(tipo, []) for tipo in TIPOS_DISCIPLINA}
+                curso = curso_de_dict(dados_curso)
+                for tipo, indices in referencias.items():
+                    setattr(curso, tipo, [disciplinas[i] for i in indices])
+                cursos.append(curso)
+            dados_unidade["cursos"] = cursos
+            unidades.append(Unidade(**dados_unidade))
+
+        return unidades
+
+    def carregar_hashes(self) -> Dict[Tuple[str, str], str]:
+        """
+        Lê os hashes das páginas de grade gravados junto com o snapshot.
+
+        Returns:
+            Dicionário de hashes por (código da unidade, código do curso)
+        """
+        conteudo = self._ler()
+        return {(u, c): h for u, c, h in conteudo.get("hashes_grade", [])}
+
+    def _ler(self) -> Dict[str, Any]:
+        """
+        Lê e valida o conteúdo bruto do arquivo de snapshot.
+
+        Raises:
+            ValueError: Se o arquivo não estiver num formato reconhecido
+        """
+        with gzip.open(self.caminho, "rt", encoding="utf-8") as arquivo:
+            conteudo = json.load(arquivo)
+
+        if conteudo.get("versao") != self.VERSAO:
+            raise ValueError(f"Versão de snapshot não suportada: {conteudo.get('versao')}")
+        if conteudo.get("campos_disciplina") != CAMPOS_DISCIPLINA:
+            raise ValueError("Campos de disciplina do snapshot não correspondem ao modelo atual")
+        return conteudo
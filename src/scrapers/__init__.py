@@ -5,5 +5,13 @@ Contém as implementações de web scrapers para coleta de dados.
 """
 
 from .jupiter_scraper import JupiterScraper
+from .jupiter_http_scraper import JupiterHttpScraper
+from .limitador import LimitadorRequisicoes
+from .pool_scrapers import PoolScrapers
 
-__all__ = ['JupiterScraper']
\ No newline at end of file
+__all__ = [
+    'JupiterScraper',
+    'JupiterHttpScraper',
+    'LimitadorRequisicoes',
+    'PoolScrapers'
+]
\ No newline at end of file
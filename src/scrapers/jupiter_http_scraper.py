@@ -0,0 +1,239 @@
+from contextlib import nullcontext
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin
+import requests
+from bs4 import BeautifulSoup
+from ..interfaces.scraper import WebScraper
+from ..parsers.classificador import PAGINA_ERRO, classificar_pagina, pagina_bloqueada
+from .limitador import LimitadorRequisicoes
+
+class JupiterHttpScraper(WebScraper):
+    """
+    Implementação do scraper para o sistema Jupiter usando apenas HTTP.
+
+    Em vez de controlar um navegador, faz diretamente as mesmas requisições
+    que o JavaScript da página de carreiras dispara para preencher os combos
+    de unidade e curso e para carregar a grade curricular. O HTML devolvido
+    é o mesmo consumido pelo JupiterParser.
+
+    Attributes:
+        base_url: URL base do JupiterWeb (pode apontar para um servidor local)
+        session: Sessão HTTP reaproveitada entre as requisições
+        timeout: Tempo máximo de espera por resposta (em segundos)
+        limitador: Controle de ritmo compartilhado, consultado antes de cada requisição (opcional)
+    """
+
+    BASE_URL = "https://uspdigital.usp.br/jupiterweb/"
+    PAGINA_INICIAL = "jupCarreira.jsp?codmnu=8275"
+    ENDPOINT_CURSOS = "carregarCursos"
+    ENDPOINT_GRADE = "listarGradeCurricular"
+    TIMEOUT = 30
+    USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) usp-cursos-scraper"
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: float = TIMEOUT,
+        limitador: Optional[LimitadorRequisicoes] = None
+    ):
+        """
+        Inicializa o scraper.
+
+        Args:
+            base_url: URL base do JupiterWeb. Se None, usa o endereço oficial.
+            timeout: Tempo máximo de espera por resposta (em segundos)
+            limitador: Limitador de requisições compartilhado entre os scrapers (opcional)
+        """
+        self.base_url = base_url or self.BASE_URL
+        if not self.base_url.endswith("/"):
+            self.base_url += "/"
+        self.timeout = timeout
+        self.limitador = limitador
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": self.USER_AGENT})
+        self._html_inicial: Optional[str] = None
+        self._unidade_atual: Optional[str] = None
+        self._html_cursos: Optional[str] = None
+
+    def _get(self, caminho: str, **params) -> str:
+        """
+        Faz uma requisição GET relativa à URL base.
+
+        Args:
+            caminho: Caminho relativo do endpoint
+            **params: Parâmetros da query string
+
+        Returns:
+            Corpo da resposta como texto
+
+        Raises:
+            requests.RequestException: Se a requisição falhar ou o firewall bloquear o acesso
+        """
+        with self.limitador.requisicao() if self.limitador else nullcontext():
+            resposta = self.session.get(
+                urljoin(self.base_url, caminho),
+                params=params or None,
+                timeout=self.timeout
+            )
+            resposta.raise_for_status()
+            if pagina_bloqueada(resposta.text):
+                if self.limitador:
+                    self.limitador.sinalizar_bloqueio()
+                raise requests.RequestException("Acesso bloqueado pelo firewall do Jupiter")
+        self.carregamentos_pagina += 1
+        self.bytes_recebidos += len(resposta.content)
+        return resposta.text
+
+    @staticmethod
+    def _extrair_opcoes(html: str, id_combo: Optional[str] = None) -> List[Tuple[str, str]]:
+        """
+        Extrai as opções (valor, texto) de um combo HTML.
+
+        Args:
+            html: HTML contendo as tags option
+            id_combo: ID do select a ser lido. Se None, lê todas as opções.
+
+        Returns:
+            Lista de tuplas (código, nome), ignorando opções sem valor
+
+        Raises:
+            requests.RequestException: Se a resposta não contém o combo ou nenhuma opção
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        raiz = soup.find("select", id=id_combo) if id_combo else soup
+        opcoes = raiz.find_all("option") if raiz else []
+        if not opcoes:
+            alvo = f"o combo #{id_combo}" if id_combo else "opções de combo"
+            raise requests.RequestException(f"Resposta do Jupiter sem {alvo}: {html[:200]!r}")
+        return [
+            (option.get("value"), option.get_text(strip=True))
+            for option in opcoes
+            if option.get("value")
+        ]
+
+    def acessar_pagina_inicial(self) -> None:
+        """
+        Acessa a página inicial do sistema Jupiter, abrindo a sessão.
+
+        Raises:
+            requests.RequestException: Se não for possível acessar a página
+        """
+        self._html_inicial = self._get(self.PAGINA_INICIAL)
+
+    def obter_unidades(self) -> List[Tuple[str, str]]:
+        """
+        Obtém a lista de unidades disponíveis.
+
+        Returns:
+            Lista de tuplas (código, nome) das unidades
+
+        Raises:
+            requests.RequestException: Se a página inicial não pôde ser obtida ou não tem o combo de unidades
+        """
+        if self._html_inicial is None:
+            self.acessar_pagina_inicial()
+        return self._extrair_opcoes(self._html_inicial, "comboUnidade")
+
+    def selecionar_unidade(self, codigo: str) -> None:
+        """
+        Seleciona uma unidade, carregando a lista de cursos correspondente.
+
+        Args:
+            codigo: Código da unidade
+        """
+        self._html_cursos = self._get(self.ENDPOINT_CURSOS, codcg=codigo)
+        self._unidade_atual = codigo
+
+    def obter_cursos(self) -> List[Tuple[str, str]]:
+        """
+        Obtém a lista de cursos da unidade selecionada.
+
+        Returns:
+            Lista de tuplas (código, nome) dos cursos
+
+        Raises:
+            requests.RequestException: Se a resposta do endpoint de cursos não tem opções
+        """
+        if self._html_cursos is None:
+            return []
+        return self._extrair_opcoes(self._html_cursos)
+
+    def acessar_grade_curso(self, codigo_curso: str) -> Optional[str]:
+        """
+        Obtém a grade curricular de um curso da unidade selecionada.
+
+        Args:
+            codigo_curso: Código do curso no formato do combo ("codcur-codhab")
+
+        Returns:
+            HTML da grade curricular ou None se não houver dados
+
+        Raises:
+            requests.RequestException: Se a requisição falhar
+        """
+        codcur, _, codhab = codigo_curso.partition("-")
+        html = self._get(
+            self.ENDPOINT_GRADE,
+            codcg=self._unidade_atual,
+            codcur=codcur,
+            codhab=codhab or "0",
+            tipo="N"
+        )
+
+        if classificar_pagina(html) == PAGINA_ERRO:
+            print(f"Erro ao acessar grade do curso: {codigo_curso}")
+            return None
+        return html
+
+    def voltar_para_cursos(self, codigo_unidade: str) -> None:
+        """
+        Garante que a unidade informada está selecionada.
+        
+        Como cada grade é obtida por uma requisição independente, não é
+        preciso voltar à página inicial entre um curso e outro.
+        
+        Args:
+            codigo_unidade: Código da unidade cujos cursos serão acessados
+        """
+        if self._unidade_atual != codigo_unidade:
+            self.selecionar_unidade(codigo_unidade)
+
+    def fechar(self) -> None:
+        """
+        Fecha a sessão HTTP e libera recursos.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        """
+        Permite uso do scraper com context manager.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Garante que a sessão será fechada ao sair do context manager.
+        """
+        self.fechar()
+
+    # Métodos implementados para satisfazer a interface WebScraper
+
+    def listar_unidades_urls(self) -> List[str]:
+        """
+        Retorna uma lista de códigos das unidades que serão usadas para navegar.
+        """
+        self.acessar_pagina_inicial()
+        return [codigo for codigo, nome in self.obter_unidades()]
+
+    def obter_html(self, codigo_unidade: str) -> str:
+        """
+        Seleciona a unidade pelo código e retorna o HTML com seus cursos.
+
+        Args:
+            codigo_unidade: Código da unidade a ser selecionada.
+
+        Returns:
+            HTML devolvido pelo endpoint de cursos da unidade.
+        """
+        self.selecionar_unidade(codigo_unidade)
+        return self._html_cursos
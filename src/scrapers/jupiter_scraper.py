@@ -1,13 +1,23 @@
-from typing import List, Tuple
+import itertools
+import os
+import threading
+from contextlib import nullcontext
+from typing import ContextManager, Dict, List, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException 
 import chromedriver_autoinstaller
-import time
+try:
+    import psutil
+except ImportError:  # psutil é opcional, usado apenas para medir memória
+    psutil = None
 from ..interfaces.scraper import WebScraper
+from ..parsers.classificador import pagina_bloqueada
+from .limitador import LimitadorRequisicoes
+from .prontidao import Prontidao
 
 class JupiterScraper(WebScraper):
     """
@@ -17,28 +27,97 @@ class JupiterScraper(WebScraper):
     
     Attributes:
         driver: Instância do WebDriver
-        wait_time: Tempo máximo de espera para elementos (em segundos)
+        prontidao: Camada de espera por eventos, com tempos limite adaptativos
+        perfil_enxuto: Se o navegador foi iniciado com o perfil enxuto
+        limitador: Controle de ritmo compartilhado, consultado antes de cada requisição (opcional)
+        posicao_cache: Subdiretório (navegador-<posição>) usado no cache em disco, se houver
     """
 
     BASE_URL = "https://uspdigital.usp.br/jupiterweb/jupCarreira.jsp?codmnu=8275"
-    WAIT_TIME = 0.1
+    TIMEOUT_MINIMO = 2.0
+    TIMEOUT_MAXIMO = 30.0
 
-    def __init__(self, headless: bool = True):
+    # Recursos que não influenciam a grade e são bloqueados no perfil enxuto.
+    # As folhas de estilo continuam liberadas: a visibilidade das abas e do
+    # popup de erro, usada nas esperas, depende delas.
+    URLS_BLOQUEADAS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf",
+    ]
+    ARGUMENTOS_ENXUTOS = [
+        "--disable-extensions",
+        "--disable-gpu",
+        "--disable-background-networking",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--no-first-run",
+        "--mute-audio",
+        "--blink-settings=imagesEnabled=false",
+    ]
+
+    # Posições de cache em disco ocupadas pelos navegadores abertos neste processo
+    _posicoes_cache: set = set()
+    _trava_cache = threading.Lock()
+
+    # Devolve apenas os trechos usados pelo parser: spans de duração e a grade
+    SCRIPT_RECORTE_GRADE = """
+        var partes = [];
+        document.querySelectorAll('span.duridlhab, span.durminhab, span.durmaxhab')
+            .forEach(function (span) { partes.push(span.outerHTML); });
+        var grade = document.getElementById('gradeCurricular');
+        if (grade) { partes.push(grade.outerHTML); }
+        return partes.join('');
+    """
+
+    # Limpa o resultado da busca anterior: a grade exibida, o popup de erro
+    # (com a janela de diálogo que o envolve) e o link da grade curricular
+    SCRIPT_LIMPAR_RESULTADO = """
+        var grade = document.getElementById('gradeCurricular');
+        if (grade) { grade.innerHTML = ''; }
+        var erro = document.getElementById('err');
+        if (erro) { (erro.closest('.ui-dialog') || erro).remove(); }
+        document.querySelectorAll('a').forEach(function (link) {
+            if (link.textContent.trim() === 'Grade curricular') { link.remove(); }
+        });
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        perfil_enxuto: bool = False,
+        diretorio_cache: Optional[str] = None,
+        limitador: Optional[LimitadorRequisicoes] = None
+    ):
         """
         Inicializa o scraper.
         
         Args:
             headless: Se True, executa o navegador em modo headless (sem interface gráfica)
+            perfil_enxuto: Se True, bloqueia imagens, fontes e plugins (não o CSS), desativa extensões
+                e GPU e usa carregamento "eager"
+            diretorio_cache: Diretório base do cache em disco; cada navegador usa
+                um subdiretório próprio dentro dele (opcional)
+            limitador: Limitador de requisições compartilhado entre os scrapers (opcional)
         """
-        self.driver = self._iniciar_driver(headless)
-        self.wait = WebDriverWait(self.driver, self.WAIT_TIME)
+        self.perfil_enxuto = perfil_enxuto
+        self.limitador = limitador
+        self.posicao_cache: Optional[int] = None
+        self.driver = self._iniciar_driver(headless, perfil_enxuto, diretorio_cache)
+        self.prontidao = Prontidao(self.driver, self.TIMEOUT_MINIMO, self.TIMEOUT_MAXIMO)
 
-    def _iniciar_driver(self, headless: bool) -> webdriver.Chrome:
+    def _iniciar_driver(
+        self,
+        headless: bool,
+        perfil_enxuto: bool = False,
+        diretorio_cache: Optional[str] = None
+    ) -> webdriver.Chrome:
         """
         Inicializa e configura o Chrome WebDriver.
         
         Args:
             headless: Se True, executa em modo headless
+            perfil_enxuto: Se True, aplica o perfil de navegador enxuto
+            diretorio_cache: Diretório base do cache em disco (opcional)
             
         Returns:
             Instância configurada do Chrome WebDriver
@@ -48,7 +127,83 @@ class JupiterScraper(WebScraper):
         if headless:
             options.add_argument("--headless")
         options.add_argument("--window-size=1920,1080")
-        return webdriver.Chrome(options=options)
+        if diretorio_cache:
+            # O Chrome não compartilha um cache em disco entre instâncias
+            # simultâneas: cada navegador aberto ocupa a menor posição livre,
+            # e um navegador que o substitua herda o cache dessa posição
+            with self._trava_cache:
+                self.posicao_cache = next(
+                    posicao for posicao in itertools.count() if posicao not in self._posicoes_cache
+                )
+                self._posicoes_cache.add(self.posicao_cache)
+            subdiretorio = f"navegador-{self.posicao_cache}"
+            options.add_argument(f"--disk-cache-dir={os.path.join(diretorio_cache, subdiretorio)}")
+
+        if perfil_enxuto:
+            for argumento in self.ARGUMENTOS_ENXUTOS:
+                options.add_argument(argumento)
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.plugins": 2,
+            })
+            # Devolve o controle assim que o DOM estiver pronto, sem esperar recursos
+            options.page_load_strategy = "eager"
+
+        try:
+            driver = webdriver.Chrome(options=options)
+        except Exception:
+            self._liberar_posicao_cache()
+            raise
+        if perfil_enxuto:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.URLS_BLOQUEADAS})
+        return driver
+
+    def _requisicao(self) -> ContextManager[None]:
+        """
+        Reserva no limitador, se houver, a requisição disparada dentro do bloco with.
+        """
+        return self.limitador.requisicao() if self.limitador else nullcontext()
+
+    def _sinalizar_bloqueio(self) -> None:
+        """
+        Repassa ao limitador a página de bloqueio e interrompe a etapa atual.
+        
+        Raises:
+            WebDriverException: Sempre, para que a etapa seja tentada de novo depois
+        """
+        if self.limitador:
+            self.limitador.sinalizar_bloqueio()
+        raise WebDriverException("Acesso bloqueado pelo firewall do Jupiter")
+
+    def esta_ativo(self) -> bool:
+        """
+        Verifica se a sessão do navegador ainda responde.
+        
+        Returns:
+            True se o driver executou um script trivial com sucesso
+        """
+        try:
+            return self.driver.execute_script("return 1;") == 1
+        except WebDriverException:
+            return False
+
+    def memoria_navegador(self) -> Optional[int]:
+        """
+        Mede a memória residente (RSS) do Chrome e de todos os seus subprocessos.
+        
+        Returns:
+            Memória em bytes, ou None se o psutil não estiver instalado
+            ou o processo não puder ser inspecionado
+        """
+        if psutil is None:
+            return None
+        try:
+            processo = psutil.Process(self.driver.service.process.pid)
+            arvore = [processo, *processo.children(recursive=True)]
+            return sum(p.memory_info().rss for p in arvore if p.is_running())
+        except (psutil.Error, AttributeError):
+            return None
 
     def acessar_pagina_inicial(self) -> None:
         """
@@ -58,10 +213,16 @@ class JupiterScraper(WebScraper):
             WebDriverException: Se não for possível acessar a página
         """
         try:
-            self.driver.get(self.BASE_URL)
-            self.wait.until(EC.element_to_be_clickable((By.ID, "comboUnidade")))
-            seletor = Select(self.driver.find_element(By.ID, "comboUnidade"))
-            self.wait.until(lambda _: len(seletor.options) > 1)
+            with self._requisicao():
+                self.driver.get(self.BASE_URL)
+                self.carregamentos_pagina += 1
+                resultado = self.prontidao.aguardar("pagina_inicial", {
+                    "unidades": lambda driver: EC.element_to_be_clickable((By.ID, "comboUnidade"))(driver)
+                    and len(Select(driver.find_element(By.ID, "comboUnidade")).options) > 1,
+                    "bloqueio": lambda driver: pagina_bloqueada(driver.title)
+                })
+                if resultado == "bloqueio":
+                    self._sinalizar_bloqueio()
         except TimeoutException as e:
             raise WebDriverException(f"Erro ao acessar página inicial: {e}")
 
@@ -96,11 +257,20 @@ class JupiterScraper(WebScraper):
             WebDriverException: Se não for possível selecionar a unidade
         """
         try:
+            opcoes_anteriores = self.driver.find_element(By.ID, "comboCurso").find_elements(By.TAG_NAME, "option")
             seletor = Select(self.driver.find_element(By.ID, "comboUnidade"))
-            seletor.select_by_value(codigo)
 
-            seletor_cursos = Select(self.driver.find_element(By.ID, "comboCurso"))
-            self.wait.until(lambda _: len(seletor_cursos.options) > 1)
+            # Espera o combo ser repreenchido, e não apenas conter as opções da unidade anterior
+            def cursos_carregados(driver) -> bool:
+                combo = Select(driver.find_element(By.ID, "comboCurso"))
+                if len(combo.options) <= 1:
+                    return False
+                return len(opcoes_anteriores) <= 1 or EC.staleness_of(opcoes_anteriores[-1])(driver)
+
+            # A troca de unidade dispara a requisição que carrega os cursos
+            with self._requisicao():
+                seletor.select_by_value(codigo)
+                self.prontidao.aguardar("combo_cursos", {"cursos": cursos_carregados})
         except Exception as e:
             raise WebDriverException(f"Erro ao selecionar unidade: {e}")
 
@@ -133,24 +303,21 @@ class JupiterScraper(WebScraper):
             
         Returns:
             HTML da página da grade curricular ou None se não houver dados
-        """
-        try:
-            self.selecionar_curso(codigo_curso)
-            self.clicar_buscar()
-            
-            # Verifica se existe popup de erro
-            try:
-                popup = self.driver.find_element(By.ID, "err")
-                print(f"Erro ao acessar grade do curso: {codigo_curso}")
-                return None
-            except NoSuchElementException:
-                pass  # Se não encontrou popup, continua normalmente
             
-            return self.acessar_aba_grade_curricular()
-            
-        except Exception as e:
-            print(f"Erro ao acessar grade do curso: {e}")
+        Raises:
+            WebDriverException: Se a busca ou a aba da grade não carregaram
+        """
+        self.selecionar_curso(codigo_curso)
+        resultado = self.clicar_buscar()
+        
+        # O popup de erro indica que o curso não tem grade disponível
+        if resultado == "erro":
+            print(f"Erro ao acessar grade do curso: {codigo_curso}")
             return None
+        if resultado != "grade":
+            raise WebDriverException(f"Busca do curso {codigo_curso} não terminou")
+        
+        return self.acessar_aba_grade_curricular()
 
     def selecionar_curso(self, codigo_curso: str) -> None:
         """
@@ -162,56 +329,143 @@ class JupiterScraper(WebScraper):
         seletor = Select(self.driver.find_element(By.ID, "comboCurso"))
         seletor.select_by_value(codigo_curso)
 
-    def clicar_buscar(self) -> None:
+    def clicar_buscar(self) -> str:
         """
         Clica no botão de buscar e aguarda carregamento.
+        
+        Espera ao mesmo tempo pelo popup de erro e pelo link da grade,
+        retornando assim que um dos dois aparecer. Um popup ou link que
+        já estava na página antes do clique (resultado da busca anterior)
+        só é aceito depois de ser substituído.
+        
+        Returns:
+            "erro" se apareceu o popup de erro, "grade" se apareceu o link
+            da grade curricular ou "falha" se nenhum dos dois apareceu
+            dentro do tempo limite
+            
+        Raises:
+            WebDriverException: Se a página de bloqueio apareceu ou o navegador falhou
         """
         try:
-            botao = self.wait.until(EC.element_to_be_clickable((By.ID, "enviar")))
-            botao.click()
-            
-            # Verifica se há popup de erro
-            try:
-                popup = self.wait.until(EC.presence_of_element_located((By.ID, "err")))
-                return
-            except TimeoutException:
-                pass
-            
-            # Se não houver popup, espera pelo link da grade
-            self.wait.until(
-                EC.element_to_be_clickable((By.LINK_TEXT, "Grade curricular"))
+            self.prontidao.aguardar("botao_buscar", {
+                "botao": EC.element_to_be_clickable((By.ID, "enviar"))
+            })
+            anteriores = (
+                self.driver.find_elements(By.ID, "err")
+                + self.driver.find_elements(By.LINK_TEXT, "Grade curricular")
             )
+            with self._requisicao():
+                self.driver.find_element(By.ID, "enviar").click()
+                self.carregamentos_pagina += 1
+                
+                resultado = self.prontidao.aguardar("resultado_busca", {
+                    "erro": self._apos_substituir(anteriores, EC.presence_of_element_located((By.ID, "err"))),
+                    "grade": self._apos_substituir(
+                        anteriores, EC.element_to_be_clickable((By.LINK_TEXT, "Grade curricular"))
+                    ),
+                    "bloqueio": lambda driver: pagina_bloqueada(driver.title)
+                })
+                if resultado == "bloqueio":
+                    self._sinalizar_bloqueio()
+                return resultado
             
-        except Exception as e:
+        except TimeoutException as e:
             print(f"Erro ao clicar em buscar: {e}")
-            return False
+            return "falha"
+
+    @staticmethod
+    def _apos_substituir(anteriores: list, condicao):
+        """
+        Restringe uma condição de espera aos elementos novos.
+        
+        Args:
+            anteriores: Elementos presentes antes da ação aguardada
+            condicao: Condição de espera do Selenium
+            
+        Returns:
+            Condição que só é avaliada depois que todos os elementos
+            anteriores saíram da página
+        """
+        def condicao_nova(driver):
+            if any(not EC.staleness_of(elemento)(driver) for elemento in anteriores):
+                return False
+            return condicao(driver)
+        return condicao_nova
 
     def acessar_aba_grade_curricular(self) -> str:
         """
         Acessa a aba de grade curricular e retorna seu HTML.
+        
+        Em vez do page_source completo (cabeçalhos, scripts e outras abas),
+        devolve só os spans de duração e o outerHTML de #gradeCurricular.
         """
         try:
-            # Espera explícita pelo link da grade
-            link = self.wait.until(
-                EC.element_to_be_clickable((By.LINK_TEXT, "Grade curricular"))
-            )
-            link.click()
+            self.driver.find_element(By.LINK_TEXT, "Grade curricular").click()
             
             # Espera pela presença do elemento da grade
-            self.wait.until(
-                lambda driver: len(driver.find_elements(By.CSS_SELECTOR, "#gradeCurricular table")) > 0
-            )
+            self.prontidao.aguardar("tabela_grade", {
+                "tabela": lambda driver: len(driver.find_elements(By.CSS_SELECTOR, "#gradeCurricular table")) > 0
+            })
             
-            return self.driver.page_source
+            html = self.driver.execute_script(self.SCRIPT_RECORTE_GRADE)
+            self.bytes_recebidos += len(html.encode("utf-8"))
+            return html
         except Exception as e:
             raise WebDriverException(f"Erro ao acessar aba grade curricular: {e}")
     
+    def voltar_para_cursos(self, codigo_unidade: str) -> None:
+        """
+        Volta ao seletor de cursos sem recarregar a página, quando possível.
+        
+        Se o formulário de busca continua visível, apenas troca a unidade
+        (se necessário) e remove o resultado exibido (grade, popup de erro
+        e link da grade), para que a espera pela próxima busca não seja
+        satisfeita por elementos do curso anterior. Caso contrário,
+        recarrega a página inicial.
+        
+        Args:
+            codigo_unidade: Código da unidade cujos cursos serão acessados
+        """
+        try:
+            combo_unidade = self.driver.find_element(By.ID, "comboUnidade")
+            combo_curso = self.driver.find_element(By.ID, "comboCurso")
+            if combo_unidade.is_displayed() and combo_curso.is_displayed():
+                selecionada = Select(combo_unidade).first_selected_option.get_attribute("value")
+                if selecionada != codigo_unidade:
+                    self.selecionar_unidade(codigo_unidade)
+                self.driver.execute_script(self.SCRIPT_LIMPAR_RESULTADO)
+                return
+        except (NoSuchElementException, WebDriverException):
+            pass
+
+        self.acessar_pagina_inicial()
+        self.selecionar_unidade(codigo_unidade)
+
+    def resumo_esperas(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Retorna o tempo gasto esperando em cada etapa da navegação.
+        
+        Returns:
+            Dicionário etapa -> (quantidade de esperas, tempo total em segundos)
+        """
+        return self.prontidao.resumo()
+
     def fechar(self) -> None:
         """
         Fecha o navegador e libera recursos.
         """
         if self.driver:
             self.driver.quit()
+        self._liberar_posicao_cache()
+
+    def _liberar_posicao_cache(self) -> None:
+        """
+        Devolve a posição de cache em disco deste navegador, se houver.
+        """
+        if self.posicao_cache is not None:
+            with self._trava_cache:
+                self._posicoes_cache.discard(self.posicao_cache)
+            self.posicao_cache = None
 
     def __enter__(self):
         """
@@ -250,5 +504,6 @@ class JupiterScraper(WebScraper):
         """
         self.acessar_pagina_inicial()
         self.selecionar_unidade(codigo_unidade)
-        time.sleep(0.2)  # Pequena espera para garantir o carregamento da página
-        return self.driver.page_source
\ No newline at end of file
+        html = self.driver.page_source
+        self.bytes_recebidos += len(html.encode("utf-8"))
+        return html
\ No newline at end of file
@@ -0,0 +1,183 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+class LimitadorRequisicoes:
+    """
+    Controle global do ritmo de requisições ao Jupiter, compartilhado por todos os scrapers.
+
+    Combina um token bucket, que limita a taxa média de requisições
+    (permitindo rajadas curtas), com um limite adaptativo de requisições
+    simultâneas no esquema AIMD: cada requisição rápida e bem-sucedida
+    aumenta o limite em 1/limite (cerca de +1 por "janela"), enquanto uma
+    falha ou latência acima do alvo o multiplica por fator_reducao. Uma
+    página de bloqueio reduz também a taxa e suspende novas requisições
+    por pausa_bloqueio segundos; a taxa volta a crescer aos poucos depois.
+
+    Attributes:
+        taxa_maxima: Requisições por segundo permitidas quando não há sinais de sobrecarga
+        taxa: Taxa atual de requisições por segundo
+        rajada: Quantidade máxima de fichas acumuladas no balde
+        concorrencia_minima: Menor limite de requisições simultâneas
+        concorrencia_maxima: Maior limite de requisições simultâneas
+        limite: Limite atual de requisições simultâneas (fracionário)
+        latencia_alvo: Latência (em segundos) acima da qual a concorrência é reduzida
+        fator_reducao: Fator multiplicativo aplicado ao limite e à taxa nas reduções
+        pausa_bloqueio: Tempo sem requisições após uma página de bloqueio (em segundos)
+        requisicoes: Requisições liberadas até agora
+        tempo_espera: Tempo total que as requisições aguardaram o limitador (em segundos)
+        reducoes: Quantidade de reduções multiplicativas
+        bloqueios: Páginas de bloqueio sinalizadas
+    """
+
+    def __init__(
+        self,
+        taxa: float = 4.0,
+        rajada: Optional[float] = None,
+        concorrencia_maxima: int = 4,
+        concorrencia_minima: int = 1,
+        latencia_alvo: float = 5.0,
+        fator_reducao: float = 0.5,
+        pausa_bloqueio: float = 30.0
+    ):
+        self.taxa_maxima = taxa
+        self.taxa = taxa
+        self.rajada = rajada if rajada is not None else max(1.0, taxa)
+        self.concorrencia_minima = max(1, concorrencia_minima)
+        self.concorrencia_maxima = max(self.concorrencia_minima, concorrencia_maxima)
+        self.limite = float(self.concorrencia_maxima)
+        self.latencia_alvo = latencia_alvo
+        self.fator_reducao = fator_reducao
+        self.pausa_bloqueio = pausa_bloqueio
+        self.requisicoes = 0
+        self.tempo_espera = 0.0
+        self.reducoes = 0
+        self.bloqueios = 0
+        self._fichas = self.rajada
+        self._ultima_reposicao = time.monotonic()
+        self._em_andamento = 0
+        self._pausado_ate = 0.0
+        self._ultima_reducao = 0.0
+        self._condicao = threading.Condition()
+
+    @contextmanager
+    def requisicao(self) -> Iterator[None]:
+        """
+        Reserva uma vaga e uma ficha antes de uma requisição e mede seu resultado.
+
+        O bloco with deve envolver a ação que dispara a requisição e a espera
+        pela resposta. Uma exceção dentro do bloco conta como falha.
+        """
+        inicio_espera = time.monotonic()
+        self._reservar()
+        inicio = time.monotonic()
+        sucesso = False
+        try:
+            yield
+            sucesso = True
+        finally:
+            self._liberar(time.monotonic() - inicio, sucesso, inicio - inicio_espera)
+
+    def _reservar(self) -> None:
+        """
+        Bloqueia até haver vaga de concorrência, ficha no balde e nenhuma pausa em curso.
+        """
+        with self._condicao:
+            while True:
+                agora = time.monotonic()
+                self._repor_fichas(agora)
+                if agora < self._pausado_ate:
+                    espera = self._pausado_ate - agora
+                elif self._em_andamento >= int(self.limite):
+                    espera = None  # Aguarda uma requisição terminar
+                elif self._fichas < 1:
+                    espera = (1 - self._fichas) / self.taxa
+                else:
+                    self._fichas -= 1
+                    self._em_andamento += 1
+                    self.requisicoes += 1
+                    return
+                self._condicao.wait(espera)
+
+    def _repor_fichas(self, agora: float) -> None:
+        """
+        Acrescenta ao balde as fichas acumuladas desde a última reposição.
+
+        Args:
+            agora: Instante atual (time.monotonic)
+        """
+        decorrido = agora - self._ultima_reposicao
+        self._fichas = min(self.rajada, self._fichas + decorrido * self.taxa)
+        self._ultima_reposicao = agora
+
+    def _liberar(self, latencia: float, sucesso: bool, espera: float) -> None:
+        """
+        Devolve a vaga e ajusta os limites conforme o resultado da requisição.
+
+        Args:
+            latencia: Duração da requisição (em segundos)
+            sucesso: Se a requisição terminou sem exceção
+            espera: Tempo que a requisição aguardou o limitador (em segundos)
+        """
+        with self._condicao:
+            self._em_andamento -= 1
+            self.tempo_espera += espera
+            if sucesso and latencia <= self.latencia_alvo:
+                self.limite = min(self.concorrencia_maxima, self.limite + 1 / self.limite)
+                self.taxa = min(self.taxa_maxima, self.taxa + self.taxa_maxima / (10 * self.taxa))
+            else:
+                self._reduzir(time.monotonic())
+            self._condicao.notify_all()
+
+    def _reduzir(self, agora: float, taxa_tambem: bool = False) -> None:
+        """
+        Aplica a redução multiplicativa, no máximo uma vez por latência alvo.
+
+        Várias requisições simultâneas costumam falhar pelo mesmo motivo;
+        reagir a todas derrubaria o limite de uma vez só.
+
+        Args:
+            agora: Instante atual (time.monotonic)
+            taxa_tambem: Se True, reduz também a taxa de requisições
+        """
+        if agora - self._ultima_reducao < self.latencia_alvo:
+            return
+        self._ultima_reducao = agora
+        self.reducoes += 1
+        self.limite = max(self.concorrencia_minima, self.limite * self.fator_reducao)
+        if taxa_tambem:
+            self.taxa = max(self.taxa_maxima / 20, self.taxa * self.fator_reducao)
+            self._fichas = min(self._fichas, 0.0)
+
+    def sinalizar_bloqueio(self) -> None:
+        """
+        Informa que o Jupiter devolveu a página de bloqueio.
+
+        Reduz concorrência e taxa e suspende todas as requisições por pausa_bloqueio segundos.
+        """
+        with self._condicao:
+            agora = time.monotonic()
+            self.bloqueios += 1
+            self._pausado_ate = max(self._pausado_ate, agora + self.pausa_bloqueio)
+            self._ultima_reducao = 0.0
+            self._reduzir(agora, taxa_tambem=True)
+            self._condicao.notify_all()
+
+    def resumo(self) -> Dict[str, float]:
+        """
+        Retorna o estado e a instrumentação do limitador.
+
+        Returns:
+            Dicionário com requisições, tempo de espera, reduções, bloqueios,
+            limite de concorrência e taxa atuais
+        """
+        with self._condicao:
+            return {
+                "requisicoes": self.requisicoes,
+                "tempo_espera": self.tempo_espera,
+                "reducoes": self.reducoes,
+                "bloqueios": self.bloqueios,
+                "limite": self.limite,
+                "taxa": self.taxa,
+            }
@@ -0,0 +1,237 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+from ..interfaces.scraper import WebScraper
+
+class PoolScrapers:
+    """
+    Pool de scrapers pré-aquecidos compartilhado pelos workers da coleta.
+
+    Os scrapers são criados (e têm a página inicial carregada) antes do
+    início da coleta. A cada empréstimo o pool verifica se a sessão ainda
+    responde e se o scraper já atingiu o limite de páginas ou de memória;
+    nesses casos ele é descartado e substituído por um novo, de forma
+    transparente para quem pediu o scraper.
+
+    Se a criação de um scraper falhar, a vaga fica livre e o pool tenta
+    preenchê-la de novo no próximo empréstimo, até voltar ao tamanho
+    definido; enquanto isso, os pedidos são atendidos pelos scrapers que
+    restam.
+
+    Um scraper já aberto por quem cria o pool (scraper_inicial) pode ocupar
+    uma das vagas, evitando abrir um navegador a mais. Ele é emprestado
+    como os demais, mas nunca é fechado pelo pool: ao ser reciclado ou no
+    fechamento, apenas deixa a vaga, e continua sob a responsabilidade do
+    seu dono.
+
+    Attributes:
+        fabrica: Função que cria um novo scraper
+        tamanho: Quantidade de scrapers mantidos no pool
+        max_paginas: Carregamentos de página após os quais o scraper é reciclado
+        max_memoria: Memória (em bytes) acima da qual o scraper é reciclado (opcional)
+        ao_descartar: Função chamada com cada scraper antes de ele ser fechado (opcional)
+        scraper_inicial: Scraper do chamador que ocupa uma das vagas (opcional)
+        recriados: Quantidade de scrapers substituídos desde a criação do pool
+    """
+
+    # Intervalo (em segundos) entre novas tentativas de repor vagas enquanto
+    # um empréstimo espera por um scraper disponível
+    ESPERA_REPOSICAO = 1.0
+
+    def __init__(
+        self,
+        fabrica: Callable[[], WebScraper],
+        tamanho: int,
+        max_paginas: int = 500,
+        max_memoria: Optional[int] = None,
+        ao_descartar: Optional[Callable[[WebScraper], None]] = None,
+        scraper_inicial: Optional[WebScraper] = None
+    ):
+        self.fabrica = fabrica
+        self.tamanho = max(1, tamanho)
+        self.max_paginas = max_paginas
+        self.max_memoria = max_memoria
+        self.ao_descartar = ao_descartar
+        self.scraper_inicial = scraper_inicial
+        self.recriados = 0
+        self._disponiveis: "queue.Queue[WebScraper]" = queue.Queue()
+        self._todos: List[WebScraper] = []
+        self._em_criacao = 0
+        self._trava = threading.Lock()
+        if scraper_inicial is not None:
+            self._todos.append(scraper_inicial)
+            self._disponiveis.put(scraper_inicial)
+
+    def aquecer(self) -> None:
+        """
+        Cria todos os scrapers do pool em paralelo, já com a página inicial carregada.
+        """
+        self._completar()
+
+    def _completar(self) -> Optional[Exception]:
+        """
+        Cria, em paralelo, os scrapers que faltam para o pool atingir seu tamanho.
+
+        Cada scraper criado vai para a fila de disponíveis; as vagas cujas
+        criações falharam continuam livres para a próxima tentativa.
+
+        Returns:
+            Último erro de criação, ou None se todas as criações deram certo
+        """
+        with self._trava:
+            faltam = self.tamanho - len(self._todos) - self._em_criacao
+            if faltam <= 0:
+                return None
+            self._em_criacao += faltam
+
+        def criar_vaga(_) -> Optional[Exception]:
+            try:
+                self._disponiveis.put(self._criar())
+                return None
+            except Exception as e:
+                print(f"Aviso: falha ao criar scraper do pool: {e}")
+                return e
+            finally:
+                with self._trava:
+                    self._em_criacao -= 1
+
+        with ThreadPoolExecutor(max_workers=faltam) as executor:
+            erros = [erro for erro in executor.map(criar_vaga, range(faltam)) if erro]
+        return erros[-1] if erros else None
+
+    def _criar(self) -> WebScraper:
+        """
+        Cria um scraper, carrega a página inicial e o registra no pool.
+
+        Returns:
+            Scraper pronto para uso
+        """
+        scraper = self.fabrica()
+        try:
+            scraper.acessar_pagina_inicial()
+        except Exception as e:
+            # A primeira navegação do worker fará o carregamento completo
+            print(f"Aviso: falha ao aquecer scraper: {e}")
+        with self._trava:
+            self._todos.append(scraper)
+        return scraper
+
+    def _descartar(self, scraper: WebScraper) -> None:
+        """
+        Remove o scraper do pool e fecha seus recursos.
+
+        O scraper_inicial apenas deixa a vaga: quem o criou continua usando-o
+        e é responsável por fechá-lo.
+
+        Args:
+            scraper: Scraper a ser descartado
+        """
+        with self._trava:
+            if scraper in self._todos:
+                self._todos.remove(scraper)
+        if scraper is self.scraper_inicial:
+            self.scraper_inicial = None
+            return
+        if self.ao_descartar:
+            self.ao_descartar(scraper)
+        try:
+            scraper.fechar()
+        except Exception:
+            pass  # A sessão pode já estar morta
+
+    def _precisa_reciclar(self, scraper: WebScraper) -> bool:
+        """
+        Verifica se o scraper deve ser substituído antes do próximo uso.
+
+        Args:
+            scraper: Scraper a verificar
+
+        Returns:
+            True se a sessão morreu ou algum limite de uso foi atingido
+        """
+        if not scraper.esta_ativo():
+            return True
+        if scraper.carregamentos_pagina >= self.max_paginas:
+            return True
+        if self.max_memoria is not None:
+            memoria = scraper.memoria_navegador()
+            if memoria is not None and memoria > self.max_memoria:
+                return True
+        return False
+
+    def adquirir(self) -> WebScraper:
+        """
+        Retira um scraper saudável do pool, substituindo-o se necessário.
+
+        Antes do empréstimo, repõe as vagas deixadas por criações que
+        falharam. Um scraper que precisa ser reciclado é descartado e a sua
+        vaga é reposta da mesma forma.
+
+        Returns:
+            Scraper pronto para uso
+
+        Raises:
+            RuntimeError: Se o pool ficou sem nenhum scraper e não foi possível criar outro
+        """
+        while True:
+            erro = self._completar()
+            with self._trava:
+                vazio = not self._todos and not self._em_criacao
+            if vazio and self._disponiveis.empty():
+                raise RuntimeError("Não foi possível criar nenhum scraper para o pool") from erro
+
+            try:
+                scraper = self._disponiveis.get(timeout=self.ESPERA_REPOSICAO)
+            except queue.Empty:
+                continue
+            if not self._precisa_reciclar(scraper):
+                return scraper
+            self._descartar(scraper)
+            with self._trava:
+                self.recriados += 1
+
+    def devolver(self, scraper: WebScraper) -> None:
+        """
+        Devolve ao pool um scraper obtido com adquirir.
+
+        Args:
+            scraper: Scraper a devolver
+        """
+        self._disponiveis.put(scraper)
+
+    @contextmanager
+    def emprestar(self) -> Iterator[WebScraper]:
+        """
+        Empresta um scraper durante um bloco with, devolvendo-o ao final.
+
+        Yields:
+            Scraper pronto para uso
+        """
+        scraper = self.adquirir()
+        try:
+            yield scraper
+        finally:
+            self.devolver(scraper)
+
+    def fechar(self) -> None:
+        """
+        Fecha todos os scrapers do pool.
+        """
+        for scraper in list(self._todos):
+            self._descartar(scraper)
+        while not self._disponiveis.empty():
+            self._disponiveis.get_nowait()
+
+    def __enter__(self):
+        """
+        Permite uso do pool com context manager.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Garante que todos os scrapers serão fechados ao sair do context manager.
+        """
+        self.fechar()
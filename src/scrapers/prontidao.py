@@ -0,0 +1,127 @@
+import time
+from typing import Callable, Dict, Tuple
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+Condicao = Callable[[WebDriver], object]
+
+class Prontidao:
+    """
+    Espera orientada a eventos para as etapas de navegação no Jupiter.
+
+    Cada espera recebe um conjunto de condições concorrentes (por exemplo,
+    popup de erro ou link da grade) e termina assim que a primeira delas for
+    satisfeita, informando qual foi. O tempo limite de cada etapa se adapta
+    à latência observada: começa em timeout_maximo e passa a ser um múltiplo
+    da média móvel das esperas bem-sucedidas, dentro dos limites definidos.
+    Cada espera que estoura o tempo limite dobra o tempo limite da etapa
+    (até timeout_maximo), para que uma lentidão do servidor não gere uma
+    sequência de falhas com o limite calculado antes dela.
+
+    Attributes:
+        driver: Instância do WebDriver
+        timeout_minimo: Menor tempo limite permitido (em segundos)
+        timeout_maximo: Maior tempo limite permitido (em segundos)
+        fator: Multiplicador aplicado à média das esperas para obter o tempo limite
+        intervalo: Intervalo entre verificações das condições (em segundos)
+    """
+
+    PESO_MEDIA = 0.3
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeout_minimo: float = 2.0,
+        timeout_maximo: float = 30.0,
+        fator: float = 4.0,
+        intervalo: float = 0.05
+    ):
+        self.driver = driver
+        self.timeout_minimo = timeout_minimo
+        self.timeout_maximo = timeout_maximo
+        self.fator = fator
+        self.intervalo = intervalo
+        self._medias: Dict[str, float] = {}
+        self._tempos: Dict[str, float] = {}
+        self._chamadas: Dict[str, int] = {}
+
+    def timeout_para(self, etapa: str) -> float:
+        """
+        Calcula o tempo limite atual de uma etapa.
+
+        Args:
+            etapa: Nome da etapa de navegação
+
+        Returns:
+            Tempo limite em segundos
+        """
+        media = self._medias.get(etapa)
+        if media is None:
+            return self.timeout_maximo
+        return min(max(self.fator * media, self.timeout_minimo), self.timeout_maximo)
+
+    def aguardar(self, etapa: str, condicoes: Dict[str, Condicao]) -> str:
+        """
+        Aguarda até que uma das condições seja satisfeita.
+
+        Args:
+            etapa: Nome da etapa, usado na instrumentação e no tempo limite adaptativo
+            condicoes: Condições concorrentes indexadas por nome, verificadas em ordem
+
+        Returns:
+            Nome da primeira condição satisfeita
+
+        Raises:
+            TimeoutException: Se nenhuma condição for satisfeita dentro do tempo limite
+        """
+        def primeira_satisfeita(driver: WebDriver):
+            for nome, condicao in condicoes.items():
+                try:
+                    if condicao(driver):
+                        return nome
+                except (NoSuchElementException, StaleElementReferenceException):
+                    continue
+            return False
+
+        inicio = time.perf_counter()
+        sucesso = False
+        try:
+            resultado = WebDriverWait(
+                self.driver,
+                self.timeout_para(etapa),
+                poll_frequency=self.intervalo
+            ).until(primeira_satisfeita)
+            sucesso = True
+            return resultado
+        finally:
+            self._registrar(etapa, time.perf_counter() - inicio, sucesso)
+
+    def _registrar(self, etapa: str, decorrido: float, sucesso: bool) -> None:
+        """
+        Acumula o tempo de espera da etapa e atualiza sua média móvel.
+
+        Uma espera bem-sucedida entra na média móvel; uma espera que estourou
+        o tempo limite dobra o tempo limite atual, limitado a timeout_maximo.
+
+        Args:
+            etapa: Nome da etapa
+            decorrido: Tempo gasto na espera (em segundos)
+            sucesso: Se alguma condição foi satisfeita antes do tempo limite
+        """
+        self._tempos[etapa] = self._tempos.get(etapa, 0.0) + decorrido
+        self._chamadas[etapa] = self._chamadas.get(etapa, 0) + 1
+        if sucesso:
+            anterior = self._medias.get(etapa, decorrido)
+            self._medias[etapa] = (1 - self.PESO_MEDIA) * anterior + self.PESO_MEDIA * decorrido
+        elif etapa in self._medias:
+            self._medias[etapa] = min(2 * self.timeout_para(etapa), self.timeout_maximo) / self.fator
+
+    def resumo(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Retorna a instrumentação das esperas.
+
+        Returns:
+            Dicionário etapa -> (quantidade de esperas, tempo total em segundos)
+        """
+        return {etapa: (self._chamadas[etapa], self._tempos[etapa]) for etapa in self._tempos}
@@ -4,10 +4,24 @@ Módulo de serviços.
 Contém as classes que implementam a lógica de negócio do sistema.
 """
 
+from .busca_texto import IndiceTexto, ResultadoBusca
 from .coleta_service import ColetaService
+from .coleta_incremental import ColetaIncremental
 from .consulta_service import ConsultaService
+from .consulta_sqlite import ConsultaSqliteService
+from .reprocessamento_service import ReprocessamentoService
+from .retentativas import PoliticaRetentativa, RelatorioFalhas
+from .visao_colunar import VisaoColunar
 
 __all__ = [
     'ColetaService',
-    'ConsultaService'
+    'ColetaIncremental',
+    'ConsultaService',
+    'ConsultaSqliteService',
+    'IndiceTexto',
+    'PoliticaRetentativa',
+    'RelatorioFalhas',
+    'ReprocessamentoService',
+    'ResultadoBusca',
+    'VisaoColunar'
 ]
\ No newline at end of file
@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from typing import List, Tuple
+from ..models.curso import Curso
+from ..models.unidade import Unidade
+
+@dataclass(frozen=True)
+class AgregadoCurso:
+    """
+    Totais de um curso, calculados uma única vez.
+
+    Attributes:
+        total_disciplinas: Quantidade de disciplinas (de todos os tipos)
+        total_creditos: Soma dos créditos totais das disciplinas
+        total_ch: Soma das cargas horárias das disciplinas
+        qtd_obrigatorias: Quantidade de disciplinas obrigatórias
+        qtd_optativas_livres: Quantidade de optativas livres
+        qtd_optativas_eletivas: Quantidade de optativas eletivas
+    """
+    total_disciplinas: int
+    total_creditos: int
+    total_ch: int
+    qtd_obrigatorias: int
+    qtd_optativas_livres: int
+    qtd_optativas_eletivas: int
+
+    @classmethod
+    def de_curso(cls, curso: Curso) -> "AgregadoCurso":
+        """
+        Calcula os totais de um curso, percorrendo cada lista de disciplinas uma vez.
+
+        Args:
+            curso: Curso com suas disciplinas
+
+        Returns:
+            Totais do curso
+        """
+        total_creditos = 0
+        total_ch = 0
+        for lista in (curso.obrigatorias, curso.optativas_livres, curso.optativas_eletivas):
+            for disciplina in lista:
+                total_creditos += disciplina.creditos_totais
+                total_ch += disciplina.carga_horaria
+        qtd_obrigatorias = len(curso.obrigatorias)
+        qtd_optativas_livres = len(curso.optativas_livres)
+        qtd_optativas_eletivas = len(curso.optativas_eletivas)
+        return cls(
+            total_disciplinas=qtd_obrigatorias + qtd_optativas_livres + qtd_optativas_eletivas,
+            total_creditos=total_creditos,
+            total_ch=total_ch,
+            qtd_obrigatorias=qtd_obrigatorias,
+            qtd_optativas_livres=qtd_optativas_livres,
+            qtd_optativas_eletivas=qtd_optativas_eletivas,
+        )
+
+@dataclass(frozen=True)
+class AgregadoUnidade:
+    """
+    Totais de uma unidade, somados a partir dos totais dos seus cursos.
+
+    Attributes:
+        total_cursos: Quantidade de cursos
+        total_disciplinas: Soma das disciplinas dos cursos
+        total_ch: Soma das cargas horárias dos cursos
+        cursos: Tuplas (nome, disciplinas, carga horária) de cada curso, na ordem da unidade
+    """
+    total_cursos: int
+    total_disciplinas: int
+    total_ch: int
+    cursos: Tuple[Tuple[str, int, int], ...]
+
+    @classmethod
+    def de_unidade(cls, unidade: Unidade, agregados: List[AgregadoCurso]) -> "AgregadoUnidade":
+        """
+        Soma os totais dos cursos de uma unidade.
+
+        Args:
+            unidade: Unidade com seus cursos
+            agregados: Totais já calculados de cada curso, na ordem de unidade.cursos
+
+        Returns:
+            Totais da unidade
+        """
+        cursos = tuple(
+            (curso.nome, agregado.total_disciplinas, agregado.total_ch)
+            for curso, agregado in zip(unidade.cursos, agregados)
+        )
+        return cls(
+            total_cursos=len(cursos),
+            total_disciplinas=sum(disciplinas for _, disciplinas, _ in cursos),
+            total_ch=sum(carga_horaria for _, _, carga_horaria in cursos),
+            cursos=cursos,
+        )
@@ -0,0 +1,242 @@
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+TIPO_DISCIPLINA = "disciplina"
+TIPO_CURSO = "curso"
+
+# Peso de cada forma de casamento entre um termo da busca e uma palavra indexada
+PESO_EXATO = 1.0
+PESO_PREFIXO = 0.75
+PESO_APROXIMADO = 0.5
+
+# Similaridade de trigramas (Jaccard) mínima para um casamento aproximado
+SIMILARIDADE_MINIMA = 0.4
+
+# Distância de edição máxima aceita quando nenhum trigrama casa bem, conforme
+# o tamanho do termo (termos curtos toleram menos erros)
+DISTANCIA_MAXIMA = ((4, 1), (float("inf"), 2))
+
+_PALAVRA = re.compile(r"\w+")
+
+def normalizar_texto(texto: str) -> str:
+    """
+    Converte o texto para minúsculas e remove os acentos.
+
+    Args:
+        texto: Texto original (ex: "Cálculo II")
+
+    Returns:
+        Texto normalizado (ex: "calculo ii")
+    """
+    decomposto = unicodedata.normalize("NFKD", texto.casefold())
+    return "".join(c for c in decomposto if not unicodedata.combining(c))
+
+def tokenizar(texto: str) -> List[str]:
+    """
+    Separa o texto normalizado em palavras.
+
+    Args:
+        texto: Texto original
+
+    Returns:
+        Lista de palavras sem acentos, em minúsculas
+    """
+    return _PALAVRA.findall(normalizar_texto(texto))
+
+def distancia_edicao(origem: str, destino: str, limite: int) -> int:
+    """
+    Calcula a distância de edição entre duas palavras, contando a troca de
+    duas letras vizinhas como um único erro (Damerau-Levenshtein restrita).
+
+    Args:
+        origem: Primeira palavra
+        destino: Segunda palavra
+        limite: Distância a partir da qual o cálculo pode ser interrompido
+
+    Returns:
+        Distância de edição, ou limite + 1 se ela for maior que o limite
+    """
+    if abs(len(origem) - len(destino)) > limite:
+        return limite + 1
+    anterior2: List[int] = []
+    anterior = list(range(len(destino) + 1))
+    for i, letra in enumerate(origem, 1):
+        atual = [i] + [0] * len(destino)
+        for j, outra in enumerate(destino, 1):
+            atual[j] = min(anterior[j] + 1, atual[j - 1] + 1, anterior[j - 1] + (letra != outra))
+            if i > 1 and j > 1 and letra == destino[j - 2] and origem[i - 2] == outra:
+                atual[j] = min(atual[j], anterior2[j - 2] + 1)
+        if min(atual) > limite:
+            return limite + 1
+        anterior2, anterior = anterior, atual
+    return min(anterior[-1], limite + 1)
+
+def trigramas(palavra: str) -> Set[str]:
+    """
+    Obtém os trigramas de uma palavra, com marcação de início e fim.
+
+    Args:
+        palavra: Palavra normalizada
+
+    Returns:
+        Conjunto de trigramas (ex: "ab" -> {"  a", " ab", "ab "})
+    """
+    marcada = f"  {palavra} "
+    return {marcada[i:i + 3] for i in range(len(marcada) - 2)}
+
+@dataclass
+class ResultadoBusca:
+    """
+    Resultado de uma busca textual.
+
+    Attributes:
+        tipo: TIPO_DISCIPLINA ou TIPO_CURSO
+        chave: Código da disciplina ou nome do curso
+        nome: Nome da disciplina ou do curso
+        pontuacao: Relevância do resultado (maior é melhor)
+    """
+    tipo: str
+    chave: str
+    nome: str
+    pontuacao: float
+
+class IndiceTexto:
+    """
+    Índice invertido sobre os nomes de disciplinas e cursos.
+
+    Os nomes (e os códigos das disciplinas) são normalizados sem acentos
+    e separados em palavras; cada palavra aponta para os documentos em
+    que aparece. Um termo da busca casa com as palavras idênticas, com as
+    que começam por ele (via busca binária no vocabulário ordenado) e, se
+    não houver palavra idêntica, com as palavras de trigramas parecidos,
+    o que tolera erros de digitação. Se nem assim houver casamento (em
+    palavras curtas, uma troca de letras já derruba a similaridade de
+    trigramas), aceita as palavras com algum trigrama em comum que estejam
+    a uma pequena distância de edição. O índice é montado uma única vez.
+    """
+
+    def __init__(self, entradas: Iterable[Tuple[str, str, str]]):
+        """
+        Monta o índice.
+
+        Args:
+            entradas: Tuplas (tipo, chave, nome); chaves repetidas do mesmo tipo são ignoradas
+        """
+        self._documentos: List[Tuple[str, str, str]] = []
+        self._postagens: Dict[str, Set[int]] = defaultdict(set)
+        vistos: Set[Tuple[str, str]] = set()
+
+        for tipo, chave, nome in entradas:
+            if (tipo, chave) in vistos:
+                continue
+            vistos.add((tipo, chave))
+            documento = len(self._documentos)
+            self._documentos.append((tipo, chave, nome))
+            for palavra in set(tokenizar(nome)) | set(tokenizar(chave)):
+                self._postagens[palavra].add(documento)
+
+        self._vocabulario = sorted(self._postagens)
+        self._trigramas: Dict[str, List[str]] = defaultdict(list)
+        self._qtd_trigramas: Dict[str, int] = {}
+        for palavra in self._vocabulario:
+            grams = trigramas(palavra)
+            self._qtd_trigramas[palavra] = len(grams)
+            for gram in grams:
+                self._trigramas[gram].append(palavra)
+
+    def __len__(self) -> int:
+        return len(self._documentos)
+
+    def _expandir(self, termo: str) -> Iterator[Tuple[str, float]]:
+        """
+        Encontra as palavras do vocabulário que casam com um termo da busca.
+
+        Args:
+            termo: Palavra normalizada da busca
+
+        Yields:
+            Tuplas (palavra do vocabulário, peso do casamento)
+        """
+        exato = termo in self._postagens
+        if exato:
+            yield termo, PESO_EXATO
+
+        inicio = posicao = bisect_left(self._vocabulario, termo)
+        while posicao < len(self._vocabulario) and self._vocabulario[posicao].startswith(termo):
+            if self._vocabulario[posicao] != termo:
+                yield self._vocabulario[posicao], PESO_PREFIXO
+            posicao += 1
+
+        if exato:
+            return
+        encontrou = posicao > inicio
+        grams = trigramas(termo)
+        comuns = Counter(palavra for gram in grams for palavra in self._trigramas.get(gram, ()))
+        for palavra, quantidade in comuns.items():
+            similaridade = quantidade / (len(grams) + self._qtd_trigramas[palavra] - quantidade)
+            if similaridade >= SIMILARIDADE_MINIMA and not palavra.startswith(termo):
+                encontrou = True
+                yield palavra, PESO_APROXIMADO * similaridade
+
+        if not encontrou:
+            yield from self._expandir_por_edicao(termo, comuns)
+
+    @staticmethod
+    def _expandir_por_edicao(termo: str, candidatas: Iterable[str]) -> Iterator[Tuple[str, float]]:
+        """
+        Encontra, entre as candidatas, as palavras a uma pequena distância de edição do termo.
+
+        Args:
+            termo: Palavra normalizada da busca
+            candidatas: Palavras do vocabulário com algum trigrama em comum com o termo
+
+        Yields:
+            Tuplas (palavra do vocabulário, peso do casamento)
+        """
+        limite = next(distancia for tamanho, distancia in DISTANCIA_MAXIMA if len(termo) <= tamanho)
+        for palavra in candidatas:
+            distancia = distancia_edicao(termo, palavra, limite)
+            if distancia <= limite:
+                yield palavra, PESO_APROXIMADO * (1 - distancia / max(len(termo), len(palavra)))
+
+    def buscar(self, termo: str, limite: int = 10) -> List[ResultadoBusca]:
+        """
+        Busca disciplinas e cursos cujo nome ou código casa com o termo.
+
+        A pontuação de um documento é a soma, para cada palavra da busca,
+        do melhor casamento encontrado no documento.
+
+        Args:
+            termo: Texto da busca (ex: "calculo", "MAC01", "algebar linear")
+            limite: Quantidade máxima de resultados
+
+        Returns:
+            Resultados ordenados por relevância e, no empate, pelo nome mais curto
+        """
+        palavras = list(dict.fromkeys(tokenizar(termo)))
+        if not palavras or limite < 1:
+            return []
+
+        pontuacoes: Dict[int, float] = defaultdict(float)
+        for palavra in palavras:
+            melhores: Dict[int, float] = {}
+            for candidata, peso in self._expandir(palavra):
+                for documento in self._postagens[candidata]:
+                    if peso > melhores.get(documento, 0.0):
+                        melhores[documento] = peso
+            for documento, peso in melhores.items():
+                pontuacoes[documento] += peso
+
+        def ordem(item: Tuple[int, float]) -> tuple:
+            tipo, chave, nome = self._documentos[item[0]]
+            return -item[1], len(nome), nome, tipo, chave
+
+        return [
+            ResultadoBusca(*self._documentos[documento], pontuacao)
+            for documento, pontuacao in heapq.nsmallest(limite, pontuacoes.items(), key=ordem)
+        ]
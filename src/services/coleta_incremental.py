@@ -0,0 +1,187 @@
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from ..models.curso import Curso
+from ..models.unidade import Unidade
+
+ChaveCurso = Tuple[str, str]
+
+@dataclass
+class RelatorioIncremental:
+    """
+    Resumo das diferenças entre a coleta atual e a anterior.
+
+    Attributes:
+        adicionados: Cursos que não existiam na coleta anterior
+        removidos: Cursos da coleta anterior que não foram encontrados agora
+        alterados: Cursos cuja grade mudou
+        inalterados: Cursos reaproveitados da coleta anterior
+        falhados: Cursos cuja coleta falhou, mantidos como estavam na coleta anterior
+    """
+    adicionados: List[ChaveCurso] = field(default_factory=list)
+    removidos: List[ChaveCurso] = field(default_factory=list)
+    alterados: List[ChaveCurso] = field(default_factory=list)
+    inalterados: List[ChaveCurso] = field(default_factory=list)
+    falhados: List[ChaveCurso] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.adicionados)} adicionados, {len(self.removidos)} removidos, "
+            f"{len(self.alterados)} alterados, {len(self.inalterados)} inalterados, "
+            f"{len(self.falhados)} com falha"
+        )
+
+class ColetaIncremental:
+    """
+    Estado de uma coleta incremental.
+
+    Guarda o hash do HTML da grade de cada curso, identificado pelos códigos
+    da unidade e do curso. Se na coleta seguinte o hash for o mesmo, o Curso
+    da coleta anterior é reaproveitado sem passar pelo parser.
+
+    Attributes:
+        hashes_anteriores: Hashes da coleta anterior por (unidade, curso)
+        hashes: Hashes calculados na coleta atual por (unidade, curso)
+        relatorio: Diferenças encontradas até o momento
+    """
+
+    def __init__(
+        self,
+        unidades_anteriores: Optional[List[Unidade]] = None,
+        hashes_anteriores: Optional[Dict[ChaveCurso, str]] = None
+    ):
+        self._unidades_anteriores = list(unidades_anteriores or [])
+        self._cursos_anteriores: Dict[ChaveCurso, Curso] = {
+            (unidade.codigo, curso.codigo): curso
+            for unidade in self._unidades_anteriores
+            for curso in unidade.cursos
+            if unidade.codigo and curso.codigo
+        }
+        self.hashes_anteriores = dict(hashes_anteriores or {})
+        self.hashes: Dict[ChaveCurso, str] = {}
+        self.relatorio = RelatorioIncremental()
+        self._trava = threading.Lock()
+
+    @staticmethod
+    def calcular_hash(html: str) -> str:
+        """
+        Calcula o hash do conteúdo de uma página de grade.
+
+        Args:
+            html: HTML da grade curricular
+
+        Returns:
+            Hash SHA-256 em hexadecimal
+        """
+        return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+    def reaproveitar(self, codigo_unidade: str, codigo_curso: str, html: str) -> Optional[Curso]:
+        """
+        Registra o hash da grade e devolve o curso anterior se ela não mudou.
+
+        Args:
+            codigo_unidade: Código da unidade
+            codigo_curso: Código do curso
+            html: HTML da grade curricular obtido agora
+
+        Returns:
+            Curso da coleta anterior, ou None se for preciso processar a página
+        """
+        chave = (codigo_unidade, codigo_curso)
+        valor = self.calcular_hash(html)
+        anterior = self._cursos_anteriores.get(chave)
+
+        with self._trava:
+            self.hashes[chave] = valor
+            if chave not in self.hashes_anteriores or anterior is None:
+                self.relatorio.adicionados.append(chave)
+                return None
+            if self.hashes_anteriores[chave] != valor:
+                self.relatorio.alterados.append(chave)
+                return None
+            self.relatorio.inalterados.append(chave)
+            return anterior
+
+    def registrar_hash(self, codigo_unidade: str, codigo_curso: str, valor_hash: str) -> None:
+        """
+        Registra o hash de um curso obtido sem passar por reaproveitar (por exemplo, retomado de um checkpoint).
+
+        Args:
+            codigo_unidade: Código da unidade
+            codigo_curso: Código do curso
+            valor_hash: Hash do HTML da grade
+        """
+        with self._trava:
+            self.hashes[(codigo_unidade, codigo_curso)] = valor_hash
+
+    def manter_anterior(self, codigo_unidade: str, codigo_curso: str) -> Optional[Curso]:
+        """
+        Registra que a coleta de um curso falhou e devolve o curso da coleta anterior.
+
+        O hash anterior do curso é mantido (um hash calculado antes da falha
+        é descartado), de modo que o curso não é dado como removido e o
+        próximo snapshot continua com ele.
+
+        Args:
+            codigo_unidade: Código da unidade
+            codigo_curso: Código do curso
+
+        Returns:
+            Curso da coleta anterior, ou None se ele não existia
+        """
+        chave = (codigo_unidade, codigo_curso)
+        with self._trava:
+            for lista in (self.relatorio.adicionados, self.relatorio.alterados):
+                if chave in lista:
+                    lista.remove(chave)
+            self.relatorio.falhados.append(chave)
+            if chave in self.hashes_anteriores:
+                self.hashes[chave] = self.hashes_anteriores[chave]
+            else:
+                self.hashes.pop(chave, None)
+        return self._cursos_anteriores.get(chave)
+
+    def finalizar(self, codigos_unidades: List[str]) -> RelatorioIncremental:
+        """
+        Fecha o relatório, listando os cursos que deixaram de existir.
+
+        Apenas as unidades efetivamente coletadas nesta execução são
+        consideradas, para que uma coleta parcial não marque como removidos
+        os cursos das demais unidades; os hashes dessas outras unidades são
+        mantidos, para que continuem no próximo snapshot.
+
+        Args:
+            codigos_unidades: Códigos das unidades coletadas nesta execução
+
+        Returns:
+            Relatório final da coleta incremental
+        """
+        coletadas = set(codigos_unidades)
+        with self._trava:
+            self.relatorio.removidos = [
+                chave for chave in self.hashes_anteriores
+                if chave[0] in coletadas and chave not in self.hashes
+            ]
+            for chave, valor in self.hashes_anteriores.items():
+                if chave[0] not in coletadas:
+                    self.hashes.setdefault(chave, valor)
+        return self.relatorio
+
+    def mesclar_anteriores(self, unidades: List[Unidade]) -> List[Unidade]:
+        """
+        Completa uma coleta parcial com as unidades da coleta anterior que não foram coletadas agora.
+
+        As unidades são casadas pelo código. A ordem da coleta anterior é
+        mantida, e as unidades novas vão para o final.
+
+        Args:
+            unidades: Unidades coletadas nesta execução
+
+        Returns:
+            Unidades coletadas agora mais as anteriores que não foram recoletadas
+        """
+        novas = {unidade.codigo: unidade for unidade in unidades}
+        mescladas = [novas.pop(anterior.codigo, anterior) for anterior in self._unidades_anteriores]
+        mescladas.extend(novas.values())
+        return mescladas
@@ -1,9 +1,142 @@
-from typing import List, Optional
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from ..interfaces.scraper import WebScraper
 from ..interfaces.parser import Parser
 from ..models.unidade import Unidade
 from ..models.curso import Curso
+from ..models.disciplina import Disciplina
 from ..models.duracao_curso import DuracaoCurso
+from ..parsers.classificador import PAGINA_ERRO, PAGINA_GRADE, TIPOS_PAGINA, classificar_pagina
+from ..persistencia.cache_html import CacheHtml
+from ..persistencia.checkpoint import CursoConcluido, JornalCheckpoint
+from ..persistencia.exportacao_ndjson import ExportadorNdjson
+from ..scrapers.pool_scrapers import PoolScrapers
+from .coleta_incremental import ColetaIncremental
+from .retentativas import FalhaCurso, PoliticaRetentativa, RelatorioFalhas
+
+@dataclass
+class ItemColeta:
+    """
+    Unidade de trabalho da coleta: um curso de uma unidade.
+    
+    Attributes:
+        codigo_unidade: Código da unidade no Jupiter
+        nome_unidade: Nome da unidade
+        codigo_curso: Código do curso no Jupiter
+        nome_curso: Nome do curso
+    """
+    codigo_unidade: str
+    nome_unidade: str
+    codigo_curso: str
+    nome_curso: str
+
+ResultadoGrade = Tuple[DuracaoCurso, List[Disciplina], List[Disciplina], List[Disciplina]]
+
+ETAPAS_PIPELINE = ["busca", "analise", "montagem"]
+
+@dataclass
+class MetricasEtapa:
+    """
+    Desempenho de uma etapa do pipeline de coleta.
+    
+    Attributes:
+        itens: Itens processados pela etapa
+        tempo_ocupado: Soma do tempo gasto processando os itens (em segundos)
+        tempo_bloqueado: Tempo em que a etapa ficou parada esperando a seguinte liberar espaço (em segundos)
+    """
+    itens: int = 0
+    tempo_ocupado: float = 0.0
+    tempo_bloqueado: float = 0.0
+
+    def vazao(self, duracao: float) -> float:
+        """
+        Calcula a vazão da etapa.
+        
+        Args:
+            duracao: Duração total do pipeline (em segundos)
+            
+        Returns:
+            Itens por segundo (0 se a duração for nula)
+        """
+        return self.itens / duracao if duracao > 0 else 0.0
+
+class ProgressoColeta:
+    """
+    Atualiza o progresso por unidade quando os cursos são concluídos fora de ordem.
+    
+    Attributes:
+        progress: Objeto de progresso do Rich (opcional)
+        task_id: ID da tarefa de progresso (opcional)
+    """
+
+    def __init__(
+        self,
+        progress: Optional["Progress"],
+        task_id: Optional[int],
+        codigos_unidades: List[str],
+        pendentes: List[Tuple[int, ItemColeta]]
+    ):
+        self.progress = progress
+        self.task_id = task_id
+        self._pendentes_por_unidade: Dict[str, int] = {}
+        for _, item in pendentes:
+            codigo = item.codigo_unidade
+            self._pendentes_por_unidade[codigo] = self._pendentes_por_unidade.get(codigo, 0) + 1
+        self._trava = threading.Lock()
+
+        if progress and task_id is not None:
+            # Unidades sem cursos pendentes já estão concluídas
+            vazias = sum(1 for codigo in codigos_unidades if codigo not in self._pendentes_por_unidade)
+            progress.update(task_id, advance=vazias)
+
+    def concluir(self, item: ItemColeta, task_worker: Optional[int] = None) -> None:
+        """
+        Registra a conclusão de um curso, avançando a unidade quando for o último.
+        
+        Args:
+            item: Curso concluído (com sucesso ou não)
+            task_worker: Tarefa de progresso do worker que o coletou (opcional)
+        """
+        if not self.progress:
+            return
+        if task_worker is not None:
+            self.progress.update(task_worker, advance=1)
+        with self._trava:
+            self._pendentes_por_unidade[item.codigo_unidade] -= 1
+            unidade_concluida = self._pendentes_por_unidade[item.codigo_unidade] == 0
+        if unidade_concluida and self.task_id is not None:
+            self.progress.update(self.task_id, advance=1)
+
+_parser_processo: Optional[Parser] = None
+
+def _iniciar_processo_analise(parser: Parser) -> None:
+    """
+    Guarda o parser no processo de análise, para não enviá-lo a cada página.
+    
+    Args:
+        parser: Parser usado pelo processo
+    """
+    global _parser_processo
+    _parser_processo = parser
+
+def _analisar_pagina(html: str) -> Tuple[ResultadoGrade, float]:
+    """
+    Extrai a grade de uma página (executado nos processos de análise).
+    
+    Args:
+        html: HTML da grade curricular
+        
+    Returns:
+        Tupla (grade extraída, tempo de análise em segundos)
+    """
+    inicio = time.perf_counter()
+    grade = _parser_processo.extrair_grade(html)
+    return grade, time.perf_counter() - inicio
 
 class ColetaService:
     """
@@ -14,11 +147,77 @@ class ColetaService:
     Attributes:
         scraper: Implementação de WebScraper para coletar dados
         parser: Implementação de Parser para processar os dados
+        scraper_factory: Função que cria novos scrapers para os workers (opcional)
+        workers: Número de scrapers trabalhando em paralelo
+        max_paginas_scraper: Carregamentos de página após os quais um scraper do pool é reciclado
+        max_memoria_scraper: Memória do navegador (em bytes) acima da qual um scraper do pool é reciclado
+        incremental: Estado da coleta incremental (opcional)
+        cache_html: Cache onde o HTML bruto das grades é guardado (opcional)
+        checkpoint: Diário onde cada curso concluído é gravado (opcional)
+        retomar: Se True, reaproveita os cursos já gravados no checkpoint em vez de recomeçá-lo
+        retentativas: Política de novas tentativas para cursos cuja coleta falhou
+        exportador: Destino NDJSON onde cada curso é escrito assim que concluído (opcional)
+        cursos_visitados: Cursos cuja grade foi solicitada na última coleta
+        carregamentos_pagina: Carregamentos de página feitos na última coleta
+        bytes_recebidos: Bytes de HTML recebidos dos scrapers na última coleta
+        esperas: Tempo de espera por etapa de navegação na última coleta
+        tempo_cursos: Tempo total gasto coletando cursos na última coleta (em segundos)
+        scrapers_reciclados: Scrapers substituídos pelo pool na última coleta
+        cursos_retomados: Cursos recuperados do checkpoint na última coleta
+        relatorio_falhas: Cursos recuperados e falhas definitivas da última coleta
+        paginas_por_tipo: Páginas recebidas na última coleta por classificação (grade, erro, bloqueio, vazia)
+        processos_analise: Processos do parser no modo pipeline (0 analisa as páginas junto com a busca)
+        capacidade_fila: Páginas que podem aguardar análise antes de a busca ser pausada
+        metricas_etapas: Desempenho de cada etapa do pipeline na última coleta
+        duracao_pipeline: Duração do pipeline na última coleta (em segundos)
     """
 
-    def __init__(self, scraper: WebScraper, parser: Parser):
+    def __init__(
+        self,
+        scraper: WebScraper,
+        parser: Parser,
+        scraper_factory: Optional[Callable[[], WebScraper]] = None,
+        workers: int = 1,
+        incremental: Optional[ColetaIncremental] = None,
+        cache_html: Optional[CacheHtml] = None,
+        max_paginas_scraper: int = 500,
+        max_memoria_scraper: Optional[int] = None,
+        checkpoint: Optional[JornalCheckpoint] = None,
+        retomar: bool = False,
+        retentativas: Optional[PoliticaRetentativa] = None,
+        processos_analise: int = 0,
+        capacidade_fila: int = 32,
+        exportador: Optional[ExportadorNdjson] = None
+    ):
         self.scraper = scraper
         self.parser = parser
+        self.scraper_factory = scraper_factory
+        self.workers = max(1, workers)
+        self.max_paginas_scraper = max_paginas_scraper
+        self.max_memoria_scraper = max_memoria_scraper
+        self.incremental = incremental
+        self.cache_html = cache_html
+        self.checkpoint = checkpoint
+        self.retomar = retomar
+        self.retentativas = retentativas or PoliticaRetentativa()
+        self.processos_analise = processos_analise
+        self.capacidade_fila = max(1, capacidade_fila)
+        self.exportador = exportador
+        self.cursos_visitados = 0
+        self.carregamentos_pagina = 0
+        self.bytes_recebidos = 0
+        self.esperas: Dict[str, Tuple[int, float]] = {}
+        self.tempo_cursos = 0.0
+        self.scrapers_reciclados = 0
+        self.cursos_retomados = 0
+        self.relatorio_falhas = RelatorioFalhas()
+        self.paginas_por_tipo: Dict[str, int] = dict.fromkeys(TIPOS_PAGINA, 0)
+        self.metricas_etapas: Dict[str, MetricasEtapa] = {}
+        self.duracao_pipeline = 0.0
+        self._concluidos: Dict[Tuple[str, str], CursoConcluido] = {}
+        self._ordem_cursos: Dict[Tuple[str, str], int] = {}
+        self._falhas: List[Tuple[ItemColeta, int, Exception]] = []
+        self._trava = threading.Lock()
 
     def coletar_dados(
         self,
@@ -37,8 +236,252 @@ class ColetaService:
         Returns:
             Lista de objetos Unidade com cursos e disciplinas preenchidos.
         """
+        self.cursos_visitados = 0
+        self.carregamentos_pagina = 0
+        self.bytes_recebidos = 0
+        self.esperas = {}
+        self.tempo_cursos = 0.0
+        self.scrapers_reciclados = 0
+        self.cursos_retomados = 0
+        self.relatorio_falhas = RelatorioFalhas()
+        self.paginas_por_tipo = dict.fromkeys(TIPOS_PAGINA, 0)
+        self.metricas_etapas = {}
+        self.duracao_pipeline = 0.0
+        self._concluidos = {}
+        self._ordem_cursos = {}
+        self._falhas = []
+        if self.checkpoint:
+            if self.retomar:
+                self._concluidos = self.checkpoint.carregar()
+            else:
+                self.checkpoint.iniciar()
+        carregamentos_iniciais = self.scraper.carregamentos_pagina
+        bytes_iniciais = self.scraper.bytes_recebidos
+
         # Obtem os códigos das unidades (não URLs)
         codigos_unidades = self.scraper.listar_unidades_urls()[:quantidade]
+
+        if self.processos_analise > 0:
+            unidades = self._coletar_em_pipeline(codigos_unidades, progress, task_id)
+        elif self.workers > 1 and self.scraper_factory:
+            unidades = self._coletar_em_paralelo(codigos_unidades, progress, task_id)
+        else:
+            unidades = self._coletar_em_sequencia(codigos_unidades, progress, task_id)
+
+        if self._falhas:
+            self._retentar_falhas(unidades)
+        if self.incremental and self.relatorio_falhas.falhas:
+            self._manter_cursos_anteriores(unidades)
+
+        self.carregamentos_pagina += self.scraper.carregamentos_pagina - carregamentos_iniciais
+        self.bytes_recebidos += self.scraper.bytes_recebidos - bytes_iniciais
+        self._somar_esperas(self.scraper.resumo_esperas())
+
+        if self.incremental:
+            # Unidades que não puderam ser coletadas ficam como estavam na coleta anterior
+            self.incremental.finalizar([unidade.codigo for unidade in unidades])
+
+        return unidades
+
+    def _retomar_curso(self, item: ItemColeta) -> Optional[Curso]:
+        """
+        Devolve o curso se ele já foi concluído numa execução anterior registrada no checkpoint.
+        
+        Args:
+            item: Curso a coletar, com os dados da sua unidade
+            
+        Returns:
+            Curso recuperado do checkpoint, ou None se for preciso coletá-lo
+        """
+        concluido = self._concluidos.get((item.codigo_unidade, item.codigo_curso))
+        if concluido is None:
+            return None
+
+        if self.incremental and concluido.hash:
+            self.incremental.registrar_hash(item.codigo_unidade, item.codigo_curso, concluido.hash)
+        with self._trava:
+            self.cursos_retomados += 1
+        if self.exportador:
+            self.exportador.exportar(item.codigo_unidade, item.nome_unidade, concluido.curso)
+        return concluido.curso
+
+    def _registrar_falha(self, item: ItemColeta, erro: Exception, tentativas: int = 1) -> None:
+        """
+        Guarda um curso cuja coleta falhou para ser tentado de novo ao final.
+        
+        Args:
+            item: Curso que falhou
+            erro: Exceção que interrompeu a coleta
+            tentativas: Tentativas já feitas para o curso
+        """
+        print(f"Erro ao coletar curso {item.nome_curso}: {erro}")
+        with self._trava:
+            self._falhas.append((item, tentativas, erro))
+
+    def _retentar_falhas(self, unidades: List[Unidade]) -> None:
+        """
+        Tenta de novo, com o scraper principal, os cursos que falharam.
+        
+        As falhas são reprocessadas em rodadas, cada uma precedida de uma
+        espera com backoff exponencial e jitter, até que todos os cursos
+        sejam coletados ou atinjam o máximo de tentativas. Os cursos
+        recuperados entram nas unidades na posição original e o que
+        continuar falhando fica em relatorio_falhas.
+        
+        Args:
+            unidades: Unidades coletadas, que recebem os cursos recuperados
+        """
+        por_codigo = {unidade.codigo: unidade for unidade in unidades}
+        alteradas = set()
+        tentativa = 1
+
+        while self._falhas:
+            tentativa += 1
+            pendentes = [falha for falha in self._falhas if falha[0].codigo_unidade in por_codigo]
+            desistencias = [falha for falha in pendentes if falha[1] >= self.retentativas.max_tentativas]
+            pendentes = [falha for falha in pendentes if falha[1] < self.retentativas.max_tentativas]
+            self._falhas = []
+            self.relatorio_falhas.falhas.extend(
+                self._falha_curso(item, tentativas, erro) for item, tentativas, erro in desistencias
+            )
+            if not pendentes:
+                break
+
+            espera = self.retentativas.atraso(tentativa)
+            print(f"🔁 Tentando de novo {len(pendentes)} cursos em {espera:.1f}s")
+            time.sleep(espera)
+
+            for item, tentativas, _ in pendentes:
+                print(f"  Coletando curso {item.nome_curso} (tentativa {tentativas + 1})")
+                try:
+                    self.scraper.voltar_para_cursos(item.codigo_unidade)
+                    curso = self._coletar_curso(item)
+                except Exception as e:
+                    self._registrar_falha(item, e, tentativas + 1)
+                    continue
+                if curso:
+                    self.relatorio_falhas.recuperados += 1
+                    por_codigo[item.codigo_unidade].adicionar_curso(curso)
+                    alteradas.add(item.codigo_unidade)
+
+        for codigo in alteradas:
+            self._ordenar_cursos(por_codigo[codigo])
+
+    def _manter_cursos_anteriores(self, unidades: List[Unidade]) -> None:
+        """
+        Na coleta incremental, recoloca nas unidades a versão anterior dos cursos com falha definitiva.
+        
+        Args:
+            unidades: Unidades coletadas, que recebem os cursos anteriores
+        """
+        por_codigo = {unidade.codigo: unidade for unidade in unidades}
+        alteradas = set()
+        for falha in self.relatorio_falhas.falhas:
+            curso = self.incremental.manter_anterior(falha.codigo_unidade, falha.codigo_curso)
+            unidade = por_codigo.get(falha.codigo_unidade)
+            if curso and unidade:
+                unidade.adicionar_curso(curso)
+                alteradas.add(unidade.codigo)
+                if self.exportador:
+                    self.exportador.exportar(unidade.codigo, unidade.nome, curso)
+
+        for codigo in alteradas:
+            self._ordenar_cursos(por_codigo[codigo])
+
+    def _ordenar_cursos(self, unidade: Unidade) -> None:
+        """
+        Devolve os cursos de uma unidade à ordem em que o Jupiter os lista.
+        
+        Args:
+            unidade: Unidade que recebeu cursos fora de ordem
+        """
+        unidade.cursos.sort(key=lambda curso: self._ordem_cursos.get((unidade.codigo, curso.codigo), 0))
+
+    @staticmethod
+    def _falha_curso(item: ItemColeta, tentativas: int, erro: Exception) -> FalhaCurso:
+        """
+        Monta o registro de falha definitiva de um curso.
+        
+        Args:
+            item: Curso que falhou
+            tentativas: Tentativas feitas
+            erro: Última exceção
+            
+        Returns:
+            Registro para o relatório de falhas
+        """
+        return FalhaCurso(
+            codigo_unidade=item.codigo_unidade,
+            nome_unidade=item.nome_unidade,
+            codigo_curso=item.codigo_curso,
+            nome_curso=item.nome_curso,
+            tentativas=tentativas,
+            erro=str(erro),
+            tipo_erro=type(erro).__name__
+        )
+
+    def _acumular_estatisticas(self, scraper: WebScraper) -> None:
+        """
+        Soma às estatísticas da coleta os contadores de um scraper que será fechado.
+        
+        Args:
+            scraper: Scraper de um worker
+        """
+        with self._trava:
+            self.carregamentos_pagina += scraper.carregamentos_pagina
+            self.bytes_recebidos += scraper.bytes_recebidos
+            self._somar_esperas(scraper.resumo_esperas())
+
+    def _somar_esperas(self, resumo: Dict[str, Tuple[int, float]]) -> None:
+        """
+        Acumula a instrumentação de esperas de um scraper.
+        
+        Args:
+            resumo: Dicionário etapa -> (quantidade de esperas, tempo total)
+        """
+        for etapa, (quantidade, tempo) in resumo.items():
+            quantidade_atual, tempo_atual = self.esperas.get(etapa, (0, 0.0))
+            self.esperas[etapa] = (quantidade_atual + quantidade, tempo_atual + tempo)
+
+    def latencia_media_curso(self) -> float:
+        """
+        Calcula o tempo médio de coleta de um curso na última coleta.
+        
+        Returns:
+            Segundos por curso visitado (0 se nenhum)
+        """
+        if not self.cursos_visitados:
+            return 0.0
+        return self.tempo_cursos / self.cursos_visitados
+
+    def carregamentos_por_curso(self) -> float:
+        """
+        Calcula a média de carregamentos de página por curso na última coleta.
+        
+        Returns:
+            Carregamentos de página divididos pelos cursos visitados (0 se nenhum)
+        """
+        if not self.cursos_visitados:
+            return 0.0
+        return self.carregamentos_pagina / self.cursos_visitados
+
+    def _coletar_em_sequencia(
+        self,
+        codigos_unidades: List[str],
+        progress: Optional["Progress"] = None,
+        task_id: Optional[int] = None
+    ) -> List[Unidade]:
+        """
+        Coleta as unidades uma após a outra com o scraper principal.
+        
+        Args:
+            codigos_unidades: Códigos das unidades a coletar
+            progress: Objeto de progresso do Rich (opcional)
+            task_id: ID da tarefa de progresso (opcional)
+            
+        Returns:
+            Lista de objetos Unidade com cursos e disciplinas preenchidos.
+        """
         unidades: List[Unidade] = []
 
         for codigo_unidade in codigos_unidades:
@@ -85,7 +528,7 @@ class ColetaService:
         # Coleta os cursos da unidade
         cursos = self._coletar_cursos(nome, codigo, progress, task_id)
         
-        return Unidade(nome=nome, cursos=cursos)
+        return Unidade(nome=nome, cursos=cursos, codigo=codigo)
     
     def _coletar_cursos(
         self,
@@ -106,47 +549,479 @@ class ColetaService:
         cursos = []
         cursos_lista = self.scraper.obter_cursos()
         
-        for codigo_curso, nome_curso in cursos_lista:
+        for posicao, (codigo_curso, nome_curso) in enumerate(cursos_lista):
+            item = ItemColeta(codigo_unidade, nome_unidade, codigo_curso, nome_curso)
+            self._ordem_cursos[(codigo_unidade, codigo_curso)] = posicao
+            curso = self._retomar_curso(item)
+            if curso:
+                cursos.append(curso)
+                if progress and task_id is not None:
+                    progress.update(task_id, advance=1)
+                continue
+
             print(f"  Coletando curso {nome_curso}")
             try:
-                curso = self._coletar_curso(codigo_curso, nome_curso, nome_unidade)
+                curso = self._coletar_curso(item)
                 if curso:
                     cursos.append(curso)
+            except Exception as e:
+                self._registrar_falha(item, e)
 
-                if progress and task_id is not None:
-                    progress.update(task_id, advance=1)
+            if progress and task_id is not None:
+                progress.update(task_id, advance=1)
+
+            try:
+                # Após coletar o curso, volta ao seletor de cursos da unidade
+                self.scraper.voltar_para_cursos(codigo_unidade)
+            except Exception as e:
+                print(f"Erro ao voltar aos cursos da unidade {nome_unidade}: {e}")
                 
-                # Após coletar o curso, retorna para a página da unidade para continuar
+        return cursos
+
+    def _planejar_itens(self, codigos_unidades: List[str]) -> Tuple[Dict[str, Unidade], List[ItemColeta]]:
+        """
+        Lista, com o scraper principal, todos os cursos das unidades a coletar.
+        
+        Args:
+            codigos_unidades: Códigos das unidades a coletar
+            
+        Returns:
+            Tupla (unidades sem cursos indexadas por código, itens de coleta na ordem original)
+        """
+        unidades: Dict[str, Unidade] = {}
+        itens: List[ItemColeta] = []
+
+        for codigo_unidade in codigos_unidades:
+            try:
                 self.scraper.acessar_pagina_inicial()
                 self.scraper.selecionar_unidade(codigo_unidade)
-                
+                lista_unidades = self.scraper.obter_unidades()
+                nome = next((nome for cod, nome in lista_unidades if cod == codigo_unidade), "Unidade Desconhecida")
+                cursos_lista = self.scraper.obter_cursos()
             except Exception as e:
-                print(f"Erro ao coletar curso {nome_curso}: {e}")
+                print(f"Erro ao coletar unidade {codigo_unidade}: {e}")
                 continue
-                
-        return cursos
 
-    def _coletar_curso(self, codigo: str, nome: str, nome_unidade: str) -> Optional[Curso]:
+            unidades[codigo_unidade] = Unidade(nome=nome, codigo=codigo_unidade)
+            itens.extend(
+                ItemColeta(codigo_unidade, nome, codigo_curso, nome_curso)
+                for codigo_curso, nome_curso in cursos_lista
+            )
+
+        return unidades, itens
+
+    def _coletar_em_paralelo(
+        self,
+        codigos_unidades: List[str],
+        progress: Optional["Progress"] = None,
+        task_id: Optional[int] = None
+    ) -> List[Unidade]:
         """
-        Coleta dados de um curso específico.
+        Coleta as unidades distribuindo os cursos entre vários scrapers.
+        
+        Os scrapers vêm de um PoolScrapers aquecido antes do início: o
+        scraper principal ocupa uma das vagas e a scraper_factory cria os
+        demais, de modo que workers scrapers ficam abertos. Cada worker (thread) consome itens de uma
+        fila compartilhada, pegando um scraper do pool para cada curso; o pool
+        substitui sessões mortas e recicla scrapers que passaram dos limites
+        de páginas ou memória. Os cursos coletados são reunidos nas unidades
+        mantendo a ordem original do Jupiter.
+        
+        Args:
+            codigos_unidades: Códigos das unidades a coletar
+            progress: Objeto de progresso do Rich (opcional)
+            task_id: ID da tarefa de progresso (opcional)
+            
+        Returns:
+            Lista de objetos Unidade com cursos e disciplinas preenchidos.
+        """
+        unidades, itens = self._planejar_itens(codigos_unidades)
+        resultados, pendentes = self._separar_pendentes(itens)
+        if not pendentes:
+            return self._montar_unidades(unidades, itens, resultados)
+
+        fila: "queue.Queue[Tuple[int, ItemColeta]]" = queue.Queue()
+        for pendente in pendentes:
+            fila.put(pendente)
+        acompanhamento = ProgressoColeta(progress, task_id, list(unidades), pendentes)
+
+        def executar_worker(indice: int) -> None:
+            task_worker = progress.add_task(f"Worker {indice + 1}", total=None) if progress else None
+            try:
+                while True:
+                    try:
+                        posicao, item = fila.get_nowait()
+                    except queue.Empty:
+                        return
+                    print(f"  Coletando curso {item.nome_curso}")
+                    try:
+                        with pool.emprestar() as scraper:
+                            scraper.voltar_para_cursos(item.codigo_unidade)
+                            resultados[posicao] = self._coletar_curso(item, scraper)
+                    except Exception as e:
+                        self._registrar_falha(item, e)
+                    acompanhamento.concluir(item, task_worker)
+            finally:
+                if progress and task_worker is not None:
+                    progress.update(task_worker, visible=False)
+
+        with PoolScrapers(
+            self.scraper_factory,
+            self.workers,
+            max_paginas=self.max_paginas_scraper,
+            max_memoria=self.max_memoria_scraper,
+            ao_descartar=self._acumular_estatisticas,
+            scraper_inicial=self.scraper
+        ) as pool:
+            pool.aquecer()
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for futuro in [executor.submit(executar_worker, i) for i in range(self.workers)]:
+                    futuro.result()
+            self.scrapers_reciclados = pool.recriados
+
+        return self._montar_unidades(unidades, itens, resultados)
+
+    def _separar_pendentes(
+        self,
+        itens: List[ItemColeta]
+    ) -> Tuple[Dict[int, Optional[Curso]], List[Tuple[int, ItemColeta]]]:
         """
+        Separa os cursos já concluídos no checkpoint dos que ainda precisam ser coletados.
+        
+        Args:
+            itens: Itens de coleta na ordem original
+            
+        Returns:
+            Tupla (cursos retomados por posição, itens pendentes com sua posição)
+        """
+        resultados: Dict[int, Optional[Curso]] = {}
+        pendentes: List[Tuple[int, ItemColeta]] = []
+        for posicao, item in enumerate(itens):
+            self._ordem_cursos[(item.codigo_unidade, item.codigo_curso)] = posicao
+            curso = self._retomar_curso(item)
+            if curso:
+                resultados[posicao] = curso
+            else:
+                pendentes.append((posicao, item))
+        return resultados, pendentes
+
+    def _coletar_em_pipeline(
+        self,
+        codigos_unidades: List[str],
+        progress: Optional["Progress"] = None,
+        task_id: Optional[int] = None
+    ) -> List[Unidade]:
+        """
+        Coleta as unidades num pipeline de três etapas: busca, análise e montagem.
+        
+        Na busca, uma thread por worker obtém o HTML das grades (com um
+        PoolScrapers que inclui o scraper principal se houver mais de um
+        worker, ou só com o scraper principal) e o coloca numa fila de capacidade_fila posições; quando a fila
+        enche, as buscas param até que a análise a esvazie. Na análise, as
+        páginas são processadas pelo parser num pool de processos_analise
+        processos, com no máximo duas páginas por processo em andamento. Na
+        montagem, a thread principal recebe as grades analisadas, cria os
+        cursos, grava o checkpoint e os reúne nas unidades na ordem original.
+        O desempenho de cada etapa fica em metricas_etapas.
+        
+        Args:
+            codigos_unidades: Códigos das unidades a coletar
+            progress: Objeto de progresso do Rich (opcional)
+            task_id: ID da tarefa de progresso (opcional)
+            
+        Returns:
+            Lista de objetos Unidade com cursos e disciplinas preenchidos.
+        """
+        inicio = time.perf_counter()
+        self.metricas_etapas = {etapa: MetricasEtapa() for etapa in ETAPAS_PIPELINE}
+        unidades, itens = self._planejar_itens(codigos_unidades)
+        resultados, pendentes = self._separar_pendentes(itens)
+        if not pendentes:
+            return self._montar_unidades(unidades, itens, resultados)
+
+        fila_itens: "queue.Queue[Tuple[int, ItemColeta]]" = queue.Queue()
+        for pendente in pendentes:
+            fila_itens.put(pendente)
+        # Itens (posição, item, página obtida); None indica o fim de um buscador
+        fila_paginas: queue.Queue = queue.Queue(maxsize=self.capacidade_fila)
+        acompanhamento = ProgressoColeta(progress, task_id, list(unidades), pendentes)
+        busca = self.metricas_etapas["busca"]
+        analise = self.metricas_etapas["analise"]
+        montagem = self.metricas_etapas["montagem"]
+
+        pool = None
+        if self.workers > 1 and self.scraper_factory:
+            pool = PoolScrapers(
+                self.scraper_factory,
+                self.workers,
+                max_paginas=self.max_paginas_scraper,
+                max_memoria=self.max_memoria_scraper,
+                ao_descartar=self._acumular_estatisticas,
+                scraper_inicial=self.scraper
+            )
+            pool.aquecer()
+        buscadores = self.workers if pool else 1
+
+        def buscar_paginas() -> None:
+            try:
+                while True:
+                    try:
+                        posicao, item = fila_itens.get_nowait()
+                    except queue.Empty:
+                        return
+                    print(f"  Coletando curso {item.nome_curso}")
+                    inicio_busca = time.perf_counter()
+                    pagina = None
+                    try:
+                        if pool:
+                            with pool.emprestar() as scraper:
+                                scraper.voltar_para_cursos(item.codigo_unidade)
+                                pagina = self._buscar_curso(item, scraper)
+                        else:
+                            self.scraper.voltar_para_cursos(item.codigo_unidade)
+                            pagina = self._buscar_curso(item, self.scraper)
+                    except Exception as e:
+                        self._registrar_falha(item, e)
+                    inicio_espera = time.perf_counter()
+                    # Bloqueia enquanto a análise não libera espaço na fila (backpressure)
+                    fila_paginas.put((posicao, item, pagina))
+                    with self._trava:
+                        busca.itens += 1
+                        busca.tempo_ocupado += inicio_espera - inicio_busca
+                        busca.tempo_bloqueado += time.perf_counter() - inicio_espera
+            finally:
+                fila_paginas.put(None)
+
+        def montar(posicao: int, item: ItemColeta, html: str, curso: Optional[Curso], grade: Optional[ResultadoGrade]) -> None:
+            inicio_montagem = time.perf_counter()
+            try:
+                if curso is None:
+                    curso = self._criar_curso(item, grade)
+                self._concluir_curso(item, curso, html)
+                resultados[posicao] = curso
+            except Exception as e:
+                self._registrar_falha(item, e)
+            montagem.itens += 1
+            montagem.tempo_ocupado += time.perf_counter() - inicio_montagem
+            acompanhamento.concluir(item)
+
+        em_analise: Dict[Future, Tuple[int, ItemColeta, str]] = {}
+        limite_analise = 2 * self.processos_analise
+        ativos = buscadores
         try:
-            html_grade = self.scraper.acessar_grade_curso(codigo)
-            if not html_grade:
-                print(f"  Aviso: Grade curricular não disponível para o curso {nome}")
+            with ProcessPoolExecutor(
+                max_workers=self.processos_analise,
+                initializer=_iniciar_processo_analise,
+                initargs=(self.parser,)
+            ) as analisadores, ThreadPoolExecutor(max_workers=buscadores) as executor:
+                futuros_busca = [executor.submit(buscar_paginas) for _ in range(buscadores)]
+
+                while ativos or em_analise:
+                    prontos = {futuro for futuro in em_analise if futuro.done()}
+                    if not prontos and em_analise and (not ativos or len(em_analise) >= limite_analise):
+                        prontos, _ = wait(em_analise, return_when=FIRST_COMPLETED)
+                    for futuro in prontos:
+                        posicao, item, html = em_analise.pop(futuro)
+                        try:
+                            grade, tempo = futuro.result()
+                        except Exception as e:
+                            self._registrar_falha(item, e)
+                            acompanhamento.concluir(item)
+                            continue
+                        analise.itens += 1
+                        analise.tempo_ocupado += tempo
+                        montar(posicao, item, html, None, grade)
+
+                    if not ativos or len(em_analise) >= limite_analise:
+                        continue
+                    try:
+                        entrada = fila_paginas.get(timeout=0.05 if em_analise else None)
+                    except queue.Empty:
+                        continue
+                    if entrada is None:
+                        ativos -= 1
+                        continue
+
+                    posicao, item, pagina = entrada
+                    if pagina is None:
+                        # Falha na busca ou curso sem grade
+                        acompanhamento.concluir(item)
+                        continue
+                    html, curso = pagina
+                    if curso is not None:
+                        montar(posicao, item, html, curso, None)
+                    else:
+                        em_analise[analisadores.submit(_analisar_pagina, html)] = (posicao, item, html)
+
+                for futuro in futuros_busca:
+                    futuro.result()
+        finally:
+            if pool:
+                self.scrapers_reciclados = pool.recriados
+                pool.fechar()
+            self.duracao_pipeline = time.perf_counter() - inicio
+
+        return self._montar_unidades(unidades, itens, resultados)
+
+    def _montar_unidades(
+        self,
+        unidades: Dict[str, Unidade],
+        itens: List[ItemColeta],
+        resultados: Dict[int, Optional[Curso]]
+    ) -> List[Unidade]:
+        """
+        Reúne os cursos coletados nas unidades, na ordem original dos itens.
+        
+        Args:
+            unidades: Unidades sem cursos indexadas por código
+            itens: Itens de coleta na ordem original
+            resultados: Curso coletado para cada posição de itens
+            
+        Returns:
+            Lista de objetos Unidade com seus cursos
+        """
+        for posicao, item in enumerate(itens):
+            curso = resultados.get(posicao)
+            if curso:
+                unidades[item.codigo_unidade].adicionar_curso(curso)
+
+        return list(unidades.values())
+
+    def _coletar_curso(self, item: ItemColeta, scraper: Optional[WebScraper] = None) -> Optional[Curso]:
+        """
+        Coleta dados de um curso específico.
+        
+        Args:
+            item: Curso a coletar, com os dados da sua unidade
+            scraper: Scraper a usar (padrão: o scraper principal do serviço)
+            
+        Returns:
+            Curso coletado, ou None se o Jupiter não tem grade para ele
+            
+        Raises:
+            Exception: Se a grade não pôde ser obtida ou processada
+        """
+        scraper = scraper or self.scraper
+        with self._cronometrar_curso():
+            pagina = self._obter_pagina(item, scraper)
+            if pagina is None:
                 return None
-                
-            duracao = self.parser.extrair_duracoes(html_grade)
-            obrigatorias, optativas_livres, optativas_eletivas = self.parser.extrair_disciplinas(html_grade)
-            
-            return Curso(
-                nome=nome,
-                unidade=nome_unidade,
-                duracao=duracao,
-                obrigatorias=obrigatorias,
-                optativas_livres=optativas_livres,
-                optativas_eletivas=optativas_eletivas
+
+            html_grade, curso = pagina
+            if curso is None:
+                curso = self._criar_curso(item, self.parser.extrair_grade(html_grade))
+            self._concluir_curso(item, curso, html_grade)
+            return curso
+
+    def _buscar_curso(self, item: ItemColeta, scraper: WebScraper) -> Optional[Tuple[str, Optional[Curso]]]:
+        """
+        Obtém a página de um curso contabilizando-o como visitado (etapa de busca do pipeline).
+        
+        Args:
+            item: Curso a coletar, com os dados da sua unidade
+            scraper: Scraper a usar
+            
+        Returns:
+            O mesmo que _obter_pagina
+        """
+        with self._cronometrar_curso():
+            return self._obter_pagina(item, scraper)
+
+    @contextmanager
+    def _cronometrar_curso(self) -> Iterator[None]:
+        """
+        Soma o curso e o tempo gasto no bloco with às estatísticas da coleta.
+        """
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._trava:
+                self.cursos_visitados += 1
+                self.tempo_cursos += time.perf_counter() - inicio
+
+    def _obter_pagina(self, item: ItemColeta, scraper: WebScraper) -> Optional[Tuple[str, Optional[Curso]]]:
+        """
+        Busca a grade do curso com o scraper informado, sem analisá-la.
+        
+        Antes do parser, a página é classificada: só a grade segue adiante;
+        o popup de erro do Jupiter faz o curso ser ignorado, e a página de
+        bloqueio ou sem conteúdo gera exceção para que o curso seja tentado
+        de novo. A grade é guardada no cache de HTML e, na coleta
+        incremental, o curso anterior é reaproveitado se ela não mudou.
+        
+        Args:
+            item: Curso a coletar, com os dados da sua unidade
+            scraper: Scraper a usar
+            
+        Returns:
+            Tupla (HTML da grade, curso reaproveitado ou None), ou None se o
+            Jupiter não tem grade para o curso
+            
+        Raises:
+            RuntimeError: Se a página recebida foi de bloqueio ou veio vazia
+        """
+        nome = item.nome_curso
+        html_grade = scraper.acessar_grade_curso(item.codigo_curso)
+        # None é como os scrapers indicam o popup de erro
+        tipo = classificar_pagina(html_grade) if html_grade is not None else PAGINA_ERRO
+        with self._trava:
+            self.paginas_por_tipo[tipo] += 1
+
+        if tipo == PAGINA_ERRO:
+            print(f"  Aviso: Grade curricular não disponível para o curso {nome}")
+            return None
+        if tipo != PAGINA_GRADE:
+            raise RuntimeError(f"Página inesperada ({tipo}) recebida no lugar da grade do curso {nome}")
+
+        if self.cache_html:
+            self.cache_html.salvar(
+                item.codigo_unidade, item.nome_unidade, item.codigo_curso, nome, html_grade
+            )
+
+        curso = None
+        if self.incremental:
+            curso = self.incremental.reaproveitar(item.codigo_unidade, item.codigo_curso, html_grade)
+        return html_grade, curso
+
+    @staticmethod
+    def _criar_curso(item: ItemColeta, grade: ResultadoGrade) -> Curso:
+        """
+        Monta o objeto Curso a partir da grade extraída pelo parser.
+        
+        Args:
+            item: Curso coletado, com os dados da sua unidade
+            grade: Tupla (duração, obrigatórias, optativas livres, optativas eletivas)
+            
+        Returns:
+            Objeto Curso
+        """
+        duracao, obrigatorias, optativas_livres, optativas_eletivas = grade
+        return Curso(
+            nome=item.nome_curso,
+            unidade=item.nome_unidade,
+            duracao=duracao,
+            obrigatorias=obrigatorias,
+            optativas_livres=optativas_livres,
+            optativas_eletivas=optativas_eletivas,
+            codigo=item.codigo_curso
+        )
+
+    def _concluir_curso(self, item: ItemColeta, curso: Curso, html_grade: str) -> None:
+        """
+        Registra no checkpoint e exporta em NDJSON, se configurados, um curso coletado.
+        
+        Args:
+            item: Curso coletado, com os dados da sua unidade
+            curso: Objeto Curso montado
+            html_grade: HTML de onde o curso foi extraído
+        """
+        if self.checkpoint:
+            self.checkpoint.registrar(
+                item.codigo_unidade,
+                item.nome_unidade,
+                curso,
+                ColetaIncremental.calcular_hash(html_grade)
             )
-        except Exception as e:
-            print(f"Erro ao processar curso {nome}: {e}")
-            return None
\ No newline at end of file
+        if self.exportador:
+            self.exportador.exportar(item.codigo_unidade, item.nome_unidade, curso)
@@ -1,8 +1,13 @@
 from typing import List, Dict, Tuple, Optional
 from collections import defaultdict
+from itertools import chain
 from ..models.unidade import Unidade
 from ..models.curso import Curso
 from ..models.disciplina import Disciplina
+from .agregados import AgregadoCurso, AgregadoUnidade
+from .busca_texto import TIPO_CURSO, TIPO_DISCIPLINA, IndiceTexto, ResultadoBusca
+from .indice_numerico import IndiceNumerico
+from .visao_colunar import VisaoColunar
 
 class ConsultaService:
     """
@@ -16,14 +21,50 @@ class ConsultaService:
         _index_unidades: Dicionário para busca rápida de unidades
         _index_cursos: Dicionário para busca rápida de cursos
         _index_disciplinas: Dicionário para busca rápida de disciplinas
+        _indice_texto: Índice invertido para busca textual em nomes de disciplinas e cursos
+        _indice_numerico: Índice ordenado para consultas por faixa de créditos e cargas
+        _agregados_cursos: Curso e seus totais, por id(curso)
+        _agregados_unidades: Unidade e seus totais, por id(unidade)
+        _visao_colunar: Visão NumPy das disciplinas, criada na primeira chamada a visao_colunar
     """
 
     def __init__(self, unidades: List[Unidade]):
         self.unidades = unidades
+        self._construir_indices()
+
+    def _versao_dados(self) -> Tuple[int, int]:
+        """
+        Obtém a versão das unidades consultadas por este serviço.
+        
+        Returns:
+            Tupla (quantidade de unidades, soma das versões das unidades);
+            muda a cada adicionar_curso numa delas ou unidade nova na lista
+        """
+        return len(self.unidades), sum(unidade.versao for unidade in self.unidades)
+
+    def _construir_indices(self) -> None:
+        """Cria os índices e os totais a partir das unidades."""
+        self._versao = self._versao_dados()
         self._index_unidades = self._criar_index_unidades()
         self._index_siglas = self._criar_index_siglas()
         self._index_cursos = self._criar_index_cursos()
         self._index_disciplinas = self._criar_index_disciplinas()
+        self._indice_texto = self._criar_indice_texto()
+        self._indice_numerico = IndiceNumerico(self.unidades)
+        self._agregados_cursos = self._criar_agregados_cursos()
+        self._agregados_unidades = self._criar_agregados_unidades()
+        self._visao_colunar: Optional[VisaoColunar] = None
+
+    def _sincronizar(self) -> None:
+        """
+        Recria os índices e os totais se alguma unidade ganhou cursos desde a última criação.
+        
+        São percebidas as inclusões feitas por Unidade.adicionar_curso nas
+        unidades deste serviço e as novas unidades na lista; alterações
+        diretas nas listas não são.
+        """
+        if self._versao_dados() != self._versao:
+            self._construir_indices()
 
     def _criar_index_unidades(self) -> Dict[str, Unidade]:
         """Cria índice para busca rápida de unidades."""
@@ -73,6 +114,64 @@ class ConsultaService:
                     index[disciplina.codigo].append((disciplina, curso))
         return index
 
+    def _criar_indice_texto(self) -> IndiceTexto:
+        """Cria índice para busca textual por nomes de disciplinas e cursos."""
+        disciplinas = (
+            (TIPO_DISCIPLINA, codigo, ocorrencias[0][0].nome)
+            for codigo, ocorrencias in self._index_disciplinas.items()
+        )
+        cursos = ((TIPO_CURSO, curso.nome, curso.nome) for curso in self._index_cursos.values())
+        return IndiceTexto(chain(disciplinas, cursos))
+
+    def _criar_agregados_cursos(self) -> Dict[int, Tuple[Curso, AgregadoCurso]]:
+        """
+        Calcula os totais de cada curso.
+        
+        A chave é a identidade do curso, pois dois cursos podem ter o mesmo
+        nome e nenhum código; o próprio curso fica no valor, o que o mantém
+        vivo e impede que seu id seja reaproveitado enquanto o índice existir.
+        """
+        return {
+            id(curso): (curso, AgregadoCurso.de_curso(curso))
+            for unidade in self.unidades
+            for curso in unidade.cursos
+        }
+
+    def _criar_agregados_unidades(self) -> Dict[int, Tuple[Unidade, AgregadoUnidade]]:
+        """Soma os totais dos cursos de cada unidade, com a chave pela identidade da unidade."""
+        return {
+            id(unidade): (
+                unidade,
+                AgregadoUnidade.de_unidade(unidade, [self._agregado_curso(curso) for curso in unidade.cursos])
+            )
+            for unidade in self.unidades
+        }
+
+    def _agregado_curso(self, curso: Curso) -> AgregadoCurso:
+        """Obtém os totais já calculados de um curso das unidades deste serviço."""
+        return self._agregados_cursos[id(curso)][1]
+
+    def _agregado_unidade(self, unidade: Unidade) -> AgregadoUnidade:
+        """Obtém os totais já calculados de uma unidade deste serviço."""
+        return self._agregados_unidades[id(unidade)][1]
+
+    def visao_colunar(self) -> VisaoColunar:
+        """
+        Obtém a visão colunar (NumPy) das disciplinas, para análises vetorizadas.
+        
+        A visão é criada na primeira chamada e recriada quando as unidades mudam.
+        
+        Returns:
+            Visão colunar das unidades consultadas
+            
+        Raises:
+            ImportError: Se o numpy não estiver instalado
+        """
+        self._sincronizar()
+        if self._visao_colunar is None:
+            self._visao_colunar = VisaoColunar(self.unidades)
+        return self._visao_colunar
+
     def listar_unidades(self) -> List[str]:
         """
         Lista todas as unidades disponíveis.
@@ -86,12 +185,14 @@ class ConsultaService:
         """
         Lista todos os nomes de cursos disponíveis.
         """
+        self._sincronizar()
         return sorted([curso.nome for curso in self._index_cursos.values()])
 
     def listar_codigos_disciplinas(self) -> List[str]:
         """
         Lista todos os códigos de disciplinas disponíveis.
         """
+        self._sincronizar()
         return sorted(self._index_disciplinas.keys())
 
     def buscar_unidade(self, termo: str) -> Optional[Unidade]:
@@ -104,6 +205,7 @@ class ConsultaService:
         Returns:
             Unidade encontrada ou None
         """
+        self._sincronizar()
         termo = termo.strip()
         unidade = self._index_unidades.get(termo.lower())
         if unidade:
@@ -135,6 +237,7 @@ class ConsultaService:
         Returns:
             Curso encontrado ou None
         """
+        self._sincronizar()
         return self._index_cursos.get(nome.lower())
 
     def buscar_disciplina(self, codigo: str) -> List[Tuple[Disciplina, Curso]]:
@@ -147,8 +250,26 @@ class ConsultaService:
         Returns:
             Lista de tuplas (disciplina, curso) onde a disciplina aparece
         """
+        self._sincronizar()
         return self._index_disciplinas.get(codigo.upper(), [])
 
+    def buscar_por_texto(self, termo: str, limite: int = 10) -> List[ResultadoBusca]:
+        """
+        Busca disciplinas e cursos por palavras do nome ou do código.
+        
+        A busca ignora acentos e maiúsculas, aceita prefixos ("calc")
+        e tolera pequenos erros de digitação.
+        
+        Args:
+            termo: Texto da busca
+            limite: Quantidade máxima de resultados
+            
+        Returns:
+            Resultados ordenados por relevância
+        """
+        self._sincronizar()
+        return self._indice_texto.buscar(termo, limite)
+
     def listar_disciplinas_comuns(self) -> Dict[str, List[Tuple[Disciplina, Curso]]]:
         """
         Lista disciplinas que aparecem em mais de um curso.
@@ -156,6 +277,7 @@ class ConsultaService:
         Returns:
             Dicionário com código da disciplina e lista de ocorrências
         """
+        self._sincronizar()
         return {
             codigo: ocorrencias
             for codigo, ocorrencias in self._index_disciplinas.items()
@@ -173,13 +295,14 @@ class ConsultaService:
         if not curso:
             return None
 
+        agregado = self._agregado_curso(curso)
         return {
             'nome': curso.nome,
-            'total_creditos': sum(d.creditos_totais for d in curso.todas_disciplinas),
-            'total_ch': sum(d.carga_horaria for d in curso.todas_disciplinas),
-            'qtd_obrigatorias': len(curso.obrigatorias),
-            'qtd_optativas_livres': len(curso.optativas_livres),
-            'qtd_optativas_eletivas': len(curso.optativas_eletivas)
+            'total_creditos': agregado.total_creditos,
+            'total_ch': agregado.total_ch,
+            'qtd_obrigatorias': agregado.qtd_obrigatorias,
+            'qtd_optativas_livres': agregado.qtd_optativas_livres,
+            'qtd_optativas_eletivas': agregado.qtd_optativas_eletivas
         }
 
     def comparar_cursos(self, nome_curso1: str, nome_curso2: str) -> Optional[tuple]:
@@ -195,16 +318,19 @@ class ConsultaService:
         if not curso1 or not curso2:
             return None
 
+        agregado1 = self._agregado_curso(curso1)
+        agregado2 = self._agregado_curso(curso2)
+
         dados_curso1 = {
             'nome': curso1.nome,
-            'total_disciplinas': len(curso1.todas_disciplinas),
-            'total_ch': sum(d.carga_horaria for d in curso1.todas_disciplinas)
+            'total_disciplinas': agregado1.total_disciplinas,
+            'total_ch': agregado1.total_ch
         }
 
         dados_curso2 = {
             'nome': curso2.nome,
-            'total_disciplinas': len(curso2.todas_disciplinas),
-            'total_ch': sum(d.carga_horaria for d in curso2.todas_disciplinas)
+            'total_disciplinas': agregado2.total_disciplinas,
+            'total_ch': agregado2.total_ch
         }
 
         return dados_curso1, dados_curso2
@@ -216,13 +342,48 @@ class ConsultaService:
         Returns:
             Lista de tuplas (disciplina, curso, unidade)
         """
-        resultados = []
-        for unidade in self.unidades:
-            for curso in unidade.cursos:
-                for disc in curso.todas_disciplinas:
-                    if disc.creditos_totais >= min_creditos:
-                        resultados.append((disc, curso, unidade))
-        return resultados
+        self._sincronizar()
+        return self._indice_numerico.faixa("creditos_totais", minimo=min_creditos)
+
+    def listar_disciplinas_por_faixa(
+        self,
+        campo: str,
+        minimo: Optional[int] = None,
+        maximo: Optional[int] = None
+    ) -> List[tuple]:
+        """
+        Lista disciplinas cujo campo numérico está numa faixa de valores.
+        
+        Args:
+            campo: Campo numérico (ex: "creditos_totais", "carga_horaria")
+            minimo: Menor valor aceito (None para sem limite)
+            maximo: Maior valor aceito (None para sem limite)
+            
+        Returns:
+            Lista de tuplas (disciplina, curso, unidade)
+            
+        Raises:
+            ValueError: Se o campo não for numérico
+        """
+        self._sincronizar()
+        return self._indice_numerico.faixa(campo, minimo, maximo)
+
+    def listar_maiores_disciplinas(self, campo: str, quantidade: int) -> List[tuple]:
+        """
+        Lista as disciplinas com os maiores valores de um campo numérico.
+        
+        Args:
+            campo: Campo numérico (ex: "creditos_totais", "carga_horaria")
+            quantidade: Quantidade máxima de resultados
+            
+        Returns:
+            Lista de tuplas (disciplina, curso, unidade), do maior para o menor valor
+            
+        Raises:
+            ValueError: Se o campo não for numérico
+        """
+        self._sincronizar()
+        return self._indice_numerico.maiores(campo, quantidade)
 
     def analisar_unidade(self, nome_unidade: str) -> Optional[dict]:
         """
@@ -235,26 +396,14 @@ class ConsultaService:
         if not unidade:
             return None
 
-        cursos_info = []
-        total_disciplinas = 0
-        total_ch = 0
-
-        for curso in unidade.cursos:
-            disc_curso = len(curso.todas_disciplinas)
-            ch_curso = sum(d.carga_horaria for d in curso.todas_disciplinas)
-            total_disciplinas += disc_curso
-            total_ch += ch_curso
-
-            cursos_info.append({
-                'nome': curso.nome,
-                'disciplinas': disc_curso,
-                'carga_horaria': ch_curso
-            })
-
+        agregado = self._agregado_unidade(unidade)
         return {
             'nome': unidade.nome,
-            'total_cursos': len(unidade.cursos),
-            'cursos': cursos_info,
-            'total_disciplinas': total_disciplinas,
-            'total_ch': total_ch
-        }
\ No newline at end of file
+            'total_cursos': agregado.total_cursos,
+            'cursos': [
+                {'nome': nome, 'disciplinas': disciplinas, 'carga_horaria': carga_horaria}
+                for nome, disciplinas, carga_horaria in agregado.cursos
+            ],
+            'total_disciplinas': agregado.total_disciplinas,
+            'total_ch': agregado.total_ch
+        }
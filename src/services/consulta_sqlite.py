@@ -0,0 +1,582 @@
+import sqlite3
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..models.curso import Curso
+from ..models.disciplina import Disciplina
+from ..models.duracao_curso import DuracaoCurso
+from ..models.registro_disciplinas import REGISTRO_DISCIPLINAS, RegistroDisciplinas
+from ..models.unidade import Unidade
+from ..persistencia.serializacao import CAMPOS_DISCIPLINA, TIPOS_DISCIPLINA
+from .busca_texto import TIPO_CURSO, TIPO_DISCIPLINA, IndiceTexto, ResultadoBusca
+from .consulta_service import ConsultaService
+from .indice_numerico import CAMPOS_NUMERICOS
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS unidades (
+    id INTEGER PRIMARY KEY,
+    codigo TEXT NOT NULL,
+    nome TEXT NOT NULL,
+    nome_busca TEXT NOT NULL,
+    sigla TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cursos (
+    id INTEGER PRIMARY KEY,
+    unidade_id INTEGER NOT NULL REFERENCES unidades(id),
+    codigo TEXT NOT NULL,
+    nome TEXT NOT NULL,
+    nome_busca TEXT NOT NULL,
+    duracao_ideal INTEGER NOT NULL,
+    duracao_minima INTEGER NOT NULL,
+    duracao_maxima INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS disciplinas (
+    id INTEGER PRIMARY KEY,
+    codigo TEXT NOT NULL,
+    nome TEXT NOT NULL,
+    creditos_aula INTEGER NOT NULL,
+    creditos_trabalho INTEGER NOT NULL,
+    carga_horaria INTEGER NOT NULL,
+    carga_estagio INTEGER NOT NULL,
+    carga_praticas INTEGER NOT NULL,
+    atividades_aprofundamento INTEGER NOT NULL,
+    creditos_totais INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS curso_disciplina (
+    id INTEGER PRIMARY KEY,
+    curso_id INTEGER NOT NULL REFERENCES cursos(id),
+    disciplina_id INTEGER NOT NULL REFERENCES disciplinas(id),
+    tipo TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_unidades_nome ON unidades(nome_busca);
+CREATE INDEX IF NOT EXISTS idx_unidades_sigla ON unidades(sigla);
+CREATE INDEX IF NOT EXISTS idx_cursos_nome ON cursos(nome_busca);
+CREATE INDEX IF NOT EXISTS idx_cursos_unidade ON cursos(unidade_id);
+CREATE INDEX IF NOT EXISTS idx_disciplinas_codigo ON disciplinas(codigo);
+CREATE INDEX IF NOT EXISTS idx_disciplinas_creditos ON disciplinas(creditos_totais);
+CREATE INDEX IF NOT EXISTS idx_disciplinas_carga ON disciplinas(carga_horaria);
+CREATE INDEX IF NOT EXISTS idx_membros_curso ON curso_disciplina(curso_id, tipo);
+CREATE INDEX IF NOT EXISTS idx_membros_disciplina ON curso_disciplina(disciplina_id);
+"""
+
+# Colunas de disciplina lidas nas consultas, na ordem de CAMPOS_DISCIPLINA
+_COLUNAS_DISCIPLINA = ", ".join(f"d.{campo}" for campo in CAMPOS_DISCIPLINA)
+
+class ConsultaSqliteService:
+    """
+    Serviço de consultas que responde com SQL sobre um banco SQLite indexado.
+
+    Oferece os mesmos métodos do ConsultaService, mas os dados ficam no
+    banco (tabelas unidades, cursos, disciplinas e curso_disciplina) em vez
+    de índices em memória: cada consulta lê apenas as linhas de que precisa,
+    de modo que bases grandes, como as de vários semestres, podem ser
+    consultadas sem carregar tudo. Cada banco guarda um conjunto de dados;
+    semestres diferentes ficam em arquivos diferentes.
+
+    Os cursos devolvidos são montados sob demanda com suas disciplinas,
+    obtidas do registro de disciplinas, de modo que são as mesmas instâncias
+    canônicas usadas pelo parser e pelos snapshots. As unidades devolvidas
+    por listar_disciplinas_por_creditos trazem apenas nome e código, sem a
+    lista de cursos.
+
+    Attributes:
+        caminho: Caminho do arquivo do banco SQLite
+        registro: Registro de onde vêm as disciplinas devolvidas
+    """
+
+    def __init__(self, caminho: str, registro: Optional[RegistroDisciplinas] = None):
+        """
+        Abre (ou cria) o banco de consultas.
+
+        Args:
+            caminho: Caminho do arquivo do banco SQLite
+            registro: Registro de disciplinas (padrão: o registro global)
+        """
+        self.caminho = caminho
+        self.registro = registro if registro is not None else REGISTRO_DISCIPLINAS
+        self._conexao = sqlite3.connect(caminho)
+        self._conexao.executescript(ESQUEMA)
+        self._indice_texto: Optional[IndiceTexto] = None
+
+    def carregar(self, unidades: Iterable[Unidade]) -> None:
+        """
+        Substitui o conteúdo do banco pelas unidades informadas, numa única transação.
+
+        As disciplinas idênticas em vários cursos são gravadas uma só vez.
+
+        Args:
+            unidades: Unidades com cursos e disciplinas (ex: de um snapshot)
+        """
+        disciplinas: Dict[Tuple, int] = {}
+        with self._conexao:
+            for tabela in ("curso_disciplina", "disciplinas", "cursos", "unidades"):
+                self._conexao.execute(f"DELETE FROM {tabela}")
+
+            for unidade_id, unidade in enumerate(unidades, 1):
+                self._conexao.execute(
+                    "INSERT INTO unidades VALUES (?, ?, ?, ?, ?)",
+                    (unidade_id, unidade.codigo, unidade.nome, unidade.nome.lower(),
+                     ConsultaService._extrair_sigla(unidade.nome))
+                )
+                for curso in unidade.cursos:
+                    curso_id = self._conexao.execute(
+                        "INSERT INTO cursos (unidade_id, codigo, nome, nome_busca, duracao_ideal,"
+                        " duracao_minima, duracao_maxima) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (unidade_id, curso.codigo, curso.nome, curso.nome.lower(),
+                         curso.duracao.ideal, curso.duracao.minima, curso.duracao.maxima)
+                    ).lastrowid
+
+                    membros = []
+                    for tipo in TIPOS_DISCIPLINA:
+                        for disciplina in getattr(curso, tipo):
+                            valores = tuple(getattr(disciplina, campo) for campo in CAMPOS_DISCIPLINA)
+                            disciplina_id = disciplinas.get(valores)
+                            if disciplina_id is None:
+                                disciplina_id = len(disciplinas) + 1
+                                disciplinas[valores] = disciplina_id
+                                self._conexao.execute(
+                                    "INSERT INTO disciplinas VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                    (disciplina_id, *valores, disciplina.creditos_totais)
+                                )
+                            membros.append((curso_id, disciplina_id, tipo))
+                    self._conexao.executemany(
+                        "INSERT INTO curso_disciplina (curso_id, disciplina_id, tipo) VALUES (?, ?, ?)",
+                        membros
+                    )
+        self._conexao.execute("ANALYZE")
+        self._indice_texto = None
+
+    def fechar(self) -> None:
+        """Fecha a conexão com o banco."""
+        self._conexao.close()
+
+    def __enter__(self):
+        """
+        Permite uso do serviço com context manager.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Garante que a conexão será fechada ao sair do context manager.
+        """
+        self.fechar()
+
+    def _id_unidade(self, termo: str) -> Optional[int]:
+        """
+        Localiza uma unidade pelo nome completo ou sigla, como o ConsultaService.
+
+        Args:
+            termo: Nome completo ou sigla da unidade
+
+        Returns:
+            Id da unidade no banco ou None
+        """
+        termo = termo.strip()
+        linha = self._conexao.execute(
+            "SELECT id FROM unidades WHERE nome_busca = ? ORDER BY id DESC LIMIT 1", (termo.lower(),)
+        ).fetchone()
+        if linha is None:
+            linha = self._conexao.execute(
+                "SELECT id FROM unidades WHERE sigla = ? ORDER BY id DESC LIMIT 1", (termo.upper(),)
+            ).fetchone()
+        return linha[0] if linha else None
+
+    def _id_curso(self, nome: str) -> Optional[int]:
+        """
+        Localiza um curso pelo nome (o último com esse nome, como o ConsultaService).
+
+        Args:
+            nome: Nome do curso
+
+        Returns:
+            Id do curso no banco ou None
+        """
+        linha = self._conexao.execute(
+            "SELECT id FROM cursos WHERE nome_busca = ? ORDER BY id DESC LIMIT 1", (nome.lower(),)
+        ).fetchone()
+        return linha[0] if linha else None
+
+    def _montar_curso(self, curso_id: int) -> Curso:
+        """
+        Monta um Curso, com duração e disciplinas, a partir do banco.
+
+        Args:
+            curso_id: Id do curso no banco
+
+        Returns:
+            Objeto Curso
+        """
+        nome, unidade, codigo, ideal, minima, maxima = self._conexao.execute(
+            "SELECT c.nome, u.nome, c.codigo, c.duracao_ideal, c.duracao_minima, c.duracao_maxima"
+            " FROM cursos c JOIN unidades u ON u.id = c.unidade_id WHERE c.id = ?", (curso_id,)
+        ).fetchone()
+        curso = Curso(nome, unidade, DuracaoCurso(ideal, minima, maxima), codigo=codigo)
+        for tipo, *valores in self._conexao.execute(
+            f"SELECT m.tipo, {_COLUNAS_DISCIPLINA} FROM curso_disciplina m"
+            " JOIN disciplinas d ON d.id = m.disciplina_id WHERE m.curso_id = ? ORDER BY m.id",
+            (curso_id,)
+        ):
+            getattr(curso, tipo).append(self.registro.obter(*valores))
+        return curso
+
+    def _ocorrencias(self, filtro: str, parametros: tuple) -> List[Tuple[Disciplina, int]]:
+        """
+        Lista as participações de disciplinas em cursos, na ordem de coleta.
+
+        Args:
+            filtro: Condição SQL sobre as disciplinas (alias d) ou participações (alias m)
+            parametros: Parâmetros da condição
+
+        Returns:
+            Lista de tuplas (disciplina, id do curso)
+        """
+        return [
+            (self.registro.obter(*valores), curso_id)
+            for curso_id, *valores in self._conexao.execute(
+                f"SELECT m.curso_id, {_COLUNAS_DISCIPLINA} FROM curso_disciplina m"
+                f" JOIN disciplinas d ON d.id = m.disciplina_id WHERE {filtro} ORDER BY m.id",
+                parametros
+            )
+        ]
+
+    def _totais_curso(self, curso_id: int) -> Tuple[int, int, int]:
+        """
+        Soma as disciplinas de um curso.
+
+        Args:
+            curso_id: Id do curso no banco
+
+        Returns:
+            Tupla (quantidade de disciplinas, total de créditos, total de carga horária)
+        """
+        return self._conexao.execute(
+            "SELECT COUNT(*), COALESCE(SUM(d.creditos_totais), 0), COALESCE(SUM(d.carga_horaria), 0)"
+            " FROM curso_disciplina m JOIN disciplinas d ON d.id = m.disciplina_id WHERE m.curso_id = ?",
+            (curso_id,)
+        ).fetchone()
+
+    def listar_unidades(self) -> List[str]:
+        """
+        Lista todas as unidades disponíveis.
+
+        Returns:
+            Lista com os nomes das unidades
+        """
+        return [nome for nome, in self._conexao.execute("SELECT nome FROM unidades ORDER BY id")]
+
+    def listar_todos_cursos(self) -> List[str]:
+        """
+        Lista todos os nomes de cursos disponíveis.
+        """
+        return [
+            nome for nome, in self._conexao.execute(
+                "SELECT nome FROM cursos WHERE id IN (SELECT MAX(id) FROM cursos GROUP BY nome_busca)"
+                " ORDER BY nome"
+            )
+        ]
+
+    def listar_codigos_disciplinas(self) -> List[str]:
+        """
+        Lista todos os códigos de disciplinas disponíveis.
+        """
+        return [
+            codigo for codigo, in self._conexao.execute(
+                "SELECT DISTINCT d.codigo FROM disciplinas d"
+                " WHERE EXISTS (SELECT 1 FROM curso_disciplina m WHERE m.disciplina_id = d.id)"
+                " ORDER BY d.codigo"
+            )
+        ]
+
+    def buscar_unidade(self, termo: str) -> Optional[Unidade]:
+        """
+        Busca uma unidade pelo nome completo ou sigla.
+
+        Args:
+            termo: Nome completo ou sigla da unidade
+
+        Returns:
+            Unidade encontrada, com seus cursos, ou None
+        """
+        unidade_id = self._id_unidade(termo)
+        if unidade_id is None:
+            return None
+        nome, codigo = self._conexao.execute(
+            "SELECT nome, codigo FROM unidades WHERE id = ?", (unidade_id,)
+        ).fetchone()
+        cursos = self._conexao.execute(
+            "SELECT id FROM cursos WHERE unidade_id = ? ORDER BY id", (unidade_id,)
+        ).fetchall()
+        return Unidade(nome, [self._montar_curso(curso_id) for curso_id, in cursos], codigo)
+
+    def listar_cursos_por_unidade(self, termo: str) -> Optional[tuple]:
+        """
+        Obtém os cursos de uma unidade específica.
+
+        Args:
+            termo: Nome completo ou sigla da unidade
+
+        Returns:
+            Tupla (nome_unidade, lista_cursos) ou None se não encontrada
+        """
+        unidade_id = self._id_unidade(termo)
+        if unidade_id is None:
+            return None
+        nome, = self._conexao.execute("SELECT nome FROM unidades WHERE id = ?", (unidade_id,)).fetchone()
+        cursos = self._conexao.execute(
+            "SELECT nome FROM cursos WHERE unidade_id = ? ORDER BY id", (unidade_id,)
+        )
+        return nome, [nome_curso for nome_curso, in cursos]
+
+    def buscar_curso(self, nome: str) -> Optional[Curso]:
+        """
+        Busca um curso pelo nome.
+
+        Args:
+            nome: Nome do curso
+
+        Returns:
+            Curso encontrado ou None
+        """
+        curso_id = self._id_curso(nome)
+        return self._montar_curso(curso_id) if curso_id is not None else None
+
+    def buscar_disciplina(self, codigo: str) -> List[Tuple[Disciplina, Curso]]:
+        """
+        Busca uma disciplina pelo código.
+
+        Args:
+            codigo: Código da disciplina
+
+        Returns:
+            Lista de tuplas (disciplina, curso) onde a disciplina aparece
+        """
+        cursos: Dict[int, Curso] = {}
+        resultados = []
+        for disciplina, curso_id in self._ocorrencias("d.codigo = ?", (codigo.upper(),)):
+            if curso_id not in cursos:
+                cursos[curso_id] = self._montar_curso(curso_id)
+            resultados.append((disciplina, cursos[curso_id]))
+        return resultados
+
+    def buscar_por_texto(self, termo: str, limite: int = 10) -> List[ResultadoBusca]:
+        """
+        Busca disciplinas e cursos por palavras do nome ou do código.
+
+        O índice textual guarda apenas códigos e nomes; é montado a partir do
+        banco na primeira busca.
+
+        Args:
+            termo: Texto da busca
+            limite: Quantidade máxima de resultados
+
+        Returns:
+            Resultados ordenados por relevância
+        """
+        if self._indice_texto is None:
+            disciplinas = self._conexao.execute(
+                "SELECT d.codigo, d.nome, MIN(m.id) FROM curso_disciplina m"
+                " JOIN disciplinas d ON d.id = m.disciplina_id GROUP BY d.codigo"
+            ).fetchall()
+            entradas = [(TIPO_DISCIPLINA, codigo, nome) for codigo, nome, _ in disciplinas]
+            entradas += [(TIPO_CURSO, nome, nome) for nome in self.listar_todos_cursos()]
+            self._indice_texto = IndiceTexto(entradas)
+        return self._indice_texto.buscar(termo, limite)
+
+    def listar_disciplinas_comuns(self) -> Dict[str, List[Tuple[Disciplina, Curso]]]:
+        """
+        Lista disciplinas que aparecem em mais de um curso.
+
+        Returns:
+            Dicionário com código da disciplina e lista de ocorrências
+        """
+        cursos: Dict[int, Curso] = {}
+        comuns: Dict[str, List[Tuple[Disciplina, Curso]]] = defaultdict(list)
+        ocorrencias = self._ocorrencias(
+            "d.codigo IN (SELECT d2.codigo FROM curso_disciplina m2"
+            " JOIN disciplinas d2 ON d2.id = m2.disciplina_id GROUP BY d2.codigo HAVING COUNT(*) > 1)",
+            ()
+        )
+        for disciplina, curso_id in ocorrencias:
+            if curso_id not in cursos:
+                cursos[curso_id] = self._montar_curso(curso_id)
+            comuns[disciplina.codigo].append((disciplina, cursos[curso_id]))
+        return dict(comuns)
+
+    def analisar_carga_curso(self, nome_curso: str) -> Optional[dict]:
+        """
+        Analisa a distribuição de carga horária de um curso.
+
+        Returns:
+            Dicionário com as informações do curso ou None se não encontrado
+        """
+        curso_id = self._id_curso(nome_curso)
+        if curso_id is None:
+            return None
+
+        nome, = self._conexao.execute("SELECT nome FROM cursos WHERE id = ?", (curso_id,)).fetchone()
+        _, total_creditos, total_ch = self._totais_curso(curso_id)
+        por_tipo = dict(self._conexao.execute(
+            "SELECT tipo, COUNT(*) FROM curso_disciplina WHERE curso_id = ? GROUP BY tipo", (curso_id,)
+        ))
+        return {
+            'nome': nome,
+            'total_creditos': total_creditos,
+            'total_ch': total_ch,
+            'qtd_obrigatorias': por_tipo.get('obrigatorias', 0),
+            'qtd_optativas_livres': por_tipo.get('optativas_livres', 0),
+            'qtd_optativas_eletivas': por_tipo.get('optativas_eletivas', 0)
+        }
+
+    def comparar_cursos(self, nome_curso1: str, nome_curso2: str) -> Optional[tuple]:
+        """
+        Compara dois cursos.
+
+        Returns:
+            Tupla com dados dos dois cursos ou None se algum não for encontrado
+        """
+        ids = [self._id_curso(nome_curso1), self._id_curso(nome_curso2)]
+        if None in ids:
+            return None
+
+        dados = []
+        for curso_id in ids:
+            nome, = self._conexao.execute("SELECT nome FROM cursos WHERE id = ?", (curso_id,)).fetchone()
+            total_disciplinas, _, total_ch = self._totais_curso(curso_id)
+            dados.append({'nome': nome, 'total_disciplinas': total_disciplinas, 'total_ch': total_ch})
+        return dados[0], dados[1]
+
+    def _com_unidades(self, ocorrencias: List[Tuple[Disciplina, int]]) -> List[tuple]:
+        """
+        Completa as ocorrências com o curso e a unidade (apenas nome e código).
+
+        Args:
+            ocorrencias: Tuplas (disciplina, id do curso)
+
+        Returns:
+            Lista de tuplas (disciplina, curso, unidade)
+        """
+        cursos: Dict[int, Curso] = {}
+        unidades: Dict[int, Unidade] = {}
+        resultados = []
+        for disciplina, curso_id in ocorrencias:
+            if curso_id not in cursos:
+                cursos[curso_id] = self._montar_curso(curso_id)
+                nome, codigo = self._conexao.execute(
+                    "SELECT u.nome, u.codigo FROM cursos c JOIN unidades u ON u.id = c.unidade_id"
+                    " WHERE c.id = ?", (curso_id,)
+                ).fetchone()
+                unidades[curso_id] = Unidade(nome, codigo=codigo)
+            resultados.append((disciplina, cursos[curso_id], unidades[curso_id]))
+        return resultados
+
+    @staticmethod
+    def _validar_campo(campo: str) -> str:
+        """
+        Garante que o campo pode ser usado numa consulta SQL.
+
+        Args:
+            campo: Campo numérico pedido
+
+        Returns:
+            O próprio campo
+
+        Raises:
+            ValueError: Se o campo não for numérico
+        """
+        if campo not in CAMPOS_NUMERICOS:
+            raise ValueError(f"Campo numérico desconhecido: {campo}")
+        return campo
+
+    def listar_disciplinas_por_creditos(self, min_creditos: int) -> List[tuple]:
+        """
+        Lista disciplinas com número mínimo de créditos.
+
+        Returns:
+            Lista de tuplas (disciplina, curso, unidade)
+        """
+        return self.listar_disciplinas_por_faixa("creditos_totais", minimo=min_creditos)
+
+    def listar_disciplinas_por_faixa(
+        self,
+        campo: str,
+        minimo: Optional[int] = None,
+        maximo: Optional[int] = None
+    ) -> List[tuple]:
+        """
+        Lista disciplinas cujo campo numérico está numa faixa de valores.
+
+        Args:
+            campo: Campo numérico (ex: "creditos_totais", "carga_horaria")
+            minimo: Menor valor aceito (None para sem limite)
+            maximo: Maior valor aceito (None para sem limite)
+
+        Returns:
+            Lista de tuplas (disciplina, curso, unidade)
+
+        Raises:
+            ValueError: Se o campo não for numérico
+        """
+        campo = self._validar_campo(campo)
+        condicoes, parametros = ["1"], []
+        if minimo is not None:
+            condicoes.append(f"d.{campo} >= ?")
+            parametros.append(minimo)
+        if maximo is not None:
+            condicoes.append(f"d.{campo} <= ?")
+            parametros.append(maximo)
+        return self._com_unidades(self._ocorrencias(" AND ".join(condicoes), tuple(parametros)))
+
+    def listar_maiores_disciplinas(self, campo: str, quantidade: int) -> List[tuple]:
+        """
+        Lista as disciplinas com os maiores valores de um campo numérico.
+
+        Args:
+            campo: Campo numérico (ex: "creditos_totais", "carga_horaria")
+            quantidade: Quantidade máxima de resultados
+
+        Returns:
+            Lista de tuplas (disciplina, curso, unidade), do maior para o menor valor
+
+        Raises:
+            ValueError: Se o campo não for numérico
+        """
+        campo = self._validar_campo(campo)
+        ocorrencias = [
+            (self.registro.obter(*valores), curso_id)
+            for curso_id, *valores in self._conexao.execute(
+                f"SELECT m.curso_id, {_COLUNAS_DISCIPLINA} FROM curso_disciplina m"
+                f" JOIN disciplinas d ON d.id = m.disciplina_id ORDER BY d.{campo} DESC, m.id LIMIT ?",
+                (max(quantidade, 0),)
+            )
+        ]
+        return self._com_unidades(ocorrencias)
+
+    def analisar_unidade(self, nome_unidade: str) -> Optional[dict]:
+        """
+        Analisa uma unidade.
+
+        Returns:
+            Dicionário com dados da unidade ou None se não encontrada
+        """
+        unidade_id = self._id_unidade(nome_unidade)
+        if unidade_id is None:
+            return None
+
+        nome, = self._conexao.execute("SELECT nome FROM unidades WHERE id = ?", (unidade_id,)).fetchone()
+        cursos_info = [
+            {'nome': nome_curso, 'disciplinas': disciplinas, 'carga_horaria': carga_horaria}
+            for nome_curso, disciplinas, carga_horaria in self._conexao.execute(
+                "SELECT c.nome, COUNT(m.id), COALESCE(SUM(d.carga_horaria), 0) FROM cursos c"
+                " LEFT JOIN curso_disciplina m ON m.curso_id = c.id"
+                " LEFT JOIN disciplinas d ON d.id = m.disciplina_id"
+                " WHERE c.unidade_id = ? GROUP BY c.id ORDER BY c.id",
+                (unidade_id,)
+            )
+        ]
+        return {
+            'nome': nome,
+            'total_cursos': len(cursos_info),
+            'cursos': cursos_info,
+            'total_disciplinas': sum(curso['disciplinas'] for curso in cursos_info),
+            'total_ch': sum(curso['carga_horaria'] for curso in cursos_info)
+        }
@@ -0,0 +1,100 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+from ..models.curso import Curso
+from ..models.disciplina import Disciplina
+from ..models.unidade import Unidade
+
+# Campos numéricos de Disciplina que podem ser consultados por faixa
+CAMPOS_NUMERICOS = [
+    "creditos_totais",
+    "creditos_aula",
+    "creditos_trabalho",
+    "carga_horaria",
+    "carga_estagio",
+    "carga_praticas",
+    "atividades_aprofundamento",
+]
+
+Ocorrencia = Tuple[Disciplina, Curso, Unidade]
+
+class IndiceNumerico:
+    """
+    Índice ordenado das ocorrências de disciplinas por campo numérico.
+
+    Cada ocorrência (disciplina, curso, unidade) recebe sua posição na
+    ordem de coleta. Para cada campo, as posições são ordenadas pelo valor
+    uma única vez, na primeira consulta ao campo; depois disso, faixas de
+    valores são localizadas por busca binária e as maiores ocorrências são
+    lidas do fim da ordenação, sem percorrer todas as disciplinas.
+
+    Attributes:
+        ocorrencias: Ocorrências na ordem de coleta (unidade, curso, disciplina)
+    """
+
+    def __init__(self, unidades: List[Unidade]):
+        self.ocorrencias: List[Ocorrencia] = [
+            (disciplina, curso, unidade)
+            for unidade in unidades
+            for curso in unidade.cursos
+            for disciplina in curso.todas_disciplinas
+        ]
+        self._ordenados: Dict[str, Tuple[List[int], List[int]]] = {}
+
+    def _ordenacao(self, campo: str) -> Tuple[List[int], List[int]]:
+        """
+        Obtém (e guarda) a ordenação das ocorrências por um campo.
+
+        Args:
+            campo: Um dos CAMPOS_NUMERICOS
+
+        Returns:
+            Tupla (valores em ordem crescente, posições correspondentes); no
+            empate, as posições ficam em ordem decrescente
+
+        Raises:
+            ValueError: Se o campo não for numérico
+        """
+        ordenacao = self._ordenados.get(campo)
+        if ordenacao is None:
+            if campo not in CAMPOS_NUMERICOS:
+                raise ValueError(f"Campo numérico desconhecido: {campo}")
+            pares = sorted(
+                (getattr(disciplina, campo), -posicao)
+                for posicao, (disciplina, _, _) in enumerate(self.ocorrencias)
+            )
+            ordenacao = ([valor for valor, _ in pares], [-posicao for _, posicao in pares])
+            self._ordenados[campo] = ordenacao
+        return ordenacao
+
+    def faixa(self, campo: str, minimo: Optional[int] = None, maximo: Optional[int] = None) -> List[Ocorrencia]:
+        """
+        Lista as ocorrências cujo campo está entre minimo e maximo (inclusive).
+
+        Args:
+            campo: Um dos CAMPOS_NUMERICOS
+            minimo: Menor valor aceito (None para sem limite)
+            maximo: Maior valor aceito (None para sem limite)
+
+        Returns:
+            Ocorrências na ordem de coleta
+        """
+        valores, posicoes = self._ordenacao(campo)
+        inicio = bisect_left(valores, minimo) if minimo is not None else 0
+        fim = bisect_right(valores, maximo) if maximo is not None else len(valores)
+        return [self.ocorrencias[posicao] for posicao in sorted(posicoes[inicio:fim])]
+
+    def maiores(self, campo: str, quantidade: int) -> List[Ocorrencia]:
+        """
+        Lista as ocorrências com os maiores valores do campo.
+
+        Args:
+            campo: Um dos CAMPOS_NUMERICOS
+            quantidade: Quantidade máxima de ocorrências
+
+        Returns:
+            Ocorrências em ordem decrescente do campo e, no empate, na ordem de coleta
+        """
+        _, posicoes = self._ordenacao(campo)
+        if quantidade < 1:
+            return []
+        return [self.ocorrencias[posicao] for posicao in reversed(posicoes[-quantidade:])]
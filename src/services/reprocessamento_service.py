@@ -0,0 +1,84 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from ..interfaces.parser import Parser
+from ..models.curso import Curso
+from ..models.disciplina import Disciplina
+from ..models.duracao_curso import DuracaoCurso
+from ..models.unidade import Unidade
+from ..persistencia.cache_html import CacheHtml
+
+ResultadoGrade = Tuple[DuracaoCurso, List[Disciplina], List[Disciplina], List[Disciplina]]
+
+def _processar_pagina(argumentos: Tuple[str, str, Parser]) -> ResultadoGrade:
+    """
+    Lê uma página do cache e extrai sua grade (executado nos processos filhos).
+
+    Args:
+        argumentos: Tupla (diretório do cache, hash da página, parser)
+
+    Returns:
+        Tupla (duração, obrigatórias, optativas livres, optativas eletivas)
+    """
+    diretorio, valor_hash, parser = argumentos
+    return parser.extrair_grade(CacheHtml(diretorio).ler(valor_hash))
+
+class ReprocessamentoService:
+    """
+    Serviço que reconstrói os dados a partir das páginas guardadas no cache.
+
+    Não usa scraper nem navegador: cada página distinta do cache é analisada
+    uma única vez, em paralelo num pool de processos, e as unidades são
+    montadas na ordem em que os cursos foram coletados.
+
+    Attributes:
+        cache: Cache de HTML a ser reprocessado
+        parser: Implementação de Parser (precisa ser serializável com pickle)
+        processos: Número de processos do pool (None ou 0 usa a quantidade de CPUs)
+    """
+
+    def __init__(self, cache: CacheHtml, parser: Parser, processos: Optional[int] = None):
+        self.cache = cache
+        self.parser = parser
+        self.processos = processos or os.cpu_count() or 1
+
+    def reprocessar(self, data: Optional[str] = None) -> List[Unidade]:
+        """
+        Reconstrói as unidades a partir das páginas em cache.
+
+        Args:
+            data: Se informada (AAAA-MM-DD), usa as coletas até essa data
+
+        Returns:
+            Lista de unidades com cursos e disciplinas preenchidos
+        """
+        entradas = self.cache.entradas(data)
+        hashes = list(dict.fromkeys(entrada.hash for entrada in entradas))
+        tarefas = [(self.cache.diretorio, valor_hash, self.parser) for valor_hash in hashes]
+
+        if self.processos == 1:
+            grades = [_processar_pagina(tarefa) for tarefa in tarefas]
+        else:
+            with ProcessPoolExecutor(max_workers=self.processos) as executor:
+                grades = list(executor.map(_processar_pagina, tarefas, chunksize=8))
+        por_hash: Dict[str, ResultadoGrade] = dict(zip(hashes, grades))
+
+        unidades: Dict[str, Unidade] = {}
+        for entrada in entradas:
+            unidade = unidades.get(entrada.codigo_unidade)
+            if unidade is None:
+                unidade = Unidade(nome=entrada.nome_unidade, codigo=entrada.codigo_unidade)
+                unidades[entrada.codigo_unidade] = unidade
+
+            duracao, obrigatorias, optativas_livres, optativas_eletivas = por_hash[entrada.hash]
+            unidade.adicionar_curso(Curso(
+                nome=entrada.nome_curso,
+                unidade=entrada.nome_unidade,
+                duracao=duracao,
+                obrigatorias=list(obrigatorias),
+                optativas_livres=list(optativas_livres),
+                optativas_eletivas=list(optativas_eletivas),
+                codigo=entrada.codigo_curso
+            ))
+
+        return list(unidades.values())
@@ -0,0 +1,94 @@
+import json
+import random
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List
+
+@dataclass
+class FalhaCurso:
+    """
+    Curso que não pôde ser coletado.
+
+    Attributes:
+        codigo_unidade: Código da unidade no Jupiter
+        nome_unidade: Nome da unidade
+        codigo_curso: Código do curso no Jupiter
+        nome_curso: Nome do curso
+        tentativas: Quantidade de tentativas feitas
+        erro: Mensagem do último erro
+        tipo_erro: Nome da classe da última exceção
+    """
+    codigo_unidade: str
+    nome_unidade: str
+    codigo_curso: str
+    nome_curso: str
+    tentativas: int
+    erro: str
+    tipo_erro: str
+
+@dataclass
+class RelatorioFalhas:
+    """
+    Resultado das retentativas de uma coleta.
+
+    Attributes:
+        recuperados: Cursos que falharam e foram coletados numa nova tentativa
+        falhas: Cursos que continuaram falhando após todas as tentativas
+    """
+    recuperados: int = 0
+    falhas: List[FalhaCurso] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return f"{self.recuperados} cursos recuperados, {len(self.falhas)} com falha definitiva"
+
+    def para_dict(self) -> Dict[str, Any]:
+        """
+        Converte o relatório em dicionário serializável.
+
+        Returns:
+            Dicionário com os recuperados e a lista de falhas
+        """
+        return {"recuperados": self.recuperados, "falhas": [asdict(falha) for falha in self.falhas]}
+
+    def salvar(self, caminho: str) -> None:
+        """
+        Grava o relatório em JSON.
+
+        Args:
+            caminho: Caminho do arquivo de saída
+        """
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(self.para_dict(), arquivo, ensure_ascii=False, indent=2)
+
+class PoliticaRetentativa:
+    """
+    Define quantas vezes e com que intervalo um curso que falhou é tentado de novo.
+
+    O intervalo antes da rodada n cresce exponencialmente (atraso_base * 2^(n-2))
+    até atraso_maximo, e o valor efetivo é sorteado entre zero e esse limite
+    (full jitter), para que vários workers não voltem ao Jupiter ao mesmo tempo.
+
+    Attributes:
+        max_tentativas: Total de tentativas por curso, incluindo a primeira
+        atraso_base: Intervalo antes da primeira retentativa (em segundos)
+        atraso_maximo: Maior intervalo permitido (em segundos)
+    """
+
+    def __init__(self, max_tentativas: int = 3, atraso_base: float = 2.0, atraso_maximo: float = 60.0):
+        self.max_tentativas = max(1, max_tentativas)
+        self.atraso_base = atraso_base
+        self.atraso_maximo = atraso_maximo
+
+    def atraso(self, tentativa: int) -> float:
+        """
+        Sorteia o intervalo de espera antes de uma tentativa.
+
+        Args:
+            tentativa: Número da tentativa que será feita (a primeira é 1)
+
+        Returns:
+            Segundos a esperar (0 para a primeira tentativa)
+        """
+        if tentativa <= 1:
+            return 0.0
+        limite = min(self.atraso_maximo, self.atraso_base * 2 ** (tentativa - 2))
+        return random.uniform(0, limite)
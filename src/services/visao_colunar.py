@@ -0,0 +1,252 @@
+from typing import Dict, List, Optional, Tuple
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional, usado apenas na visão colunar
+    np = None
+from ..models.curso import Curso
+from ..models.disciplina import Disciplina
+from ..models.unidade import Unidade
+from ..persistencia.serializacao import TIPOS_DISCIPLINA
+
+# Campos numéricos de Disciplina guardados como colunas
+CAMPOS_METRICAS = [
+    "creditos_aula",
+    "creditos_trabalho",
+    "carga_horaria",
+    "carga_estagio",
+    "carga_praticas",
+    "atividades_aprofundamento",
+]
+
+class VisaoColunar:
+    """
+    Visão colunar (NumPy) das ocorrências de disciplinas, para análises vetorizadas.
+
+    Cada ocorrência (disciplina, curso, unidade), na ordem de coleta, é uma
+    linha; cada métrica numérica de Disciplina é um array, além da coluna
+    derivada creditos_totais e das colunas de ids curso_id, unidade_id e
+    tipo (índice em TIPOS_DISCIPLINA). Somas e contagens por curso ou por
+    unidade usam np.bincount, e filtros usam máscaras booleanas, sem
+    percorrer objetos Python.
+
+    Attributes:
+        unidades: Unidades na ordem de coleta (unidade_id é a posição nesta lista)
+        cursos: Cursos na ordem de coleta (curso_id é a posição nesta lista)
+        ocorrencias: Tuplas (disciplina, curso, unidade), uma por linha
+        colunas: Dicionário campo -> array com uma posição por linha
+        curso_id: Curso de cada linha
+        unidade_id: Unidade de cada linha
+        tipo: Tipo de cada linha (0 obrigatória, 1 optativa livre, 2 optativa eletiva)
+    """
+
+    def __init__(self, unidades: List[Unidade]):
+        if np is None:
+            raise ImportError("A visão colunar requer o numpy (pip install numpy)")
+        self.unidades = list(unidades)
+        self.cursos: List[Curso] = []
+        self.ocorrencias: List[Tuple[Disciplina, Curso, Unidade]] = []
+        # id(curso) -> curso_id; self.cursos mantém os cursos vivos, então os ids não se repetem
+        self._posicao_cursos: Dict[int, int] = {}
+
+        valores: Dict[str, List[int]] = {campo: [] for campo in CAMPOS_METRICAS}
+        cursos_linhas, unidades_linhas, tipos_linhas = [], [], []
+        for unidade_id, unidade in enumerate(self.unidades):
+            for curso in unidade.cursos:
+                curso_id = len(self.cursos)
+                self._posicao_cursos[id(curso)] = curso_id
+                self.cursos.append(curso)
+                for tipo, lista in enumerate(TIPOS_DISCIPLINA):
+                    for disciplina in getattr(curso, lista):
+                        self.ocorrencias.append((disciplina, curso, unidade))
+                        for campo in CAMPOS_METRICAS:
+                            valores[campo].append(getattr(disciplina, campo))
+                        cursos_linhas.append(curso_id)
+                        unidades_linhas.append(unidade_id)
+                        tipos_linhas.append(tipo)
+
+        self.colunas: Dict[str, "np.ndarray"] = {
+            campo: np.array(valores[campo], dtype=np.int32) for campo in CAMPOS_METRICAS
+        }
+        self.colunas["creditos_totais"] = self.colunas["creditos_aula"] + self.colunas["creditos_trabalho"]
+        self.curso_id = np.array(cursos_linhas, dtype=np.int32)
+        self.unidade_id = np.array(unidades_linhas, dtype=np.int32)
+        self.tipo = np.array(tipos_linhas, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.ocorrencias)
+
+    def _coluna(self, campo: str) -> "np.ndarray":
+        """
+        Obtém a coluna de uma métrica.
+
+        Args:
+            campo: Um dos CAMPOS_METRICAS ou "creditos_totais"
+
+        Returns:
+            Array com o valor de cada linha
+
+        Raises:
+            ValueError: Se o campo não for uma métrica
+        """
+        if campo not in self.colunas:
+            raise ValueError(f"Métrica desconhecida: {campo}")
+        return self.colunas[campo]
+
+    def total(self, campo: str) -> int:
+        """
+        Soma uma métrica em todas as linhas.
+
+        Args:
+            campo: Um dos CAMPOS_METRICAS ou "creditos_totais"
+
+        Returns:
+            Soma da métrica
+        """
+        return int(self._coluna(campo).sum(dtype=np.int64))
+
+    def somar_por_curso(self, campo: str) -> "np.ndarray":
+        """
+        Soma uma métrica por curso.
+
+        Args:
+            campo: Um dos CAMPOS_METRICAS ou "creditos_totais"
+
+        Returns:
+            Array indexado por curso_id
+        """
+        return np.bincount(self.curso_id, weights=self._coluna(campo), minlength=len(self.cursos)).astype(np.int64)
+
+    def somar_por_unidade(self, campo: str) -> "np.ndarray":
+        """
+        Soma uma métrica por unidade.
+
+        Args:
+            campo: Um dos CAMPOS_METRICAS ou "creditos_totais"
+
+        Returns:
+            Array indexado por unidade_id
+        """
+        return np.bincount(
+            self.unidade_id, weights=self._coluna(campo), minlength=len(self.unidades)
+        ).astype(np.int64)
+
+    def contar_por_curso(self, tipo: Optional[int] = None) -> "np.ndarray":
+        """
+        Conta as disciplinas de cada curso.
+
+        Args:
+            tipo: Se informado, conta apenas esse tipo (índice em TIPOS_DISCIPLINA)
+
+        Returns:
+            Array indexado por curso_id
+        """
+        cursos = self.curso_id if tipo is None else self.curso_id[self.tipo == tipo]
+        return np.bincount(cursos, minlength=len(self.cursos))
+
+    def contar_por_unidade(self) -> "np.ndarray":
+        """
+        Conta as ocorrências de disciplinas de cada unidade.
+
+        Returns:
+            Array indexado por unidade_id
+        """
+        return np.bincount(self.unidade_id, minlength=len(self.unidades))
+
+    def filtrar(self, campo: str, minimo: Optional[int] = None, maximo: Optional[int] = None) -> "np.ndarray":
+        """
+        Seleciona as linhas cuja métrica está entre minimo e maximo (inclusive).
+
+        Args:
+            campo: Um dos CAMPOS_METRICAS ou "creditos_totais"
+            minimo: Menor valor aceito (None para sem limite)
+            maximo: Maior valor aceito (None para sem limite)
+
+        Returns:
+            Posições das linhas selecionadas, em ordem crescente
+        """
+        coluna = self._coluna(campo)
+        mascara = np.ones(len(coluna), dtype=bool)
+        if minimo is not None:
+            mascara &= coluna >= minimo
+        if maximo is not None:
+            mascara &= coluna <= maximo
+        return np.flatnonzero(mascara)
+
+    def ocorrencias_em(self, posicoes: "np.ndarray") -> List[Tuple[Disciplina, Curso, Unidade]]:
+        """
+        Converte posições de linhas nas tuplas (disciplina, curso, unidade).
+
+        Args:
+            posicoes: Posições devolvidas por filtrar
+
+        Returns:
+            Lista de tuplas, na ordem das posições
+        """
+        return [self.ocorrencias[posicao] for posicao in posicoes.tolist()]
+
+    def histograma(self, campo: str) -> Dict[int, int]:
+        """
+        Conta quantas linhas têm cada valor de uma métrica.
+
+        Args:
+            campo: Um dos CAMPOS_METRICAS ou "creditos_totais"
+
+        Returns:
+            Dicionário valor -> quantidade de linhas, em ordem crescente de valor
+        """
+        valores, quantidades = np.unique(self._coluna(campo), return_counts=True)
+        return dict(zip(valores.tolist(), quantidades.tolist()))
+
+    def listar_disciplinas_por_creditos(self, min_creditos: int) -> List[tuple]:
+        """
+        Lista disciplinas com número mínimo de créditos (como o ConsultaService).
+
+        Returns:
+            Lista de tuplas (disciplina, curso, unidade)
+        """
+        return self.ocorrencias_em(self.filtrar("creditos_totais", minimo=min_creditos))
+
+    def analisar_carga_curso(self, curso: Curso) -> dict:
+        """
+        Calcula os totais de um curso (como ConsultaService.analisar_carga_curso).
+
+        Args:
+            curso: Curso presente nas unidades da visão
+
+        Returns:
+            Dicionário com nome, totais de créditos e carga horária e contagens por tipo
+        """
+        linhas = self.curso_id == self._posicao_cursos[id(curso)]
+        contagens = np.bincount(self.tipo[linhas], minlength=len(TIPOS_DISCIPLINA))
+        return {
+            'nome': curso.nome,
+            'total_creditos': int(self.colunas["creditos_totais"][linhas].sum(dtype=np.int64)),
+            'total_ch': int(self.colunas["carga_horaria"][linhas].sum(dtype=np.int64)),
+            'qtd_obrigatorias': int(contagens[0]),
+            'qtd_optativas_livres': int(contagens[1]),
+            'qtd_optativas_eletivas': int(contagens[2])
+        }
+
+    def analisar_unidade(self, unidade: Unidade) -> dict:
+        """
+        Calcula os totais de uma unidade e de seus cursos (como ConsultaService.analisar_unidade).
+
+        Args:
+            unidade: Unidade presente na visão
+
+        Returns:
+            Dicionário com nome, total de cursos, dados de cada curso e totais
+        """
+        ids = [self._posicao_cursos[id(curso)] for curso in unidade.cursos]
+        disciplinas = self.contar_por_curso()[ids].tolist()
+        cargas = self.somar_por_curso("carga_horaria")[ids].tolist()
+        return {
+            'nome': unidade.nome,
+            'total_cursos': len(ids),
+            'cursos': [
+                {'nome': curso.nome, 'disciplinas': quantidade, 'carga_horaria': carga}
+                for curso, quantidade, carga in zip(unidade.cursos, disciplinas, cargas)
+            ],
+            'total_disciplinas': sum(disciplinas),
+            'total_ch': sum(cargas)
+        }
@@ -2,6 +2,7 @@ import os
 from typing import Callable, Dict
 from colorama import init, Fore
 import questionary
+from ..services.busca_texto import TIPO_DISCIPLINA
 from ..services.consulta_service import ConsultaService
 
 class Menu:
@@ -15,6 +16,8 @@ class Menu:
         opcoes: Dicionário de opções do menu e suas funções correspondentes
     """
 
+    LIMITE_BUSCA_TEXTO = 15
+
     def __init__(self, consulta_service: ConsultaService):
         init(autoreset=True)
         self.consulta_service = consulta_service
@@ -23,6 +26,7 @@ class Menu:
             "Listar cursos por unidade": self._listar_cursos_unidade,
             "Ver detalhes de um curso": self._detalhar_curso,
             "Buscar disciplina por código": self._buscar_disciplina,
+            "Buscar disciplinas e cursos por nome": self._buscar_por_texto,
             "Listar disciplinas comuns a mais de um curso": self._listar_disciplinas_comuns,
             "Analisar carga horária de um curso": self._analisar_carga_curso,
             "Comparar dois cursos": self._comparar_cursos,
@@ -129,6 +133,22 @@ class Menu:
         else:
             print(Fore.RED + "\nDisciplina não encontrada.")
 
+    def _buscar_por_texto(self) -> None:
+        """Busca disciplinas e cursos por palavras do nome ou do código."""
+        termo = questionary.text("Termo da busca (ex: calculo, MAC01):").ask()
+        resultados = self.consulta_service.buscar_por_texto(termo or "", self.LIMITE_BUSCA_TEXTO)
+
+        if not resultados:
+            print(Fore.YELLOW + "\nNenhuma disciplina ou curso encontrado.")
+            return
+
+        print(Fore.BLUE + f"\n🔍 Resultados para \"{termo}\":")
+        for resultado in resultados:
+            if resultado.tipo == TIPO_DISCIPLINA:
+                print(f"📗 {resultado.chave} - {resultado.nome}")
+            else:
+                print(f"📘 Curso: {resultado.nome}")
+
     def _listar_disciplinas_comuns(self) -> None:
         """Lista disciplinas que aparecem em mais de um curso."""
         comuns = self.consulta_service.listar_disciplinas_comuns()
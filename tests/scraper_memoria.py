@@ -0,0 +1,91 @@
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.interfaces.scraper import WebScraper
+
+PAGINAS = Path(__file__).parent / "fixtures" / "paginas"
+
+IME = "Instituto de Matemática e Estatística - ( IME )"
+FFLCH = "Faculdade de Filosofia, Letras e Ciências Humanas - ( FFLCH )"
+
+# Unidades -> cursos -> página de grade em fixtures/paginas (None é o popup de erro do Jupiter)
+CATALOGO = {
+    ("45", IME): [
+        ("45052-1", "Ciência da Computação", "grade_completa.html"),
+        ("45070-1", "Estatística", None),
+        ("45031-1", "Matemática", "grade_somente_obrigatorias.html"),
+    ],
+    ("8", FFLCH): [
+        ("8051-1", "Letras", "grade_recortada.html"),
+    ],
+}
+
+def ler_pagina(nome: str) -> str:
+    return (PAGINAS / nome).read_text(encoding="utf-8")
+
+class FalhasProgramadas:
+    """Faz cursos falharem um número de vezes, contado entre todos os scrapers que a compartilham."""
+
+    SEMPRE = -1
+
+    def __init__(self, falhas: Optional[Dict[str, int]] = None):
+        self.restantes = dict(falhas or {})
+        self.tentativas: Dict[str, int] = {}
+        self._trava = threading.Lock()
+
+    def verificar(self, codigo_curso: str) -> None:
+        with self._trava:
+            self.tentativas[codigo_curso] = self.tentativas.get(codigo_curso, 0) + 1
+            restantes = self.restantes.get(codigo_curso, 0)
+            if restantes == 0:
+                return
+            if restantes != self.SEMPRE:
+                self.restantes[codigo_curso] = restantes - 1
+        raise RuntimeError(f"Falha programada no curso {codigo_curso}")
+
+class ScraperMemoria(WebScraper):
+    """Scraper sem navegador nem rede que serve as páginas de CATALOGO."""
+
+    def __init__(self, catalogo=CATALOGO, falhas: Optional[FalhasProgramadas] = None, paginas: Optional[Dict[str, str]] = None):
+        self.catalogo = catalogo
+        self.falhas = falhas or FalhasProgramadas()
+        self.paginas = paginas or {}
+        self.unidade: Optional[str] = None
+        self.carregamentos_pagina = 0
+        self.fechado = False
+
+    def acessar_pagina_inicial(self) -> None:
+        self.carregamentos_pagina += 1
+
+    def listar_unidades_urls(self) -> List[str]:
+        return [codigo for codigo, _ in self.catalogo]
+
+    def obter_html(self, url: str) -> str:
+        return ""
+
+    def obter_unidades(self) -> List[Tuple[str, str]]:
+        return list(self.catalogo)
+
+    def selecionar_unidade(self, codigo: str) -> None:
+        self.unidade = codigo
+
+    def obter_cursos(self) -> List[Tuple[str, str]]:
+        return [(codigo, nome) for codigo, nome, _ in self._cursos()]
+
+    def acessar_grade_curso(self, codigo_curso: str) -> Optional[str]:
+        self.falhas.verificar(codigo_curso)
+        self.carregamentos_pagina += 1
+        pagina = next(pagina for codigo, _, pagina in self._cursos() if codigo == codigo_curso)
+        if codigo_curso in self.paginas:
+            return self.paginas[codigo_curso]
+        return ler_pagina(pagina) if pagina else None
+
+    def voltar_para_cursos(self, codigo_unidade: str) -> None:
+        self.unidade = codigo_unidade
+
+    def fechar(self) -> None:
+        self.fechado = True
+
+    def _cursos(self):
+        return next(cursos for (codigo, _), cursos in self.catalogo.items() if codigo == self.unidade)
@@ -0,0 +1,58 @@
+import pytest
+
+from src.services.busca_texto import IndiceTexto, distancia_edicao, normalizar_texto
+
+@pytest.fixture
+def indice():
+    return IndiceTexto([
+        ("disciplina", "MAT2453", "Cálculo Diferencial e Integral I"),
+        ("disciplina", "MAC0110", "Introdução à Computação"),
+        ("disciplina", "FLF0100", "Introdução à Filosofia"),
+        ("disciplina", "MAC0239", "Introdução à Lógica"),
+        ("curso", "Bacharelado em Estatística", "Bacharelado em Estatística"),
+    ])
+
+def chaves(resultados):
+    return [resultado.chave for resultado in resultados]
+
+def test_normalizacao_remove_acentos():
+    assert normalizar_texto("Cálculo II") == "calculo ii"
+
+@pytest.mark.parametrize("termo, chave", [
+    ("calculo", "MAT2453"),
+    ("calc", "MAT2453"),
+    ("MAC01", "MAC0110"),
+    ("estatistica", "Bacharelado em Estatística"),
+])
+def test_busca_exata_e_por_prefixo(indice, termo, chave):
+    assert chaves(indice.buscar(termo))[0] == chave
+
+@pytest.mark.parametrize("termo, chave", [
+    ("calcluo", "MAT2453"),
+    ("lgoica", "MAC0239"),
+    ("filosfia", "FLF0100"),
+    ("computacoa", "MAC0110"),
+])
+def test_busca_tolera_erros_de_digitacao(indice, termo, chave):
+    assert chaves(indice.buscar(termo))[0] == chave
+
+def test_termo_sem_relacao_nao_devolve_resultados(indice):
+    assert indice.buscar("xyz") == []
+
+def test_casamento_exato_vem_antes_do_aproximado(indice):
+    resultados = indice.buscar("introducao computacao")
+
+    assert chaves(resultados)[0] == "MAC0110"
+    assert resultados[0].pontuacao > resultados[1].pontuacao
+
+@pytest.mark.parametrize("origem, destino, distancia", [
+    ("calculo", "calculo", 0),
+    ("calcluo", "calculo", 1),
+    ("logcia", "logica", 1),
+    ("kitten", "sitting", 3),
+])
+def test_distancia_edicao(origem, destino, distancia):
+    assert distancia_edicao(origem, destino, 5) == distancia
+
+def test_distancia_edicao_interrompe_acima_do_limite():
+    assert distancia_edicao("abcdef", "uvwxyz", 2) == 3
@@ -0,0 +1,83 @@
+import os
+from datetime import date
+
+import pytest
+
+from src.parsers.jupiter_parser import JupiterParser
+from src.persistencia import cache_html
+from src.persistencia.cache_html import CacheHtml
+from src.services.coleta_service import ColetaService
+from src.services.reprocessamento_service import ReprocessamentoService
+
+from .scraper_memoria import IME, ScraperMemoria, ler_pagina
+
+def objetos(cache: CacheHtml):
+    return sorted(
+        nome for _, _, arquivos in os.walk(os.path.join(cache.diretorio, "objetos")) for nome in arquivos
+    )
+
+def test_pagina_volta_igual(tmp_path):
+    cache = CacheHtml(str(tmp_path))
+    html = ler_pagina("grade_completa.html")
+
+    valor_hash = cache.salvar("45", IME, "45052-1", "Ciência da Computação", html)
+
+    assert valor_hash == CacheHtml.calcular_hash(html)
+    assert cache.ler(valor_hash) == html
+    entrada, = cache.entradas()
+    assert (entrada.codigo_unidade, entrada.nome_unidade, entrada.codigo_curso, entrada.nome_curso) == (
+        "45", IME, "45052-1", "Ciência da Computação"
+    )
+    assert entrada.hash == valor_hash
+
+def test_paginas_iguais_sao_gravadas_uma_vez(tmp_path):
+    cache = CacheHtml(str(tmp_path))
+    html = ler_pagina("grade_somente_obrigatorias.html")
+
+    primeiro = cache.salvar("45", IME, "45031-1", "Matemática", html)
+    segundo = cache.salvar("45", IME, "45032-1", "Matemática Aplicada", html)
+    terceiro = cache.salvar("45", IME, "45052-1", "Ciência da Computação", ler_pagina("grade_completa.html"))
+
+    assert primeiro == segundo
+    assert objetos(cache) == sorted([f"{primeiro}.gz", f"{terceiro}.gz"])
+    assert [entrada.codigo_curso for entrada in cache.entradas()] == ["45031-1", "45032-1", "45052-1"]
+
+def test_entradas_trazem_a_coleta_mais_recente_ate_a_data(tmp_path, monkeypatch):
+    cache = CacheHtml(str(tmp_path))
+
+    class Dia(date):
+        atual = date(2024, 3, 1)
+
+        @classmethod
+        def today(cls):
+            return cls.atual
+
+    monkeypatch.setattr(cache_html, "date", Dia)
+    antiga = cache.salvar("45", IME, "45052-1", "Ciência da Computação", ler_pagina("grade_completa.html"))
+    matematica = cache.salvar("45", IME, "45031-1", "Matemática", ler_pagina("grade_somente_obrigatorias.html"))
+    Dia.atual = date(2024, 8, 1)
+    nova = cache.salvar("45", IME, "45052-1", "Ciência da Computação", ler_pagina("grade_recortada.html"))
+
+    assert [(e.codigo_curso, e.hash) for e in cache.entradas()] == [("45052-1", nova), ("45031-1", matematica)]
+    assert cache.entradas("2024-05-01")[0].hash == antiga
+    assert cache.entradas("2024-01-01") == []
+
+def test_linha_incompleta_do_indice_e_ignorada(tmp_path):
+    cache = CacheHtml(str(tmp_path))
+    cache.salvar("45", IME, "45052-1", "Ciência da Computação", ler_pagina("grade_completa.html"))
+    with open(tmp_path / CacheHtml.ARQUIVO_INDICE, "a", encoding="utf-8") as indice:
+        indice.write('{"codigo_unidade": "45", "nome_uni')
+
+    assert [entrada.codigo_curso for entrada in cache.entradas()] == ["45052-1"]
+
+@pytest.mark.parametrize("processos", [0, 1, 2])
+def test_reprocessar_reconstroi_a_coleta(tmp_path, processos):
+    cache = CacheHtml(str(tmp_path))
+    coletadas = ColetaService(ScraperMemoria(), JupiterParser("html.parser"), cache_html=cache).coletar_dados(2)
+
+    reprocessadas = ReprocessamentoService(cache, JupiterParser("html.parser"), processos).reprocessar()
+
+    assert reprocessadas == coletadas
+    assert len(objetos(cache)) == 3
+    # As disciplinas reconstruídas são as canônicas, também quando vêm de outro processo
+    assert reprocessadas[0].cursos[0].obrigatorias[0] is coletadas[0].cursos[0].obrigatorias[0]
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from src.parsers.jupiter_parser import JupiterParser
+from src.persistencia.checkpoint import JornalCheckpoint
+from src.services.coleta_service import ColetaService
+
+from .scraper_memoria import FalhasProgramadas, ScraperMemoria
+
+def coletar(caminho, retomar=False, falhas=None):
+    scraper = ScraperMemoria(falhas=falhas)
+    coleta = ColetaService(scraper, JupiterParser("html.parser"), checkpoint=JornalCheckpoint(caminho), retomar=retomar)
+    return coleta, coleta.coletar_dados(2)
+
+def linhas(caminho):
+    return caminho.read_text(encoding="utf-8").splitlines()
+
+@pytest.fixture
+def jornal_interrompido(tmp_path):
+    """Diário de uma coleta completa cuja última linha foi cortada no meio da gravação."""
+    caminho = tmp_path / "checkpoint.jsonl"
+    _, unidades = coletar(caminho)
+    conteudo = caminho.read_bytes()
+    caminho.write_bytes(conteudo[:len(conteudo) - 40])
+    return caminho, unidades
+
+@pytest.mark.parametrize("bloco", [JornalCheckpoint.TAMANHO_BLOCO, 7])
+def test_retomada_descarta_a_linha_cortada_e_recoleta_apenas_o_que_falta(jornal_interrompido, monkeypatch, bloco):
+    monkeypatch.setattr(JornalCheckpoint, "TAMANHO_BLOCO", bloco)
+    caminho, completas = jornal_interrompido
+    assert [codigo for _, codigo in JornalCheckpoint(str(caminho)).carregar()] == ["45052-1", "45031-1"]
+
+    falhas = FalhasProgramadas()
+    coleta, unidades = coletar(caminho, retomar=True, falhas=falhas)
+
+    assert unidades == completas
+    assert coleta.cursos_retomados == 2
+    # Só o curso da linha cortada e o que não tem grade voltam ao Jupiter
+    assert falhas.tentativas == {"45070-1": 1, "8051-1": 1}
+    assert [json.loads(linha)["curso"]["codigo"] for linha in linhas(caminho)] == ["45052-1", "45031-1", "8051-1"]
+
+def test_diario_sem_linha_cortada_fica_intacto(tmp_path):
+    caminho = tmp_path / "checkpoint.jsonl"
+    coletar(caminho)
+    antes = caminho.read_bytes()
+
+    coleta, _ = coletar(caminho, retomar=True)
+
+    assert caminho.read_bytes() == antes
+    assert coleta.cursos_retomados == 3
+
+def test_coleta_sem_retomar_recomeca_o_diario(jornal_interrompido):
+    caminho, _ = jornal_interrompido
+
+    coleta, _ = coletar(caminho)
+
+    assert coleta.cursos_retomados == 0
+    assert len(linhas(caminho)) == 3
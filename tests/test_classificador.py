@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+from src.models.registro_disciplinas import RegistroDisciplinas
+from src.parsers.classificador import (
+    PAGINA_BLOQUEIO,
+    PAGINA_ERRO,
+    PAGINA_GRADE,
+    PAGINA_VAZIA,
+    classificar_pagina,
+)
+from src.parsers.jupiter_parser import JupiterParser
+
+RAIZ = Path(__file__).parent.parent
+PAGINAS = Path(__file__).parent / "fixtures" / "paginas"
+POPUP_ERRO = Path(__file__).parent / "fixtures" / "jupiter_http" / "listarGradeCurricular_45_45070_1.html"
+
+def ler(caminho: Path) -> str:
+    return caminho.read_text(encoding="utf-8")
+
+@pytest.mark.parametrize("nome", sorted(caminho.name for caminho in PAGINAS.glob("*.html")))
+def test_grade(nome):
+    assert classificar_pagina(ler(PAGINAS / nome)) == PAGINA_GRADE
+
+def test_erro():
+    assert classificar_pagina(ler(POPUP_ERRO)) == PAGINA_ERRO
+
+def test_bloqueio():
+    assert classificar_pagina(ler(RAIZ / "pagina_debug.html")) == PAGINA_BLOQUEIO
+
+@pytest.mark.parametrize("html", [
+    None,
+    "",
+    "  \n ",
+    "<html><body>Manutenção programada</body></html>",
+    '<div id="gradeCurricular"></div>',
+    '<div id="gradeCurricularAntiga"><table><tr><td>x</td></tr></table></div>',
+])
+def test_vazia(html):
+    assert classificar_pagina(html) == PAGINA_VAZIA
+
+def test_erro_tem_precedencia_sobre_a_grade():
+    html = ler(PAGINAS / "grade_completa.html").replace(
+        "</body>", '<div id="err" title="Atenção">Não existem dados da grade curricular.</div></body>'
+    )
+
+    assert classificar_pagina(html) == PAGINA_ERRO
+
+@pytest.mark.parametrize("aspas", ['"', "'", ""])
+def test_grade_classificada_e_recortada_com_qualquer_aspas(aspas):
+    html = ler(PAGINAS / "grade_completa.html").replace(
+        'id="gradeCurricular"', f"id={aspas}gradeCurricular{aspas}"
+    )
+    parser = JupiterParser("html.parser", RegistroDisciplinas())
+
+    assert classificar_pagina(html) == PAGINA_GRADE
+    recortada = JupiterParser.recortar_grade(html)
+    assert len(recortada) < len(html)
+    assert classificar_pagina(recortada) == PAGINA_GRADE
+    assert parser.extrair_grade(recortada) == parser.extrair_grade(html)
@@ -0,0 +1,85 @@
+import pytest
+
+from src.models.registro_disciplinas import RegistroDisciplinas
+from src.parsers.jupiter_parser import JupiterParser
+from src.persistencia.snapshot import SnapshotStore
+from src.services.coleta_incremental import ColetaIncremental
+from src.services.coleta_service import ColetaService
+from src.services.retentativas import PoliticaRetentativa
+
+from .scraper_memoria import CATALOGO, IME, FalhasProgramadas, ScraperMemoria, ler_pagina
+
+def coletar(scraper, incremental, quantidade=2):
+    coleta = ColetaService(
+        scraper,
+        JupiterParser("html.parser", RegistroDisciplinas()),
+        incremental=incremental,
+        retentativas=PoliticaRetentativa(atraso_base=0)
+    )
+    return coleta.coletar_dados(quantidade)
+
+@pytest.fixture
+def anterior(tmp_path):
+    """Snapshot de uma coleta incremental completa das duas unidades."""
+    incremental = ColetaIncremental()
+    unidades = coletar(ScraperMemoria(), incremental)
+    store = SnapshotStore(str(tmp_path / "snapshot.json.gz"))
+    store.salvar(unidades, incremental.hashes)
+    return store
+
+def test_coleta_parcial_mantem_as_demais_unidades(anterior):
+    incremental = ColetaIncremental(anterior.carregar(), anterior.carregar_hashes())
+
+    unidades = incremental.mesclar_anteriores(coletar(ScraperMemoria(), incremental, quantidade=1))
+    anterior.salvar(unidades, incremental.hashes)
+
+    assert [unidade.codigo for unidade in anterior.carregar()] == ["45", "8"]
+    assert [curso.codigo for curso in anterior.carregar()[1].cursos] == ["8051-1"]
+    assert ("8", "8051-1") in anterior.carregar_hashes()
+    assert incremental.relatorio.removidos == []
+
+def test_curso_inalterado_e_reaproveitado(anterior):
+    anteriores = anterior.carregar()
+    incremental = ColetaIncremental(anteriores, anterior.carregar_hashes())
+
+    unidades = coletar(ScraperMemoria(), incremental)
+
+    assert unidades[0].cursos[0] is anteriores[0].cursos[0]
+    assert sorted(incremental.relatorio.inalterados) == [("45", "45031-1"), ("45", "45052-1"), ("8", "8051-1")]
+    assert incremental.relatorio.alterados == incremental.relatorio.removidos == []
+    assert incremental.hashes == anterior.carregar_hashes()
+
+def test_curso_alterado_e_processado_de_novo(anterior):
+    incremental = ColetaIncremental(anterior.carregar(), anterior.carregar_hashes())
+    paginas = {"45052-1": ler_pagina("grade_somente_obrigatorias.html")}
+
+    unidades = coletar(ScraperMemoria(paginas=paginas), incremental)
+
+    assert incremental.relatorio.alterados == [("45", "45052-1")]
+    assert unidades[0].cursos[0].optativas_livres == []
+    assert incremental.hashes[("45", "45052-1")] != anterior.carregar_hashes()[("45", "45052-1")]
+
+def test_curso_que_saiu_do_jupiter_e_removido(anterior):
+    catalogo = dict(CATALOGO)
+    catalogo[("45", IME)] = CATALOGO[("45", IME)][:2]
+    incremental = ColetaIncremental(anterior.carregar(), anterior.carregar_hashes())
+
+    unidades = coletar(ScraperMemoria(catalogo), incremental)
+
+    assert incremental.relatorio.removidos == [("45", "45031-1")]
+    assert [curso.codigo for curso in unidades[0].cursos] == ["45052-1"]
+    assert ("45", "45031-1") not in incremental.hashes
+
+def test_curso_com_falha_mantem_a_versao_anterior(anterior):
+    anteriores = anterior.carregar()
+    hashes = anterior.carregar_hashes()
+    incremental = ColetaIncremental(anteriores, hashes)
+    falhas = FalhasProgramadas({"45052-1": FalhasProgramadas.SEMPRE})
+
+    unidades = coletar(ScraperMemoria(falhas=falhas), incremental)
+
+    assert [curso.codigo for curso in unidades[0].cursos] == ["45052-1", "45031-1"]
+    assert unidades[0].cursos[0] is anteriores[0].cursos[0]
+    assert incremental.relatorio.falhados == [("45", "45052-1")]
+    assert incremental.relatorio.removidos == []
+    assert incremental.hashes[("45", "45052-1")] == hashes[("45", "45052-1")]
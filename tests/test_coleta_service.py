@@ -0,0 +1,81 @@
+import pytest
+
+from src.models.registro_disciplinas import RegistroDisciplinas
+from src.parsers.jupiter_parser import JupiterParser
+from src.services.coleta_service import ColetaService
+from src.services.retentativas import PoliticaRetentativa
+
+from .scraper_memoria import FalhasProgramadas, ScraperMemoria
+
+def criar_coleta(scraper, **opcoes):
+    return ColetaService(
+        scraper,
+        JupiterParser("html.parser", RegistroDisciplinas()),
+        retentativas=PoliticaRetentativa(atraso_base=0),
+        **opcoes
+    )
+
+def codigos_cursos(unidades):
+    return [[curso.codigo for curso in unidade.cursos] for unidade in unidades]
+
+def test_curso_que_falha_e_depois_funciona_e_recuperado():
+    falhas = FalhasProgramadas({"45052-1": 2})
+    coleta = criar_coleta(ScraperMemoria(falhas=falhas))
+
+    unidades = coleta.coletar_dados(2)
+
+    assert codigos_cursos(unidades) == [["45052-1", "45031-1"], ["8051-1"]]
+    assert coleta.relatorio_falhas.recuperados == 1
+    assert coleta.relatorio_falhas.falhas == []
+    assert falhas.tentativas["45052-1"] == 3
+
+def test_curso_que_sempre_falha_vai_para_o_relatorio():
+    falhas = FalhasProgramadas({"45052-1": FalhasProgramadas.SEMPRE})
+    coleta = criar_coleta(ScraperMemoria(falhas=falhas))
+
+    unidades = coleta.coletar_dados(2)
+
+    assert codigos_cursos(unidades) == [["45031-1"], ["8051-1"]]
+    assert coleta.relatorio_falhas.recuperados == 0
+    falha, = coleta.relatorio_falhas.falhas
+    assert (falha.codigo_unidade, falha.codigo_curso) == ("45", "45052-1")
+    assert falha.tentativas == 3
+    assert falha.tipo_erro == "RuntimeError"
+
+def test_retentativa_sem_grade_nao_conta_como_recuperada():
+    coleta = criar_coleta(ScraperMemoria(falhas=FalhasProgramadas({"45070-1": 1})))
+
+    coleta.coletar_dados(2)
+
+    assert coleta.relatorio_falhas.recuperados == 0
+    assert coleta.relatorio_falhas.falhas == []
+
+@pytest.fixture(scope="module")
+def sequencial():
+    coleta = criar_coleta(ScraperMemoria())
+    return coleta.coletar_dados(2), coleta.paginas_por_tipo
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_pipeline_produz_o_mesmo_que_a_coleta_sequencial(sequencial, workers):
+    unidades, paginas_por_tipo = sequencial
+    coleta = criar_coleta(ScraperMemoria(), processos_analise=2, workers=workers, scraper_factory=ScraperMemoria)
+
+    assert coleta.coletar_dados(2) == unidades
+    assert coleta.paginas_por_tipo == paginas_por_tipo
+    assert coleta.metricas_etapas["analise"].itens == 3
+    assert coleta.metricas_etapas["montagem"].itens == 3
+
+def test_coleta_paralela_produz_o_mesmo_que_a_sequencial(sequencial):
+    unidades, paginas_por_tipo = sequencial
+    criados = []
+
+    def fabrica():
+        criados.append(ScraperMemoria())
+        return criados[-1]
+
+    coleta = criar_coleta(ScraperMemoria(), workers=3, scraper_factory=fabrica)
+
+    assert coleta.coletar_dados(2) == unidades
+    assert coleta.paginas_por_tipo == paginas_por_tipo
+    # O scraper principal é uma das vagas do pool
+    assert len(criados) == 2
@@ -0,0 +1,92 @@
+from dataclasses import asdict
+
+import pytest
+
+from src.models.curso import Curso
+from src.models.disciplina import Disciplina
+from src.models.duracao_curso import DuracaoCurso
+from src.models.unidade import Unidade
+from src.services.consulta_service import ConsultaService
+
+CALCULO = Disciplina("MAT2453", "Cálculo Diferencial e Integral I", 6, 0, 90, 0, 0, 0)
+COMPUTACAO = Disciplina("MAC0110", "Introdução à Computação", 4, 0, 60, 0, 0, 0)
+FILOSOFIA = Disciplina("FLF0100", "Introdução à Filosofia", 2, 1, 60, 0, 0, 0)
+
+def criar_unidade(nome: str, codigo: str, *cursos: Curso) -> Unidade:
+    unidade = Unidade(nome, codigo=codigo)
+    for curso in cursos:
+        unidade.adicionar_curso(curso)
+    return unidade
+
+def criar_curso(nome: str, unidade: str, codigo: str, *obrigatorias: Disciplina) -> Curso:
+    return Curso(nome, unidade, DuracaoCurso(8, 8, 12), list(obrigatorias), codigo=codigo)
+
+@pytest.fixture
+def ime():
+    nome = "Instituto de Matemática e Estatística - ( IME )"
+    return criar_unidade(nome, "45", criar_curso("Ciência da Computação", nome, "45052-1", CALCULO, COMPUTACAO))
+
+def test_analises_usam_os_totais_dos_cursos(ime):
+    consulta = ConsultaService([ime])
+
+    assert consulta.analisar_carga_curso("ciência da computação") == {
+        'nome': "Ciência da Computação",
+        'total_creditos': 10,
+        'total_ch': 150,
+        'qtd_obrigatorias': 2,
+        'qtd_optativas_livres': 0,
+        'qtd_optativas_eletivas': 0
+    }
+    assert consulta.analisar_unidade("IME")['total_ch'] == 150
+
+def test_adicionar_curso_atualiza_apenas_o_servico_da_unidade(ime):
+    fflch = criar_unidade("Faculdade de Filosofia - ( FFLCH )", "8")
+    consulta_ime = ConsultaService([ime])
+    consulta_fflch = ConsultaService([fflch])
+    versao_fflch = consulta_fflch._versao
+
+    ime.adicionar_curso(criar_curso("Matemática", ime.nome, "45031-1", CALCULO))
+
+    assert consulta_ime.analisar_unidade("IME")['total_cursos'] == 2
+    assert consulta_ime.analisar_carga_curso("Matemática")['total_ch'] == 90
+    consulta_fflch.listar_todos_cursos()
+    assert consulta_fflch._versao == versao_fflch
+
+def test_nova_unidade_na_lista_e_percebida(ime):
+    unidades = [ime]
+    consulta = ConsultaService(unidades)
+    nome = "Faculdade de Filosofia - ( FFLCH )"
+    unidades.append(criar_unidade(nome, "8", criar_curso("Filosofia", nome, "8010-1", FILOSOFIA)))
+
+    assert consulta.analisar_unidade("FFLCH")['total_disciplinas'] == 1
+    assert consulta.comparar_cursos("Filosofia", "Ciência da Computação") == (
+        {'nome': "Filosofia", 'total_disciplinas': 1, 'total_ch': 60},
+        {'nome': "Ciência da Computação", 'total_disciplinas': 2, 'total_ch': 150}
+    )
+
+def test_versao_nao_entra_na_serializacao(ime):
+    assert "versao" not in asdict(ime)
+    assert ime.versao == 1
+
+def test_cursos_homonimos_sem_codigo_tem_totais_proprios():
+    nome = "Escola Politécnica - ( EP )"
+    diurno = criar_curso("Engenharia", nome, "", COMPUTACAO)
+    noturno = criar_curso("Engenharia", nome, "", CALCULO, COMPUTACAO)
+    consulta = ConsultaService([criar_unidade(nome, "", diurno, noturno)])
+
+    assert consulta.analisar_unidade("EP")['cursos'] == [
+        {'nome': "Engenharia", 'disciplinas': 1, 'carga_horaria': 60},
+        {'nome': "Engenharia", 'disciplinas': 2, 'carga_horaria': 150}
+    ]
+    assert consulta._agregado_curso(diurno).total_creditos == 4
+    assert consulta._agregado_curso(noturno).total_creditos == 10
+
+def test_unidades_homonimas_sem_codigo_tem_totais_proprios():
+    nome = "Escola Politécnica - ( EP )"
+    primeira = criar_unidade(nome, "", criar_curso("Civil", nome, "", CALCULO), criar_curso("Elétrica", nome, "", CALCULO))
+    segunda = criar_unidade(nome, "", criar_curso("Mecânica", nome, "", COMPUTACAO))
+    consulta = ConsultaService([primeira, segunda])
+
+    assert consulta._agregado_unidade(primeira).total_cursos == 2
+    assert consulta._agregado_unidade(segunda).total_cursos == 1
+    assert consulta.analisar_unidade("EP")['total_ch'] == 60
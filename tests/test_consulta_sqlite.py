@@ -0,0 +1,94 @@
+import pytest
+
+from src.models.curso import Curso
+from src.models.duracao_curso import DuracaoCurso
+from src.models.registro_disciplinas import REGISTRO_DISCIPLINAS
+from src.models.unidade import Unidade
+from src.parsers.jupiter_parser import JupiterParser
+from src.services.coleta_service import ColetaService
+from src.services.consulta_service import ConsultaService
+from src.services.consulta_sqlite import ConsultaSqliteService
+from src.services.indice_numerico import CAMPOS_NUMERICOS
+
+from .scraper_memoria import ScraperMemoria
+
+@pytest.fixture(scope="module")
+def unidades():
+    unidades = ColetaService(ScraperMemoria(), JupiterParser("html.parser")).coletar_dados(2)
+    # Curso homônimo em outra unidade: as buscas por nome devolvem o último
+    eesc = Unidade("Escola de Engenharia de São Carlos - ( EESC )", codigo="18")
+    eesc.adicionar_curso(Curso(
+        "Matemática", eesc.nome, DuracaoCurso(10, 10, 15),
+        [REGISTRO_DISCIPLINAS.obter("SMA0353", "Cálculo I", 4, 0, 60, 0, 0, 0)],
+        codigo="18020-1"
+    ))
+    unidades.append(eesc)
+    return unidades
+
+@pytest.fixture
+def servicos(unidades):
+    with ConsultaSqliteService(":memory:") as banco:
+        banco.carregar(unidades)
+        yield ConsultaService(unidades), banco
+
+def com_unidade(ocorrencias):
+    """A unidade das ocorrências do SQLite traz apenas nome e código."""
+    return [(disciplina, curso, unidade.nome, unidade.codigo) for disciplina, curso, unidade in ocorrencias]
+
+def test_listagens(servicos):
+    memoria, banco = servicos
+
+    assert banco.listar_unidades() == memoria.listar_unidades()
+    assert banco.listar_todos_cursos() == memoria.listar_todos_cursos()
+    assert banco.listar_codigos_disciplinas() == memoria.listar_codigos_disciplinas()
+
+@pytest.mark.parametrize("termo", ["IME", "fflch", "Escola de Engenharia de São Carlos - ( EESC )", "XYZ"])
+def test_unidades(servicos, termo):
+    memoria, banco = servicos
+
+    assert banco.buscar_unidade(termo) == memoria.buscar_unidade(termo)
+    assert banco.listar_cursos_por_unidade(termo) == memoria.listar_cursos_por_unidade(termo)
+    assert banco.analisar_unidade(termo) == memoria.analisar_unidade(termo)
+
+@pytest.mark.parametrize("nome", ["Ciência da Computação", "matemática", "Letras", "Estatística"])
+def test_cursos(servicos, nome):
+    memoria, banco = servicos
+
+    assert banco.buscar_curso(nome) == memoria.buscar_curso(nome)
+    assert banco.analisar_carga_curso(nome) == memoria.analisar_carga_curso(nome)
+    assert banco.comparar_cursos(nome, "Letras") == memoria.comparar_cursos(nome, "Letras")
+
+def test_disciplinas(servicos):
+    memoria, banco = servicos
+
+    for codigo in memoria.listar_codigos_disciplinas():
+        assert banco.buscar_disciplina(codigo.lower()) == memoria.buscar_disciplina(codigo.lower())
+    assert banco.listar_disciplinas_comuns() == memoria.listar_disciplinas_comuns()
+    for termo in ("calculo", "computacao", "filosofia", "MAC0", "calcluo"):
+        assert banco.buscar_por_texto(termo) == memoria.buscar_por_texto(termo)
+
+@pytest.mark.parametrize("campo", CAMPOS_NUMERICOS)
+def test_consultas_numericas(servicos, campo):
+    memoria, banco = servicos
+    valores = sorted({getattr(d, campo) for d, _, _ in memoria._indice_numerico.ocorrencias})
+
+    for minimo, maximo in [(None, None), (valores[0], None), (None, valores[-1]), (valores[0], valores[0]),
+                           (valores[-1], valores[-1]), (valores[0] + 1, valores[-1] - 1), (valores[-1] + 1, None)]:
+        assert com_unidade(banco.listar_disciplinas_por_faixa(campo, minimo, maximo)) == com_unidade(
+            memoria.listar_disciplinas_por_faixa(campo, minimo, maximo)
+        )
+    for quantidade in (0, 1, 3, 1000):
+        assert com_unidade(banco.listar_maiores_disciplinas(campo, quantidade)) == com_unidade(
+            memoria.listar_maiores_disciplinas(campo, quantidade)
+        )
+    assert com_unidade(banco.listar_disciplinas_por_creditos(4)) == com_unidade(
+        memoria.listar_disciplinas_por_creditos(4)
+    )
+
+def test_disciplinas_devolvidas_sao_as_canonicas(servicos):
+    memoria, banco = servicos
+
+    for (disciplina, _), (esperada, _) in zip(banco.buscar_disciplina("MAT2453"), memoria.buscar_disciplina("MAT2453")):
+        assert disciplina is esperada
+    curso = banco.buscar_curso("Ciência da Computação")
+    assert all(a is b for a, b in zip(curso.todas_disciplinas, memoria.buscar_curso("Ciência da Computação").todas_disciplinas))
@@ -0,0 +1,78 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+from pyarrow import feather, parquet
+
+from src.models.curso import Curso
+from src.models.duracao_curso import DuracaoCurso
+from src.parsers.jupiter_parser import JupiterParser
+from src.persistencia.exportacao_colunar import TIPO_POR_LISTA, ExportadorColunar
+from src.persistencia.serializacao import CAMPOS_DISCIPLINA, disciplina_de_lista
+from src.services.coleta_service import ColetaService
+
+from .scraper_memoria import ScraperMemoria
+
+LEITORES = {"parquet": parquet.read_table, "arrow": feather.read_table}
+
+@pytest.fixture(scope="module")
+def unidades():
+    return ColetaService(ScraperMemoria(), JupiterParser("html.parser")).coletar_dados(2)
+
+def reconstruir(tabelas):
+    """Monta de volta as unidades (código, nome, cursos) a partir das três tabelas lidas."""
+    disciplinas = {
+        linha["disciplina_id"]: disciplina_de_lista([linha[campo] for campo in CAMPOS_DISCIPLINA])
+        for linha in tabelas["disciplinas"].to_pylist()
+    }
+    lista_por_tipo = {tipo: lista for lista, tipo in TIPO_POR_LISTA.items()}
+    unidades, cursos = {}, {}
+    for linha in tabelas["cursos"].to_pylist():
+        curso = Curso(
+            nome=linha["nome"],
+            unidade=linha["unidade"],
+            duracao=DuracaoCurso(linha["duracao_ideal"], linha["duracao_minima"], linha["duracao_maxima"]),
+            codigo=linha["codigo_curso"]
+        )
+        cursos[linha["curso_id"]] = curso
+        unidades.setdefault((linha["codigo_unidade"], linha["unidade"]), []).append(curso)
+    for linha in tabelas["curso_disciplina"].to_pylist():
+        getattr(cursos[linha["curso_id"]], lista_por_tipo[linha["tipo"]]).append(disciplinas[linha["disciplina_id"]])
+    return [(codigo, nome, lista) for (codigo, nome), lista in unidades.items()]
+
+@pytest.mark.parametrize("formato", ["parquet", "arrow"])
+def test_tabelas_lidas_reconstroem_as_unidades(tmp_path, unidades, formato):
+    caminhos = ExportadorColunar(str(tmp_path), formato).exportar(unidades)
+
+    tabelas = {nome: LEITORES[formato](caminho) for nome, caminho in caminhos.items()}
+
+    assert reconstruir(tabelas) == [(u.codigo, u.nome, u.cursos) for u in unidades]
+
+@pytest.mark.parametrize("formato", ["parquet", "arrow"])
+def test_tipos_das_colunas_sobrevivem_a_gravacao(tmp_path, unidades, formato):
+    caminhos = ExportadorColunar(str(tmp_path), formato).exportar(unidades)
+    esquemas = {nome: LEITORES[formato](caminho).schema for nome, caminho in caminhos.items()}
+
+    texto = pa.dictionary(pa.int32(), pa.string())
+    numericos = [campo for campo in CAMPOS_DISCIPLINA if campo not in ("codigo", "nome")]
+    assert esquemas["disciplinas"] == pa.schema(
+        [("disciplina_id", pa.int32()), ("codigo", texto), ("nome", texto)]
+        + [(campo, pa.int32()) for campo in numericos]
+    )
+    assert esquemas["cursos"] == pa.schema(
+        [("curso_id", pa.int32())]
+        + [(campo, texto) for campo in ("codigo_curso", "nome", "codigo_unidade", "unidade")]
+        + [(campo, pa.int16()) for campo in ("duracao_ideal", "duracao_minima", "duracao_maxima")]
+    )
+    assert esquemas["curso_disciplina"] == pa.schema(
+        [("curso_id", pa.int32()), ("disciplina_id", pa.int32()), ("tipo", texto)]
+    )
+
+def test_disciplina_compartilhada_ocupa_uma_linha(unidades):
+    tabelas = ExportadorColunar("nao-usado").montar_tabelas(unidades)
+
+    distintas = {id(d) for u in unidades for c in u.cursos for d in c.todas_disciplinas}
+    assert tabelas["disciplinas"].num_rows == len(distintas)
+    assert tabelas["curso_disciplina"].num_rows == sum(
+        len(c.todas_disciplinas) for u in unidades for c in u.cursos
+    )
+    assert set(tabelas["curso_disciplina"].column("tipo").chunk(0).dictionary.to_pylist()) <= set(TIPO_POR_LISTA.values())
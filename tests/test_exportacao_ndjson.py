@@ -0,0 +1,40 @@
+import io
+import json
+
+from src.parsers.jupiter_parser import JupiterParser
+from src.persistencia.exportacao_ndjson import ExportadorNdjson
+from src.persistencia.serializacao import curso_de_dict
+from src.services.coleta_service import ColetaService
+
+from .scraper_memoria import ScraperMemoria
+
+def ler_registros(linhas):
+    registros = [json.loads(linha) for linha in linhas]
+    return [
+        (registro.pop("codigo_unidade"), registro.pop("nome_unidade"), curso_de_dict(registro))
+        for registro in registros
+    ]
+
+def test_registros_reconstroem_os_cursos_coletados(tmp_path):
+    caminho = tmp_path / "cursos.ndjson"
+    with ExportadorNdjson(str(caminho)) as exportador:
+        unidades = ColetaService(ScraperMemoria(), JupiterParser("html.parser"), exportador=exportador).coletar_dados(2)
+
+    assert exportador.registros == 3
+    assert ler_registros(caminho.read_text(encoding="utf-8").splitlines()) == [
+        (unidade.codigo, unidade.nome, curso) for unidade in unidades for curso in unidade.cursos
+    ]
+
+def test_saida_padrao_recebe_um_registro_por_linha():
+    saida = io.StringIO()
+    unidades = ColetaService(ScraperMemoria(), JupiterParser("html.parser")).coletar_dados(1)
+    curso = unidades[0].cursos[0]
+
+    with ExportadorNdjson(ExportadorNdjson.SAIDA_PADRAO, saida) as exportador:
+        exportador.exportar("45", unidades[0].nome, curso)
+        # O registro já está disponível antes do fechamento
+        assert saida.getvalue().endswith("\n")
+        exportador.exportar("45", unidades[0].nome, curso)
+
+    assert not saida.closed
+    assert ler_registros(saida.getvalue().splitlines()) == [("45", unidades[0].nome, curso)] * 2
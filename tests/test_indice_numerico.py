@@ -0,0 +1,64 @@
+import pytest
+
+from scripts.dados_sinteticos import gerar_unidades
+from src.models.registro_disciplinas import RegistroDisciplinas
+from src.services.consulta_service import ConsultaService
+from src.services.indice_numerico import CAMPOS_NUMERICOS
+
+@pytest.fixture(scope="module")
+def consulta():
+    # Catálogo pequeno e valores de poucos níveis: muitos empates em todos os campos
+    return ConsultaService(gerar_unidades(2_000, 4, 5, 300, RegistroDisciplinas()))
+
+def varrer(unidades, campo, minimo=None, maximo=None):
+    """Varredura linear usada antes do índice."""
+    return [
+        (disciplina, curso, unidade)
+        for unidade in unidades
+        for curso in unidade.cursos
+        for disciplina in curso.todas_disciplinas
+        if (minimo is None or getattr(disciplina, campo) >= minimo)
+        and (maximo is None or getattr(disciplina, campo) <= maximo)
+    ]
+
+def identidades(ocorrencias):
+    return [tuple(map(id, ocorrencia)) for ocorrencia in ocorrencias]
+
+def limites(valores):
+    """Limites iguais a valores existentes (inclusivos) e entre eles ou fora deles (sem correspondência exata)."""
+    menor, maior = valores[0], valores[-1]
+    meio = valores[len(valores) // 2]
+    candidatos = {menor, maior, meio, menor - 1, maior + 1, meio - 1, meio + 1}
+    return sorted(candidatos) + [None]
+
+@pytest.mark.parametrize("campo", CAMPOS_NUMERICOS)
+def test_faixa_igual_a_varredura(consulta, campo):
+    valores = sorted({getattr(d, campo) for d, _, _ in consulta._indice_numerico.ocorrencias})
+
+    for minimo in limites(valores):
+        for maximo in limites(valores):
+            assert identidades(consulta.listar_disciplinas_por_faixa(campo, minimo, maximo)) == identidades(
+                varrer(consulta.unidades, campo, minimo, maximo)
+            ), (minimo, maximo)
+
+@pytest.mark.parametrize("campo", CAMPOS_NUMERICOS)
+def test_maiores_igual_a_ordenacao_estavel(consulta, campo):
+    # sorted é estável: no empate, mantém a ordem de coleta
+    esperado = sorted(varrer(consulta.unidades, campo), key=lambda ocorrencia: -getattr(ocorrencia[0], campo))
+
+    for quantidade in (-1, 0, 1, 2, 7, 50, len(esperado), len(esperado) + 10):
+        assert identidades(consulta.listar_maiores_disciplinas(campo, quantidade)) == identidades(
+            esperado[:max(quantidade, 0)]
+        ), quantidade
+
+def test_creditos_minimos_igual_a_varredura(consulta):
+    for minimo in range(-1, 12):
+        assert identidades(consulta.listar_disciplinas_por_creditos(minimo)) == identidades(
+            varrer(consulta.unidades, "creditos_totais", minimo)
+        )
+
+def test_campo_desconhecido(consulta):
+    with pytest.raises(ValueError):
+        consulta.listar_disciplinas_por_faixa("nome", 1)
+    with pytest.raises(ValueError):
+        consulta.listar_maiores_disciplinas("codigo", 1)
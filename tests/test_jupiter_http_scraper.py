@@ -0,0 +1,90 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from src.models.registro_disciplinas import RegistroDisciplinas
+from src.parsers.jupiter_parser import JupiterParser
+from src.scrapers.jupiter_http_scraper import JupiterHttpScraper
+from src.services.coleta_service import ColetaService
+
+RESPOSTAS = Path(__file__).parent / "fixtures" / "jupiter_http"
+
+class JupiterLocal(BaseHTTPRequestHandler):
+    """Serve as respostas gravadas em fixtures/jupiter_http no lugar do JupiterWeb."""
+
+    respostas = RESPOSTAS
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        endpoint = url.path.rsplit("/", 1)[-1]
+        params = {chave: valores[0] for chave, valores in parse_qs(url.query).items()}
+        if endpoint == "listarGradeCurricular":
+            nome = f"{endpoint}_{params.get('codcg')}_{params.get('codcur')}_{params.get('codhab')}"
+        elif endpoint == "carregarCursos":
+            nome = f"{endpoint}_{params.get('codcg')}"
+        else:
+            nome = endpoint
+        caminho = self.respostas / f"{nome}.html"
+        if not caminho.exists():
+            self.send_error(404)
+            return
+        corpo = caminho.read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, formato, *args):
+        pass
+
+@pytest.fixture
+def servidor():
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), JupiterLocal)
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{servidor.server_address[1]}/jupiterweb/"
+    servidor.shutdown()
+    servidor.server_close()
+
+def test_coleta_completa(servidor):
+    with JupiterHttpScraper(base_url=servidor) as scraper:
+        coleta = ColetaService(scraper, JupiterParser("html.parser", RegistroDisciplinas()))
+        unidades = coleta.coletar_dados(2)
+
+    assert [(unidade.codigo, unidade.nome) for unidade in unidades] == [
+        ("45", "Instituto de Matemática e Estatística - ( IME )"),
+        ("8", "Faculdade de Filosofia, Letras e Ciências Humanas - ( FFLCH )"),
+    ]
+    computacao, = unidades[0].cursos
+    assert computacao.codigo == "45052-1"
+    assert (computacao.duracao.ideal, computacao.duracao.minima, computacao.duracao.maxima) == (8, 8, 12)
+    assert [d.codigo for d in computacao.obrigatorias][:2] == ["MAC0110", "MAT2453"]
+    assert len(computacao.optativas_livres) == 2
+    assert len(computacao.optativas_eletivas) == 3
+    letras, = unidades[1].cursos
+    assert [d.codigo for d in letras.obrigatorias] == ["FLC0112", "FLL1024", "FLT0123"]
+    assert coleta.paginas_por_tipo["grade"] == 2
+    assert coleta.paginas_por_tipo["erro"] == 1
+    assert coleta.cursos_visitados == 3
+
+def test_grade_inexistente_devolve_none(servidor):
+    with JupiterHttpScraper(base_url=servidor) as scraper:
+        scraper.selecionar_unidade("45")
+        assert scraper.acessar_grade_curso("45070-1") is None
+
+def test_resposta_sem_combo_gera_erro(servidor, tmp_path, monkeypatch):
+    (tmp_path / "jupCarreira.jsp.html").write_text("<html><body>Manutenção</body></html>", encoding="utf-8")
+    (tmp_path / "carregarCursos_45.html").write_text("<p>Sessão expirada</p>", encoding="utf-8")
+    monkeypatch.setattr(JupiterLocal, "respostas", tmp_path)
+
+    with JupiterHttpScraper(base_url=servidor) as scraper:
+        with pytest.raises(requests.RequestException, match="comboUnidade"):
+            scraper.obter_unidades()
+        scraper.selecionar_unidade("45")
+        with pytest.raises(requests.RequestException):
+            scraper.obter_cursos()
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+
+from src.models.curso import Curso
+from src.models.disciplina import Disciplina
+from src.models.duracao_curso import DuracaoCurso
+from src.models.registro_disciplinas import RegistroDisciplinas
+from src.parsers.jupiter_parser import JupiterParser
+
+PAGINAS = Path(__file__).parent / "fixtures" / "paginas"
+FIXTURES = sorted(caminho.name for caminho in PAGINAS.glob("*.html"))
+BACKENDS = JupiterParser.backends_disponiveis()
+
+def ler_pagina(nome: str) -> str:
+    return (PAGINAS / nome).read_text(encoding="utf-8")
+
+def montar_curso(parser: JupiterParser, html: str) -> Curso:
+    duracao, obrigatorias, optativas_livres, optativas_eletivas = parser.extrair_grade(html)
+    return Curso("Curso", "Unidade", duracao, obrigatorias, optativas_livres, optativas_eletivas, codigo="1")
+
+@pytest.mark.parametrize("nome", FIXTURES)
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_produzem_o_mesmo_curso(nome, backend):
+    html = ler_pagina(nome)
+    referencia = montar_curso(JupiterParser("html.parser", RegistroDisciplinas()), html)
+
+    assert montar_curso(JupiterParser(backend, RegistroDisciplinas()), html) == referencia
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_grade_completa(backend):
+    curso = montar_curso(JupiterParser(backend, RegistroDisciplinas()), ler_pagina("grade_completa.html"))
+
+    assert curso.duracao == DuracaoCurso(ideal=8, minima=8, maxima=12)
+    assert [d.codigo for d in curso.obrigatorias] == [
+        "MAC0110", "MAT2453", "MAC0105", "MAC0121", "MAT2454", "MAE0121", "MAC0499"
+    ]
+    assert [d.codigo for d in curso.optativas_livres] == ["FLF0100", "EDM0402"]
+    assert [d.codigo for d in curso.optativas_eletivas] == ["MAC0350", "MAC0425", "MAT2453"]
+    assert curso.obrigatorias[0] == Disciplina("MAC0110", "Introdução à Computação", 4, 0, 60, 0, 0, 0)
+    assert curso.obrigatorias[-1] == Disciplina("MAC0499", "Trabalho de Formatura Supervisionado", 4, 8, 300, 0, 0, 30)
+    assert curso.optativas_livres[0].nome == "Introdução à Filosofia"
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_compartilham_disciplinas_do_registro(backend):
+    registro = RegistroDisciplinas()
+    html = ler_pagina("grade_completa.html")
+    referencia = montar_curso(JupiterParser("html.parser", registro), html)
+    curso = montar_curso(JupiterParser(backend, registro), html)
+
+    assert all(a is b for a, b in zip(curso.todas_disciplinas, referencia.todas_disciplinas))
+    assert curso.obrigatorias[1] is curso.optativas_eletivas[-1]
+
+@pytest.mark.parametrize("nome", FIXTURES)
+def test_recorte_preserva_a_grade(nome):
+    html = ler_pagina(nome)
+    parser = JupiterParser("html.parser", RegistroDisciplinas())
+
+    assert parser.extrair_grade(JupiterParser.recortar_grade(html)) == parser.extrair_grade(html)
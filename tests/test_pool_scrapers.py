@@ -0,0 +1,90 @@
+import pytest
+
+from src.interfaces.scraper import WebScraper
+from src.scrapers.pool_scrapers import PoolScrapers
+
+class ScraperFalso(WebScraper):
+    """Scraper mínimo para exercitar o pool, sem navegador."""
+
+    def __init__(self):
+        self.ativo = True
+        self.fechado = False
+
+    def acessar_pagina_inicial(self): pass
+    def obter_unidades(self): return []
+    def selecionar_unidade(self, codigo): pass
+    def obter_cursos(self): return []
+    def acessar_grade_curso(self, codigo_curso): return None
+    def listar_unidades_urls(self): return []
+    def obter_html(self, codigo_unidade): return ""
+    def esta_ativo(self): return self.ativo
+    def fechar(self): self.fechado = True
+
+class FabricaInstavel:
+    """Fábrica que falha nas chamadas indicadas (contadas a partir de 1)."""
+
+    def __init__(self, falhas=()):
+        self.falhas = set(falhas)
+        self.chamadas = 0
+        self.criados = []
+
+    def __call__(self):
+        self.chamadas += 1
+        if self.chamadas in self.falhas:
+            raise RuntimeError("navegador não iniciou")
+        scraper = ScraperFalso()
+        self.criados.append(scraper)
+        return scraper
+
+@pytest.fixture(autouse=True)
+def espera_curta(monkeypatch):
+    monkeypatch.setattr(PoolScrapers, "ESPERA_REPOSICAO", 0.01)
+
+def test_vaga_de_criacao_que_falhou_e_reposta_no_proximo_emprestimo():
+    fabrica = FabricaInstavel(falhas={2})
+    pool = PoolScrapers(fabrica, tamanho=2)
+    pool.aquecer()
+    assert len(pool._todos) == 1
+
+    with pool.emprestar():
+        pass
+
+    assert len(pool._todos) == 2
+    assert fabrica.chamadas == 3
+
+def test_reciclagem_que_falha_nao_encolhe_o_pool():
+    fabrica = FabricaInstavel(falhas={3})
+    pool = PoolScrapers(fabrica, tamanho=2)
+    pool.aquecer()
+    morto = pool.adquirir()
+    morto.ativo = False
+    pool.devolver(morto)
+
+    emprestados = [pool.adquirir(), pool.adquirir()]
+
+    assert morto.fechado
+    assert morto not in emprestados
+    assert len(pool._todos) == 2
+    assert pool.recriados == 1
+
+def test_pool_sem_nenhum_scraper_gera_erro():
+    pool = PoolScrapers(FabricaInstavel(falhas={1, 2}), tamanho=1)
+
+    with pytest.raises(RuntimeError):
+        pool.adquirir()
+
+def test_scraper_inicial_ocupa_uma_vaga_e_nao_e_fechado():
+    fabrica = FabricaInstavel()
+    principal = ScraperFalso()
+    pool = PoolScrapers(fabrica, tamanho=2, scraper_inicial=principal)
+    pool.aquecer()
+    assert fabrica.chamadas == 1
+
+    principal.ativo = False
+    emprestados = [pool.adquirir(), pool.adquirir()]
+    pool.fechar()
+
+    assert principal not in emprestados
+    assert not principal.fechado
+    assert all(scraper.fechado for scraper in fabrica.criados)
+    assert pool.recriados == 1
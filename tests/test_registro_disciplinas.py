@@ -0,0 +1,28 @@
+import gc
+import pickle
+
+from src.models.registro_disciplinas import REGISTRO_DISCIPLINAS, RegistroDisciplinas
+
+VALORES = ("MAC0110", "Introdução à Computação", 4, 0, 60, 0, 0, 0)
+
+def test_mesmos_valores_devolvem_a_mesma_instancia():
+    registro = RegistroDisciplinas()
+    disciplina = registro.obter(*VALORES)
+
+    assert registro.obter(*VALORES) is disciplina
+    assert registro.obter("MAC0110", "Introdução à Computação", 4, 0, 90, 0, 0, 0) is not disciplina
+
+def test_disciplina_sem_referencias_sai_do_registro():
+    registro = RegistroDisciplinas()
+    disciplina = registro.obter(*VALORES)
+    assert len(registro) == 1
+
+    del disciplina
+    gc.collect()
+
+    assert len(registro) == 0
+
+def test_pickle_devolve_a_instancia_canonica_do_registro_global():
+    disciplina = REGISTRO_DISCIPLINAS.obter(*VALORES)
+
+    assert pickle.loads(pickle.dumps(disciplina)) is disciplina
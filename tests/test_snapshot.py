@@ -0,0 +1,54 @@
+import gzip
+import json
+
+import pytest
+
+from scripts.dados_sinteticos import gerar_unidades
+from src.models.registro_disciplinas import RegistroDisciplinas
+from src.persistencia.serializacao import disciplina_para_lista
+from src.persistencia.snapshot import SnapshotStore
+
+@pytest.fixture(scope="module")
+def unidades():
+    return gerar_unidades(2_000, 4, 5, 300, RegistroDisciplinas())
+
+def ler_conteudo(store):
+    with gzip.open(store.caminho, "rt", encoding="utf-8") as arquivo:
+        return json.load(arquivo)
+
+def test_snapshot_volta_igual(tmp_path, unidades):
+    store = SnapshotStore(str(tmp_path / "dados" / "snapshot.json.gz"))
+    hashes = {(u.codigo, c.codigo): f"hash-{u.codigo}-{c.codigo}" for u in unidades for c in u.cursos}
+
+    store.salvar(unidades, hashes)
+
+    assert store.existe()
+    assert store.carregar() == unidades
+    assert store.carregar_hashes() == hashes
+
+def test_disciplina_repetida_e_gravada_uma_vez_e_carregada_como_o_mesmo_objeto(tmp_path, unidades):
+    store = SnapshotStore(str(tmp_path / "snapshot.json.gz"))
+    store.salvar(unidades)
+
+    distintas = {tuple(disciplina_para_lista(d)) for u in unidades for c in u.cursos for d in c.todas_disciplinas}
+    tabela = ler_conteudo(store)["disciplinas"]
+    assert len(tabela) == len(distintas)
+    assert sorted(map(tuple, tabela)) == sorted(distintas)
+
+    carregadas = {}
+    for unidade in store.carregar():
+        for curso in unidade.cursos:
+            for disciplina in curso.todas_disciplinas:
+                assert carregadas.setdefault(disciplina.codigo, disciplina) is disciplina
+    assert len(carregadas) == len(distintas)
+
+def test_snapshot_de_outra_versao_e_recusado(tmp_path, unidades):
+    store = SnapshotStore(str(tmp_path / "snapshot.json.gz"))
+    store.salvar(unidades[:1])
+    conteudo = ler_conteudo(store)
+    conteudo["versao"] = SnapshotStore.VERSAO + 1
+    with gzip.open(store.caminho, "wt", encoding="utf-8") as arquivo:
+        json.dump(conteudo, arquivo)
+
+    with pytest.raises(ValueError):
+        store.carregar()
@@ -0,0 +1,69 @@
+import pytest
+
+from src.models.curso import Curso
+from src.models.disciplina import Disciplina
+from src.models.duracao_curso import DuracaoCurso
+from src.models.unidade import Unidade
+from src.services.consulta_service import ConsultaService
+
+pytest.importorskip("numpy")
+
+CALCULO = Disciplina("MAT2453", "Cálculo Diferencial e Integral I", 6, 0, 90, 0, 0, 0)
+COMPUTACAO = Disciplina("MAC0110", "Introdução à Computação", 4, 0, 60, 0, 0, 0)
+FISICA = Disciplina("4302111", "Física I", 4, 0, 60, 0, 0, 0)
+ESTAGIO = Disciplina("PCC3900", "Estágio Supervisionado", 0, 4, 120, 120, 0, 0)
+
+def criar_curso(nome: str, unidade: str, obrigatorias, livres=(), eletivas=()) -> Curso:
+    return Curso(nome, unidade, DuracaoCurso(10, 10, 15), list(obrigatorias), list(livres), list(eletivas))
+
+@pytest.fixture
+def unidades():
+    ep = Unidade("Escola Politécnica - ( EP )")
+    ep.adicionar_curso(criar_curso("Engenharia", ep.nome, [COMPUTACAO], eletivas=[ESTAGIO]))
+    ep.adicionar_curso(criar_curso("Engenharia", ep.nome, [CALCULO, FISICA], livres=[COMPUTACAO]))
+    ime = Unidade("Instituto de Matemática e Estatística - ( IME )")
+    ime.adicionar_curso(criar_curso("Matemática", ime.nome, [CALCULO]))
+    return [ep, ime]
+
+def test_visao_concorda_com_o_servico_de_consulta(unidades):
+    consulta = ConsultaService(unidades)
+    visao = consulta.visao_colunar()
+
+    for unidade in unidades:
+        agregado = consulta._agregado_unidade(unidade)
+        assert visao.analisar_unidade(unidade) == {
+            'nome': unidade.nome,
+            'total_cursos': agregado.total_cursos,
+            'cursos': [
+                {'nome': nome, 'disciplinas': disciplinas, 'carga_horaria': carga_horaria}
+                for nome, disciplinas, carga_horaria in agregado.cursos
+            ],
+            'total_disciplinas': agregado.total_disciplinas,
+            'total_ch': agregado.total_ch
+        }
+        for curso in unidade.cursos:
+            agregado_curso = consulta._agregado_curso(curso)
+            resultado = visao.analisar_carga_curso(curso)
+            assert resultado['total_creditos'] == agregado_curso.total_creditos
+            assert resultado['total_ch'] == agregado_curso.total_ch
+            assert resultado['qtd_obrigatorias'] == agregado_curso.qtd_obrigatorias
+            assert resultado['qtd_optativas_livres'] == agregado_curso.qtd_optativas_livres
+            assert resultado['qtd_optativas_eletivas'] == agregado_curso.qtd_optativas_eletivas
+
+    assert consulta.analisar_unidade("EP") == visao.analisar_unidade(unidades[0])
+    assert consulta.analisar_carga_curso("Matemática") == visao.analisar_carga_curso(unidades[1].cursos[0])
+    for minimo in (0, 4, 5, 6, 7):
+        assert sorted(map(id, (d for d, _, _ in visao.listar_disciplinas_por_creditos(minimo)))) == sorted(
+            map(id, (d for d, _, _ in consulta.listar_disciplinas_por_creditos(minimo)))
+        )
+
+def test_cursos_homonimos_tem_posicoes_proprias(unidades):
+    visao = ConsultaService(unidades).visao_colunar()
+    diurno, noturno = unidades[0].cursos
+
+    assert visao.analisar_carga_curso(diurno)['total_ch'] == 180
+    assert visao.analisar_carga_curso(noturno)['total_ch'] == 210
+    assert visao.analisar_unidade(unidades[0])['cursos'] == [
+        {'nome': "Engenharia", 'disciplinas': 2, 'carga_horaria': 180},
+        {'nome': "Engenharia", 'disciplinas': 3, 'carga_horaria': 210}
+    ]